@@ -5,6 +5,8 @@
   Purpose:
 '''
 
+import asyncio
+
 from topsailai.logger.log_chat import logger
 from topsailai.utils.print_tool import (
     print_critical,
@@ -87,8 +89,23 @@ class AgentBase(AgentTool):
            LLMModel,
         )
         self.llm_model = LLMModel()
+
+        # (tool names, tools for chat), see get_chat_tools()
+        self._tools_for_chat_cache = None
         return
 
+    def get_chat_tools(self) -> dict:
+        """
+        Get the tools info for the chat API, rebuilt only when the available tools change.
+
+        Returns:
+            dict: key is tool name, value is tool info
+        """
+        cache_key = tuple(self.available_tools.keys())
+        if self._tools_for_chat_cache is None or self._tools_for_chat_cache[0] != cache_key:
+            self._tools_for_chat_cache = (cache_key, get_tools_for_chat(self.available_tools))
+        return self._tools_for_chat_cache[1]
+
     @property
     def max_tokens(self) -> int:
         """
@@ -123,6 +140,23 @@ class AgentBase(AgentTool):
                     self.dump_messages()
                 unset_agent2llm_message_source()
 
+    async def arun(self, step_call:StepCallBase, user_input:str):
+        """
+        Run the agent without blocking the event loop.
+
+        The agent runs in a worker thread via asyncio.to_thread, so its
+        thread-local context (agent name, agent) stays private to this run,
+        and sibling agents can be awaited together with asyncio.gather.
+
+        Args:
+            step_call (StepCallBase): Step call instance to use
+            user_input (str): User input to process
+
+        Returns:
+            The result of the agent execution
+        """
+        return await asyncio.to_thread(self.run, step_call, user_input)
+
     def _run(self, step_call:StepCallBase, user_input:str):
         """
         Internal run method to be implemented by subclasses.
@@ -165,9 +199,13 @@ class AgentRun(AgentBase):
         # Tools formatted for chat API
         tools_for_chat = {}
         if env_tool.is_use_tool_calls():
-            tools_for_chat = get_tools_for_chat(all_tools)
+            tools_for_chat = self.get_chat_tools()
         if tools_for_chat:
             print_info(f"[effective_tools] [{len(tools_for_chat)}] {list(tools_for_chat.keys())}")
+        chat_tools = list(tools_for_chat.values())
+
+        # constant within this run, no need to read env on every step
+        for_stream = env_tool.EnvReaderInstance.check_bool("LLM_RESPONSE_STREAM")
 
         # new session
         user_message = {"step_name":STEP_NAME_TASK,"raw_text":user_input} if user_input else None
@@ -179,8 +217,8 @@ class AgentRun(AgentBase):
 
             rsp_obj, response = self.llm_model.chat(
                 self.messages, for_response=True,
-                for_stream=env_tool.EnvReaderInstance.check_bool("LLM_RESPONSE_STREAM"),
-                tools=list(tools_for_chat.values()),
+                for_stream=for_stream,
+                tools=chat_tools,
             )
             if not response:
                 print_critical("No response from LLM.")
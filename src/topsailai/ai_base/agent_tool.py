@@ -47,14 +47,17 @@ class AgentTool(PromptBase):
             tool_kits = list(INTERNAL_TOOLS.keys())
 
         if tool_kits and excluded_tool_kits:
-            for tool_name in excluded_tool_kits:
-                if tool_name in tool_kits:
-                    tool_kits.remove(tool_name)
-                    continue
-                for _tool in tool_kits[:]:
-                    if _tool.startswith(tool_name):
-                        if _tool in tool_kits:
-                            tool_kits.remove(_tool)
+            # one pass, an excluded name drops the same tool kit,
+            # and it is a prefix only if it is not a tool kit itself
+            tool_kits = list(dict.fromkeys(tool_kits))
+            excluded_names = set(excluded_tool_kits).intersection(tool_kits)
+            excluded_prefixes = tuple(
+                _tool for _tool in excluded_tool_kits if _tool not in excluded_names
+            )
+            tool_kits = [
+                _tool for _tool in tool_kits
+                if _tool not in excluded_names and not _tool.startswith(excluded_prefixes)
+            ]
 
         if tool_kits:
             tool_kits = prompt_tool.get_tools_by_env(tool_kits)
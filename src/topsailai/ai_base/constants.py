@@ -22,6 +22,9 @@ LLM_KEYWORD_SERVICE = "LLM Service"
 # default seconds
 DEFAULT_LLM_SLOW_CHAT_THRESHOLD = 60
 
+# default max count of the concurrent chats in LLMModel.abatch_chat
+DEFAULT_LLM_CONCURRENCY = 4
+
 # context messages
 NON_SYSTEM_PROMPT_MESSAGE_INDEX = 3
 
@@ -7,6 +7,8 @@
 
 import os
 import time
+import random
+import asyncio
 import threading
 import httpx
 import httpcore
@@ -41,6 +43,7 @@ from .constants import (
     ROLE_ASSISTANT,
     LLM_KEYWORD_SERVICE,
     DEFAULT_LLM_SLOW_CHAT_THRESHOLD,
+    DEFAULT_LLM_CONCURRENCY,
 )
 from .llm_control.exception import (
     JsonError,
@@ -53,11 +56,68 @@ from .llm_control.message import (
 from .llm_control.base_class import (
     LLMModelBase,
 )
+from .llm_batch import BatchClient
 
 # Module-level singleton visualizer used by all LLMModel instances.
 _state_visualizer = StateVisualizer()
 _state_visualizer.start()
 
+# the range of the seconds to wait before retrying a chat
+MIN_RETRY_SECONDS = 3
+MAX_RETRY_SECONDS = 120
+
+# key is (api_key, api_base), value is client.chat.completions,
+# the connection pool of a client is shared by all of the LLMModel instances
+g_llm_clients = {}
+g_llm_clients_lock = threading.Lock()
+
+
+def reset_llm_clients():
+    """ drop the shared clients, the next get_llm_model creates new connections """
+    with g_llm_clients_lock:
+        g_llm_clients.clear()
+    return
+
+
+def get_retry_seconds(times:int, retry_after:float=None) -> float:
+    """
+    Get the seconds to wait before the next retry, exponential backoff with jitter.
+
+    Args:
+        times (int): the retry times, starting from 1.
+        retry_after (float): seconds from the Retry-After header, it is used if present.
+
+    Returns:
+        float: seconds, in [3, 120]
+    """
+    if retry_after:
+        return min(MAX_RETRY_SECONDS, max(MIN_RETRY_SECONDS, retry_after))
+    upper = min(MAX_RETRY_SECONDS, MIN_RETRY_SECONDS * 2 ** min(times, 6))
+    return random.uniform(MIN_RETRY_SECONDS, upper)
+
+
+def get_retry_after(e) -> float|None:
+    """ get the seconds of the Retry-After header from an API error """
+    try:
+        return float(e.response.headers.get("retry-after"))
+    except Exception:
+        return None
+
+
+def _new_http_client():
+    """
+    Return a HTTP/2 client if TOPSAILAI_LLM_HTTP2 is enabled and the h2 package is installed,
+    otherwise None for the default client of openai.
+    """
+    if not env_tool.EnvReaderInstance.check_bool("TOPSAILAI_LLM_HTTP2"):
+        return None
+    try:
+        import h2 # noqa: F401
+    except ImportError:
+        logger.warning("TOPSAILAI_LLM_HTTP2 is ignored, missing package h2")
+        return None
+    return openai.DefaultHttpxClient(http2=True)
+
 
 class LLMModel(LLMModelBase):
     """ openai methods """
@@ -67,7 +127,7 @@ class LLMModel(LLMModelBase):
 
     def get_llm_model(self, api_key=None, api_base=None):
         """
-        Create an OpenAI-compatible chat model object.
+        Get an OpenAI-compatible chat model object, the client is shared by (api_key, api_base).
 
         Args:
             api_key (str, optional): API key for authentication. Defaults to environment variable.
@@ -76,11 +136,30 @@ class LLMModel(LLMModelBase):
         Returns:
             object: OpenAI chat completions object
         """
-        logger.info("getting llm model [%s] [%s]: ...", self.model_name, api_key[:5] if api_key else None)
-        return openai.OpenAI(
-            api_key=api_key or os.getenv("OPENAI_API_KEY", ""),
-            base_url=api_base or os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1"),
-        ).chat.completions
+        api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        api_base = api_base or os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+        key = (api_key, api_base)
+
+        with g_llm_clients_lock:
+            chat_completions = g_llm_clients.get(key)
+            if chat_completions is None:
+                logger.info("getting llm model [%s] [%s]: ...", self.model_name, api_key[:5] if api_key else None)
+                http_client = _new_http_client()
+                kwargs = dict(http_client=http_client) if http_client is not None else {}
+                chat_completions = openai.OpenAI(
+                    api_key=api_key,
+                    base_url=api_base,
+                    **kwargs
+                ).chat.completions
+                g_llm_clients[key] = chat_completions
+        return chat_completions
+
+    def rebuild_llm_models(self):
+        """
+        Rebuild the model configurations with new clients, e.g. after many server errors.
+        """
+        reset_llm_clients()
+        return super().rebuild_llm_models()
 
     def get_response_message(self, response) -> ChatCompletionMessage:
         """
@@ -278,6 +357,7 @@ class LLMModel(LLMModelBase):
         self.check_response_content(rsp_obj=response, rsp_content=full_content)
 
         self.send_content(full_content)
+        self.flush_content()
 
         return (response, full_content)
 
@@ -398,8 +478,10 @@ class LLMModel(LLMModelBase):
             raise_on_timeout=raise_on_first_byte_timeout,
         )
 
-        full_content = ""
+        # the deltas are joined once after the stream, not concatenated per chunk
+        content_parts = []
         full_tool_calls_dict = {}
+        tool_args_parts = {} # key is index of tool_call, value is list of arguments deltas
 
         usage = CompletionUsage(
             completion_tokens=0, prompt_tokens=0, total_tokens=0,
@@ -408,81 +490,82 @@ class LLMModel(LLMModelBase):
 
         first_byte_ms = None
 
-        for chunk in self.iter_stream_with_first_byte_timeout(
-            response,
-            first_byte_timeout,
-            raise_on_timeout=raise_on_first_byte_timeout,
-            create_timed_out=create_timed_out,
-        ):
-            delta_obj = None
-            if len(chunk.choices):
-                delta_obj = chunk.choices[0].delta
-            try:
-                delta_usage = self.get_response_usage(chunk)
-                if delta_usage:
-                    usage.prompt_tokens_details.cached_tokens += delta_usage.prompt_tokens_details.cached_tokens
-            except Exception:
-                pass
-            if delta_obj is None:
-                continue
+        try:
+            for chunk in self.iter_stream_with_first_byte_timeout(
+                response,
+                first_byte_timeout,
+                raise_on_timeout=raise_on_first_byte_timeout,
+                create_timed_out=create_timed_out,
+            ):
+                delta_obj = None
+                if len(chunk.choices):
+                    delta_obj = chunk.choices[0].delta
+                try:
+                    delta_usage = self.get_response_usage(chunk)
+                    if delta_usage:
+                        usage.prompt_tokens_details.cached_tokens += delta_usage.prompt_tokens_details.cached_tokens
+                except Exception:
+                    pass
+                if delta_obj is None:
+                    continue
 
-            # Record first-byte timing on the first chunk that carries content
-            # or tool-call data. This measures the time from stream start to the
-            # first useful response byte.
-            if first_byte_ms is None:
-                first_byte_ms = (time.monotonic() - stream_start_time) * 1000
-
-            # content
-            delta_content = delta_obj.content
-            if delta_content:
-                full_content += delta_content
-                self.send_content(delta_content)
-
-            # tool_calls
-            for tool_call in delta_obj.tool_calls or []:
-                # place object
-                _index = tool_call.index
-                if _index not in full_tool_calls_dict:
-                    full_tool_calls_dict[_index] = {
-                        "id": "",
-                        "function": {
-                            "name": "",
-                            "arguments": "",
-                        },
-                    }
-                curr_tool_call = full_tool_calls_dict[_index]
-
-                # pass value
-                if tool_call.id:
-                    curr_tool_call["id"] = tool_call.id
-                if tool_call.function:
-                    if "function" not in curr_tool_call:
-                        curr_tool_call["function"] = {
-                            "name": "",
-                            "arguments": "",
+                # Record first-byte timing on the first chunk that carries content
+                # or tool-call data. This measures the time from stream start to the
+                # first useful response byte.
+                if first_byte_ms is None:
+                    first_byte_ms = (time.monotonic() - stream_start_time) * 1000
+
+                # content
+                delta_content = delta_obj.content
+                if delta_content:
+                    content_parts.append(delta_content)
+                    self.send_content(delta_content)
+
+                # tool_calls
+                for tool_call in delta_obj.tool_calls or []:
+                    # place object, once for each tool_call
+                    _index = tool_call.index
+                    curr_tool_call = full_tool_calls_dict.get(_index)
+                    if curr_tool_call is None:
+                        curr_tool_call = full_tool_calls_dict[_index] = {
+                            "id": "",
+                            "function": {
+                                "name": "",
+                                "arguments": "",
+                            },
                         }
-                    if tool_call.function.name:
-                        curr_tool_call["function"]["name"] = tool_call.function.name
-                    if tool_call.function.arguments:
-                        curr_tool_call["function"]["arguments"] += tool_call.function.arguments
-        # enf for chunk
+                        tool_args_parts[_index] = []
+
+                    # pass value
+                    if tool_call.id:
+                        curr_tool_call["id"] = tool_call.id
+                    function = tool_call.function
+                    if function:
+                        if function.name:
+                            curr_tool_call["function"]["name"] = function.name
+                        if function.arguments:
+                            tool_args_parts[_index].append(function.arguments)
+            # enf for chunk
+        finally:
+            # Notify all content senders that the stream has finished so they can
+            # emit a final newline or release any in-progress rendering state.
+            # A failed stream is flushed too, its partial line must not be
+            # printed in front of the next reply.
+            for sender in self.content_senders:
+                if hasattr(sender, "finish"):
+                    sender.finish()
 
         # Record first-byte timing for stream responses.
         if first_byte_ms is not None:
             self.tokenStat.add_first_byte(first_byte_ms)
 
-        # Notify all content senders that the stream has finished so they can
-        # emit a final newline or release any in-progress rendering state.
-        for sender in self.content_senders:
-            if hasattr(sender, "finish"):
-                sender.finish()
-
         # generate tool_calls
         full_tool_calls_list = []
         if full_tool_calls_dict:
             for _index in sorted(full_tool_calls_dict.keys()):
                 tool_call = full_tool_calls_dict[_index]
                 tool_call["type"] = "function"
+                tool_call["function"]["arguments"] = "".join(tool_args_parts[_index])
                 full_tool_calls_list.append(
                     ChatCompletionMessageToolCall(**tool_call)
                 )
@@ -492,7 +575,7 @@ class LLMModel(LLMModelBase):
 
         self.tokenStat.output_token_stat(usage)
 
-        full_content = full_content.strip()
+        full_content = "".join(content_parts).strip()
 
         # ChatCompletionMessage
         response_ccm = ChatCompletionMessage(
@@ -506,6 +589,32 @@ class LLMModel(LLMModelBase):
 
         return (response_ccm, full_content)
 
+    def save_cached_response(self, rsp_cache, key, rsp_obj, rsp_content):
+        """
+        Save a checked response to the response cache.
+
+        Only plain data is kept, the response object may be a ChatCompletion or a ChatCompletionMessage.
+        """
+        try:
+            rsp_msg = self.get_response_message(rsp_obj)
+            rsp_cache.set(key, (rsp_msg.model_dump(), rsp_content))
+        except Exception as e:
+            logger.warning("failed to cache the response: %s", e)
+        return
+
+    def load_cached_response(self, cached):
+        """
+        Rebuild the response from the response cache, and send the content like a real chat.
+
+        Returns:
+            tuple: (ChatCompletionMessage, content string)
+        """
+        rsp_msg_dict, rsp_content = cached
+        logger.info("response cache hit, model=%s", self.model_name)
+        self.send_content(rsp_content)
+        self.flush_content()
+        return (ChatCompletionMessage.model_validate(rsp_msg_dict), rsp_content)
+
     def chat(
             self, messages,
             for_raw=False,
@@ -544,49 +653,60 @@ class LLMModel(LLMModelBase):
         rsp_content = None
         rsp_obj = None
 
+        # deterministic chat, a repeated request is answered from the cache
+        rsp_cache, rsp_cache_key = self.get_response_cache(messages, tools=tools, tool_choice=tool_choice)
+
+        # seconds from the Retry-After header of the last RateLimitError
+        retry_after = None
+
         for i in range(100):
             if i > retry_times:
                 break
 
             if i > 0:
-                sec = (i%retry_times)*5
-                if sec <= 0:
-                    sec = 3
-                if sec > 120:
-                    sec = 120
-                print_error(f"[{i}] blocking chat {sec}s ...")
+                sec = get_retry_seconds(i, retry_after)
+                retry_after = None
+                print_error(f"[{i}] blocking chat {sec:.1f}s ...")
                 time.sleep(sec)
 
             try:
-                with qos_tool.log_if_slow(
-                        env_tool.EnvReaderInstance.get(
-                            "TOPSAILAI_LLM_SLOW_CHAT_THRESHOLD",
-                            default=DEFAULT_LLM_SLOW_CHAT_THRESHOLD,
-                            formatter=int,
-                        ) or DEFAULT_LLM_SLOW_CHAT_THRESHOLD,
-                        f"{LLM_KEYWORD_SERVICE}: slow chat",
-                    ) as _info:
-                    if for_stream:
-                        rsp_obj, rsp_content = self.call_llm_model_by_stream(
-                            messages,
-                            tools=tools, tool_choice=tool_choice,
-                        )
-                    else:
-                        rsp_obj, rsp_content = self.call_llm_model(
-                            messages,
-                            tools=tools, tool_choice=tool_choice,
-                        )
-
-                    # set qos info
-                    _info["current_tokens"] = self.tokenStat.current_tokens
-                    _info["cached_tokens"] = self.tokenStat.current_cached_tokens
+                cached = rsp_cache.get(rsp_cache_key) if rsp_cache is not None else None
+                if cached:
+                    rsp_obj, rsp_content = self.load_cached_response(cached)
+                else:
+                    with qos_tool.log_if_slow(
+                            env_tool.EnvReaderInstance.get(
+                                "TOPSAILAI_LLM_SLOW_CHAT_THRESHOLD",
+                                default=DEFAULT_LLM_SLOW_CHAT_THRESHOLD,
+                                formatter=int,
+                            ) or DEFAULT_LLM_SLOW_CHAT_THRESHOLD,
+                            f"{LLM_KEYWORD_SERVICE}: slow chat",
+                        ) as _info:
+                        if for_stream:
+                            rsp_obj, rsp_content = self.call_llm_model_by_stream(
+                                messages,
+                                tools=tools, tool_choice=tool_choice,
+                            )
+                        else:
+                            rsp_obj, rsp_content = self.call_llm_model(
+                                messages,
+                                tools=tools, tool_choice=tool_choice,
+                            )
+
+                        # set qos info
+                        _info["current_tokens"] = self.tokenStat.current_tokens
+                        _info["cached_tokens"] = self.tokenStat.current_cached_tokens
 
                 if for_raw:
+                    if rsp_cache is not None and not cached:
+                        self.save_cached_response(rsp_cache, rsp_cache_key, rsp_obj, rsp_content)
                     return rsp_content
 
                 result = format_response(rsp_content, rsp_obj, messages=messages)
                 if not result:
                     raise TypeError("null of response content: [%s]" % rsp_content)
+                if rsp_cache is not None and not cached:
+                    self.save_cached_response(rsp_cache, rsp_cache_key, rsp_obj, rsp_content)
                 if for_response:
                     return (rsp_obj, result)
                 return result
@@ -603,6 +723,7 @@ class LLMModel(LLMModelBase):
                 continue
             except openai.RateLimitError as e:
                 print_error(f"!!! [{i}] RateLimitError, {self.model_config["api_key"][:7]}, {e}")
+                retry_after = get_retry_after(e)
                 if i > 7:
                     retry_times += 1
                 continue
@@ -698,3 +819,74 @@ class LLMModel(LLMModelBase):
                 raise e
 
         raise Exception("chat to LLM is failed")
+
+    async def achat(self, messages, **kwargs):
+        """
+        Chat without blocking the event loop.
+
+        The blocking chat (with its retry logic) runs in a worker thread via
+        asyncio.to_thread, the same as AgentBase.arun.
+
+        Args:
+            messages (list): List of message dictionaries
+            **kwargs: The same as chat(), e.g. for_raw, for_stream, for_response, tools.
+
+        Returns:
+            The same as chat().
+        """
+        return await asyncio.to_thread(self.chat, messages, **kwargs)
+
+    async def abatch_chat(self, list_of_messages:list, concurrency:int=None, **kwargs) -> list:
+        """
+        Chat for several independent message lists concurrently.
+
+        Each chat runs on its own copy_for_concurrency() of this model, the
+        replies are not sent to the content senders, and the tokens are
+        counted by the token statistics of the copies, not by self.tokenStat.
+
+        Args:
+            list_of_messages (list): list of messages, one chat for each.
+            concurrency (int): max count of the concurrent chats,
+                defaults to TOPSAILAI_LLM_CONCURRENCY or DEFAULT_LLM_CONCURRENCY.
+            **kwargs: The same as chat().
+
+        Returns:
+            list: The results, in the order of list_of_messages.
+        """
+        if not concurrency:
+            concurrency = env_tool.EnvReaderInstance.get(
+                "TOPSAILAI_LLM_CONCURRENCY",
+                default=DEFAULT_LLM_CONCURRENCY,
+                formatter=int,
+            ) or DEFAULT_LLM_CONCURRENCY
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _chat(messages):
+            async with semaphore:
+                model = self.copy_for_concurrency()
+                try:
+                    return await model.achat(messages, **kwargs)
+                finally:
+                    model.tokenStat.flag_running = False
+
+        return await asyncio.gather(*[_chat(messages) for messages in list_of_messages])
+
+    def chat_batch(self, list_of_messages:list, completion_window:str="24h", timeout:float=None, **kwargs) -> dict:
+        """
+        Chat for many messages by the Batch API, for the offline/bulk workloads.
+
+        Args:
+            list_of_messages (list): list of messages
+            completion_window (str): the completion window of the batch
+            timeout (float): seconds to wait, None for no limit.
+            **kwargs: passed to build_parameters_for_chat, e.g. tools.
+
+        Returns:
+            dict: key is custom_id ("t{index}"), value is the content, None if failed.
+        """
+        return BatchClient(self).chat_batch(
+            list_of_messages,
+            completion_window=completion_window,
+            timeout=timeout,
+            **kwargs
+        )
@@ -0,0 +1,177 @@
+'''
+  Author: DawsonLin
+  Email: lin_dongsen@126.com
+  Created: 2026-10-16
+  Purpose: submit chats by the OpenAI-compatible Batch API, for the offline/bulk workloads
+'''
+
+import time
+
+import simplejson
+from openai.types.chat import ChatCompletion
+
+from topsailai.logger.log_chat import logger
+from topsailai.utils.print_tool import (
+    print_error,
+)
+
+# the batch will not change any more
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchClient(object):
+    """
+    Submit many chats as one batch, and collect the results by custom_id.
+
+    Example:
+        contents = BatchClient(LLMModel()).chat_batch([messages1, messages2])
+        # {"t0": "...", "t1": "..."}
+    """
+    def __init__(self, llm_model, poll_interval:float=30):
+        """
+        Args:
+            llm_model (LLMModel): the model to build the parameters and to check the responses.
+            poll_interval (float): seconds between two polls of the batch status.
+        """
+        self.llm_model = llm_model
+        self.poll_interval = poll_interval
+
+        # model is client.chat.completions, chat_model is not used,
+        # it selects a model randomly and changes llm_model.model_config
+        self.client = llm_model.model._client
+
+    def build_batch_file(self, list_of_messages:list, **kwargs) -> bytes:
+        """
+        Build the JSONL content, one request for each messages, custom_id is "t{index}".
+
+        Args:
+            list_of_messages (list): list of messages
+            **kwargs: passed to build_parameters_for_chat, e.g. tools.
+
+        Returns:
+            bytes: the JSONL content
+        """
+        lines = []
+        for i, messages in enumerate(list_of_messages):
+            body = self.llm_model.build_parameters_for_chat(messages, stream=False, **kwargs)
+            lines.append(
+                simplejson.dumps(
+                    {
+                        "custom_id": f"t{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    },
+                    ensure_ascii=False,
+                    default=str,
+                )
+            )
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def submit(self, list_of_messages:list, completion_window:str="24h", **kwargs):
+        """
+        Upload the batch file and create the batch.
+
+        Returns:
+            Batch: the batch object
+        """
+        batch_file = self.client.files.create(
+            file=("topsailai_batch.jsonl", self.build_batch_file(list_of_messages, **kwargs)),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+        )
+        logger.info("batch is created: id=%s, count=%s", batch.id, len(list_of_messages))
+        return batch
+
+    def wait(self, batch_id:str, timeout:float=None):
+        """
+        Poll the batch until its status is terminal.
+
+        Args:
+            batch_id (str): the batch id
+            timeout (float): seconds, None for no limit.
+
+        Returns:
+            Batch: the batch object
+
+        Raises:
+            TimeoutError: if the batch is not finished in time.
+        """
+        start_time = time.monotonic()
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                return batch
+            if timeout is not None and time.monotonic() - start_time > timeout:
+                raise TimeoutError(f"batch is not finished in {timeout}s: id={batch_id}, status={batch.status}")
+            time.sleep(self.poll_interval)
+
+    def parse_results(self, content:str) -> dict:
+        """
+        Parse the output file of the batch.
+
+        Args:
+            content (str): the JSONL content of the output file
+
+        Returns:
+            dict: key is custom_id, value is the checked content, None if the request was failed.
+        """
+        result = {}
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            custom_id = None
+            try:
+                row = simplejson.loads(line)
+                custom_id = row.get("custom_id")
+                response = row.get("response") or {}
+                if row.get("error") or response.get("status_code") != 200:
+                    print_error(f"batch request is failed: custom_id={custom_id}, error={row.get('error') or response}")
+                    result[custom_id] = None
+                    continue
+
+                rsp_obj = ChatCompletion.model_validate(response["body"])
+                rsp_content = rsp_obj.choices[0].message.content
+                rsp_content = self.llm_model.fix_response_content(rsp_obj=rsp_obj, rsp_content=rsp_content)
+                self.llm_model.check_response_content(rsp_obj=rsp_obj, rsp_content=rsp_content)
+            except Exception as e:
+                # one bad row must not drop the other results of the batch
+                print_error(f"batch response is invalid: custom_id={custom_id}, error={e}")
+                rsp_content = None
+            if custom_id is not None:
+                result[custom_id] = rsp_content
+        return result
+
+    def chat_batch(self, list_of_messages:list, completion_window:str="24h", timeout:float=None, **kwargs) -> dict:
+        """
+        Submit the chats as one batch, wait and return the contents.
+
+        Args:
+            list_of_messages (list): list of messages
+            completion_window (str): the completion window of the batch
+            timeout (float): seconds to wait, None for no limit.
+            **kwargs: passed to build_parameters_for_chat, e.g. tools.
+
+        Returns:
+            dict: key is custom_id ("t{index}"), value is the content, None if failed.
+
+        Raises:
+            TimeoutError: if the batch is not finished in time.
+        """
+        if not list_of_messages:
+            return {}
+
+        batch = self.submit(list_of_messages, completion_window=completion_window, **kwargs)
+        batch = self.wait(batch.id, timeout=timeout)
+        if batch.status != "completed":
+            print_error(f"batch is not completed: id={batch.id}, status={batch.status}")
+
+        result = {f"t{i}": None for i in range(len(list_of_messages))}
+        if batch.output_file_id:
+            result.update(self.parse_results(self.client.files.content(batch.output_file_id).text))
+        return result
@@ -40,6 +40,15 @@ from .content_endpoint import (
     ContentSender,
     ContentStdout,
 )
+from .response_cache import (
+    get_response_cache,
+    build_response_cache_key,
+    normalize_messages_for_key,
+)
+
+
+# key is the values of the env, value is the parsed settings
+g_model_settings_cache = {}
 
 
 def parse_model_settings():
@@ -60,16 +69,21 @@ def parse_model_settings():
         Returns: [{"k1_a": "v1_a", "k2_a": "v2_a"}, {"k1_b": "v1_b", "k2_b": "v2_b"}]
 
     """
-    items = EnvReaderInstance.get_list_str("TOPSAILAI_MODEL_SETTINGS", separator=';') or \
-        EnvReaderInstance.get_list_str("MODEL_SETTINGS", separator=';')
-    result = []
-    if not items:
-        return result
-    for item in items:
-        d = format_tool.parse_str_to_dict(item, item_separator=',', kv_separator='=', kv_strip=True)
-        if d:
-            result.append(d)
-    return result
+    # the settings are parsed once for each value of the env
+    cache_key = (os.getenv("TOPSAILAI_MODEL_SETTINGS"), os.getenv("MODEL_SETTINGS"))
+    settings = g_model_settings_cache.get(cache_key)
+    if settings is None:
+        items = EnvReaderInstance.get_list_str("TOPSAILAI_MODEL_SETTINGS", separator=';') or \
+            EnvReaderInstance.get_list_str("MODEL_SETTINGS", separator=';')
+        settings = []
+        for item in items or []:
+            d = format_tool.parse_str_to_dict(item, item_separator=',', kv_separator='=', kv_strip=True)
+            if d:
+                settings.append(d)
+        g_model_settings_cache[cache_key] = settings
+
+    # the caller adds keys to the dicts, e.g. _model
+    return [dict(d) for d in settings]
 
 class LLMModelBase(object):
     """
@@ -161,6 +175,32 @@ class LLMModelBase(object):
             sender.send(content)
         return
 
+    def flush_content(self):
+        """
+        Flush all registered content senders which buffer the content.
+        """
+        for sender in self.content_senders:
+            if hasattr(sender, "flush"):
+                sender.flush()
+        return
+
+    def copy_for_concurrency(self):
+        """
+        Copy the model for one of the concurrent chats, e.g. LLMModel.abatch_chat.
+
+        The copy shares the model clients and the settings, it has its own
+        model selection, its own token statistics and no content senders,
+        so the concurrent chats do not overwrite the state of each other,
+        and their replies are not interleaved on the senders.
+
+        Returns:
+            LLMModelBase: the copy, stop it by `copy.tokenStat.flag_running = False`.
+        """
+        model = copy.copy(self)
+        model.tokenStat = TokenStat(f"{id(self)}-{id(model)}")
+        model.content_senders = []
+        return model
+
     def __del__(self):
         """
         Cleanup method called when the object is destroyed.
@@ -241,7 +281,8 @@ class LLMModelBase(object):
         Returns:
             dict: Parameters dictionary for the chat completion API
         """
-        messages = copy.deepcopy(messages)
+        # format_messages only replaces the content of a message, a copy of each message is enough
+        messages = [dict(msg) for msg in messages]
         messages = format_messages(messages, key_name="step_name", value_name="raw_text")
         params = dict(
             model=self.model_name,
@@ -274,6 +315,37 @@ class LLMModelBase(object):
 
         return params
 
+    def get_response_cache(self, messages, tools=None, tool_choice="auto"):
+        """
+        Get the response cache and the key for this chat.
+
+        Only the deterministic chat (temperature is 0) is cached, and the cache is
+        enabled by TOPSAILAI_LLM_RESPONSE_CACHE_SIZE.
+
+        Returns:
+            tuple: (LLMResponseCache, key), (None, None) if no cache for this chat.
+        """
+        if self.temperature != 0:
+            return (None, None)
+        cache = get_response_cache()
+        if cache is None:
+            return (None, None)
+        if EnvReaderInstance.check_bool("TOPSAILAI_LLM_RESPONSE_CACHE_NORMALIZE"):
+            messages = normalize_messages_for_key(messages)
+        key = build_response_cache_key(
+            dict(
+                model=self.model_name,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice if tools else None,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens,
+                frequency_penalty=self.frequency_penalty,
+            )
+        )
+        return (cache, key)
+
     def debug_response(self, response, content):
         """
         Print debug information about the response if in debug mode.
@@ -302,7 +374,12 @@ class LLMModelBase(object):
             return False
 
         if _need_print():
-            print_debug("[RESPONSE] \n" + simplejson.dumps(response.__dict__, indent=2, ensure_ascii=False, default=str))
+            if hasattr(response, "model_dump_json"):
+                # pydantic model of openai, serialized by pydantic-core
+                rsp_text = response.model_dump_json(indent=2)
+            else:
+                rsp_text = simplejson.dumps(response.__dict__, indent=2, ensure_ascii=False, default=str)
+            print_debug("[RESPONSE] \n" + rsp_text)
 
         return
 
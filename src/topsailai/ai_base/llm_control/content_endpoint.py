@@ -6,6 +6,7 @@ Purpose:
 '''
 
 import sys
+import time
 
 
 class ContentSender(object):
@@ -27,6 +28,12 @@ class ContentSender(object):
         """
         raise NotImplementedError
 
+    def flush(self):
+        """
+        Write out any buffered content, the default implementation is a no-op.
+        """
+        return True
+
     def finish(self):
         """
         Called when the content stream has ended.
@@ -43,7 +50,16 @@ class ContentStdout(ContentSender):
     Content sender implementation that writes content to standard output.
 
     This is useful for debugging and command-line applications.
+
+    Every token is written at once, but stdout is flushed only at the end of
+    a line or every FLUSH_INTERVAL seconds, a fast stream does not make one
+    flush per token and a long line is still shown while it is streamed.
     """
+    FLUSH_INTERVAL = 0.05
+
+    def __init__(self):
+        self._last_flush_time = 0
+
     def send(self, content):
         """
         Write content to standard output.
@@ -51,4 +67,19 @@ class ContentStdout(ContentSender):
         Args:
             content (str): The content to write to stdout
         """
+        if not content:
+            return
         sys.stdout.write(content)
+        if '\n' in content or time.monotonic() - self._last_flush_time >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """ flush the written content of stdout """
+        sys.stdout.flush()
+        self._last_flush_time = time.monotonic()
+        return True
+
+    def finish(self):
+        """ write the rest of the stream """
+        self.flush()
+        return True
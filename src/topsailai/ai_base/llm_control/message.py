@@ -5,8 +5,6 @@
   Purpose:
 '''
 
-import simplejson
-
 from topsailai.logger.log_chat import logger
 from topsailai.utils.print_tool import (
     print_error,
@@ -29,12 +27,30 @@ from .exception import (
 )
 from .llm_mistakes.base.init import check_or_fix_mistakes
 
+# markers of the topsailai format in a response
+_TOPSAILAI_FORMAT_MARKERS = (
+    "\n" + format_tool.TOPSAILAI_FORMAT_PREFIX,
+    format_tool.TOPSAILAI_STEP_ACTION + "\n",
+    format_tool.TOPSAILAI_STEP_THINK + "\n",
+)
+
 
 def _get_chat_completion_message_class():
     """Lazy import of openai.types.chat.ChatCompletionMessage."""
     from openai.types.chat import ChatCompletionMessage
     return ChatCompletionMessage
 
+def _is_topsailai_format(response:str) -> bool:
+    """ check the response is in the topsailai format """
+    if response.startswith(format_tool.TOPSAILAI_FORMAT_PREFIX):
+        return True
+    if format_tool.TOPSAILAI_FORMAT_PREFIX not in response:
+        return False
+    for marker in _TOPSAILAI_FORMAT_MARKERS:
+        if marker in response:
+            return True
+    return False
+
 def _to_list(obj):
     """
     Convert an object to a list if it is not already a list.
@@ -338,23 +354,19 @@ def format_response(response, rsp_obj=None, messages=None):
     max_count = 3
     for count in range(max_count):
         try:
-            if response.startswith(format_tool.TOPSAILAI_FORMAT_PREFIX) \
-                or f"\n{format_tool.TOPSAILAI_FORMAT_PREFIX}" in response \
-                or f"{format_tool.TOPSAILAI_STEP_ACTION}\n" in response \
-                or f"{format_tool.TOPSAILAI_STEP_THINK}\n" in response \
-                :
-                    if count:
-                        # no need retry
-                        break
-                    response = format_tool.format_dict_to_list(
-                        format_tool.parse_topsailai_format(response),
-                        key_name="step_name",
-                        value_name="raw_text",
-                    )
-                    return response
+            if _is_topsailai_format(response):
+                if count:
+                    # no need retry
+                    break
+                response = format_tool.format_dict_to_list(
+                    format_tool.parse_topsailai_format(response),
+                    key_name="step_name",
+                    value_name="raw_text",
+                )
+                return response
 
             response = json_tool.to_json_str(response)
-            response = _to_list(simplejson.loads(response))
+            response = _to_list(json_tool.json_load(response))
             new_response = fix_llm_mistakes(response)
             if new_response and new_response is not response:
                 response = new_response
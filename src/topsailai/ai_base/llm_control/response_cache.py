@@ -0,0 +1,139 @@
+'''
+  Author: DawsonLin
+  Email: lin_dongsen@126.com
+  Created: 2026-10-16
+  Purpose: cache the deterministic responses of LLM, temperature is 0
+'''
+
+import re
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import simplejson
+
+from topsailai.utils import (
+    env_tool,
+)
+
+
+class LLMResponseCache(object):
+    """
+    In-memory LRU cache for the LLM responses, thread safe.
+
+    The value is (message dict, content str), the message dict is from ChatCompletionMessage.model_dump().
+    """
+    def __init__(self, max_size:int, ttl:float=0):
+        """
+        Args:
+            max_size (int): max count of the responses to keep.
+            ttl (float): seconds to keep a response, 0 to keep it until it is evicted.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key:str):
+        """ return None if not found or expired """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expire_time, value = item
+            if expire_time and expire_time < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key:str, value):
+        with self._lock:
+            expire_time = time.monotonic() + self.ttl if self.ttl > 0 else 0
+            self._data[key] = (expire_time, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+        return
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+        return
+
+    def __len__(self):
+        return len(self._data)
+
+
+g_response_cache = None
+g_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> LLMResponseCache|None:
+    """
+    Get the shared response cache, it is shared by all of the LLM models in the process.
+
+    Returns:
+        LLMResponseCache: None if TOPSAILAI_LLM_RESPONSE_CACHE_SIZE is not set.
+    """
+    global g_response_cache
+    max_size = env_tool.EnvReaderInstance.get("TOPSAILAI_LLM_RESPONSE_CACHE_SIZE", default=0, formatter=int) or 0
+    if max_size <= 0:
+        return None
+
+    with g_response_cache_lock:
+        if g_response_cache is None or g_response_cache.max_size != max_size:
+            ttl = env_tool.EnvReaderInstance.get("TOPSAILAI_LLM_RESPONSE_CACHE_TTL", default=3600, formatter=float) or 0
+            g_response_cache = LLMResponseCache(max_size, ttl)
+        return g_response_cache
+
+
+def reset_response_cache():
+    """ drop the shared response cache """
+    global g_response_cache
+    with g_response_cache_lock:
+        g_response_cache = None
+    return
+
+
+def build_response_cache_key(params:dict) -> str:
+    """
+    Build the cache key from the parameters of the chat.
+
+    Args:
+        params (dict): e.g. model, messages, tools, temperature, top_p, max_tokens.
+
+    Returns:
+        str: sha256 hex digest
+    """
+    data = simplejson.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+# the spaces and tabs after a non-space character, the leading indentation is not matched
+INLINE_SPACE_RE = re.compile(r'(?<=\S)[ \t]+')
+
+
+def normalize_messages_for_key(messages:list) -> list:
+    """
+    Collapse the spaces and tabs inside the lines of the text contents, the messages
+    which only differ in such whitespace get the same cache key.
+    Line breaks and leading indentation are kept, they change the meaning of code and lists.
+
+    Args:
+        messages (list): list of message dict, it is not changed.
+
+    Returns:
+        list: the new messages
+    """
+    result = []
+    for msg in messages:
+        content = msg.get("content") if isinstance(msg, dict) else None
+        if isinstance(content, str):
+            msg = dict(msg)
+            msg["content"] = "\n".join(
+                INLINE_SPACE_RE.sub(" ", line).rstrip() for line in content.strip().splitlines()
+            )
+        result.append(msg)
+    return result
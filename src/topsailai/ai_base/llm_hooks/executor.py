@@ -11,6 +11,24 @@ from topsailai.utils import (
     thread_local_tool,
 )
 
+# key is hook path, value is the hook_execute function (None if not found),
+# the hook modules do not change in a process
+g_hook_funcs = {}
+
+
+def get_hook_func(hook_path:str):
+    """ get the hook_execute function of the hook module, resolved once """
+    if hook_path not in g_hook_funcs:
+        g_hook_funcs[hook_path] = module_tool.get_var(hook_path, "hook_execute")
+    return g_hook_funcs[hook_path]
+
+
+def reset_hook_funcs():
+    """ drop the resolved hook functions """
+    g_hook_funcs.clear()
+    return
+
+
 def get_hooks_runtime(key:str, content) -> list[str]:
     agent = thread_local_tool.get_agent_object()
     model_name = None
@@ -69,7 +87,7 @@ def hook_execute(key:str, content:str|list) -> list[dict]|str:
     if not hooks:
         return content
     for hook_path in hooks:
-        hook_func = module_tool.get_var(hook_path, "hook_execute")
+        hook_func = get_hook_func(hook_path)
         if hook_func:
             content = hook_func(content)
     return content
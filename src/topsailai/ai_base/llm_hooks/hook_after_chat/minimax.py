@@ -5,10 +5,13 @@ Created: 2026-01-29
 Purpose: Convert XML-like content from Minimax to standard format
 '''
 
+import re
 import json
-import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Union
 
+THINK_RE = re.compile(r"<think>(.*?)</think>", re.DOTALL)
+TOOL_ARGS_RE = re.compile(r"<tool_args>(.*?)</tool_args>", re.DOTALL)
+
 def convert_xml_to_list_dict(raw_content: str) -> List[Dict[str, Any]]:
     """
     Convert XML-like content to a list of dictionaries
@@ -69,11 +72,9 @@ def convert_xml_to_list_dict(raw_content: str) -> List[Dict[str, Any]]:
     result = []
 
     # Find <think> tag content
-    think_start = raw_content.find("<think>")
-    think_end = raw_content.find("</think>", think_start + 7)
-
-    if think_start != -1 and think_end != -1:
-        think_content = raw_content[think_start + 7:think_end].strip()
+    match = THINK_RE.search(raw_content)
+    if match:
+        think_content = match.group(1).strip()
         if think_content:  # Only add if content is not empty
             result.append({
                 "step_name": "thought",
@@ -89,12 +90,9 @@ def convert_xml_to_list_dict(raw_content: str) -> List[Dict[str, Any]]:
         tool_call_name = raw_content[name_start:name_end]
 
         # Extract tool_args
-        tool_args_start = raw_content.find('<tool_args>', invoke_start)
-        tool_args_end = raw_content.find('</tool_args>', invoke_start)
-
-        if tool_args_start != -1 and tool_args_end != -1:
-            tool_args_start += len('<tool_args>')
-            tool_args_str = raw_content[tool_args_start:tool_args_end].strip()
+        match = TOOL_ARGS_RE.search(raw_content, invoke_start)
+        if match:
+            tool_args_str = match.group(1).strip()
             try:
                 tool_args = json.loads(tool_args_str)
             except json.JSONDecodeError:
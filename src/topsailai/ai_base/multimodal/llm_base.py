@@ -5,7 +5,6 @@
   Purpose: Multimodal LLM model extending LLMModel to support content arrays.
 """
 
-import copy
 from typing import List, Union
 
 from topsailai.ai_base.llm_base import LLMModel
@@ -58,7 +57,8 @@ class MultimodalLLMModel(LLMModel):
         Returns:
             dict: Parameters dictionary for the chat completion API.
         """
-        messages = copy.deepcopy(messages)
+        # only the content of a message is replaced, a copy of each message is enough
+        messages = [dict(msg) for msg in messages]
 
         # Execute pre-chat hook (preserved from original multimodal implementation)
         from topsailai.ai_base.llm_hooks.executor import hook_execute
@@ -33,7 +33,7 @@ from topsailai.utils.thread_local_tool import (
     get_agent_name,
 )
 from topsailai.utils.thread_local_tool import get_session_id
-from topsailai.context.token import count_tokens
+from topsailai.context.token import count_tokens, get_msg_cache_key
 from topsailai.context.ctx_manager import get_managers_by_env
 from topsailai.context.prompt_env import generate_prompt_for_env
 
@@ -115,6 +115,9 @@ class ThresholdContextHistory(object):
         self.slim_len = int(os.getenv("CONTEXT_MESSAGES_SLIM_THRESHOLD_LENGTH", self.slim_len))
         self.uncached_token_max = int(os.getenv("CONTEXT_MESSAGES_SLIM_THRESHOLD_UNCACHED_TOKENS", self.uncached_token_max))
 
+        # token counts of the last checked messages, key is from get_msg_cache_key
+        self._token_cache = {}
+
     def __str__(self):
         return f"ThresholdContextHistory=(token_max: {self.token_max}, token_ratio: {self.token_ratio}, slim_len: {self.slim_len}, uncached_token_max: {self.uncached_token_max})"
 
@@ -164,6 +167,33 @@ class ThresholdContextHistory(object):
             return True
         return False
 
+    def count_messages_tokens(self, messages:list) -> int:
+        """
+        Count the tokens of the messages, message by message.
+
+        The counts are cached by get_msg_cache_key, only the messages which are
+        new since the last check are encoded, the whole history is not stringified.
+
+        Args:
+            messages (list): List of messages
+
+        Returns:
+            int: the total token count
+        """
+        total = 0
+        token_cache = {}
+        for msg in messages:
+            key = get_msg_cache_key(msg)
+            n = token_cache.get(key)
+            if n is None:
+                n = self._token_cache.get(key)
+            if n is None:
+                n = count_tokens(str(msg))
+            token_cache[key] = n
+            total += n
+        self._token_cache = token_cache
+        return total
+
     def is_exceeded(self, messages:list):
         """
         Check if context history exceeds any configured thresholds
@@ -207,7 +237,7 @@ class ThresholdContextHistory(object):
                 logger.exception(e)
 
         # check current_tokens
-        token_count_now = count_tokens(str(messages))
+        token_count_now = self.count_messages_tokens(messages)
         if self.exceed_ratio(token_count_now):
             return True
         return False
@@ -226,6 +256,10 @@ class PromptBase(object):
     # define flags
     flag_dump_messages = False
 
+    # messages[:_linked_end] are linked, _linked_msg is messages[_linked_end-1]
+    _linked_end = 0
+    _linked_msg = None
+
     def __init__(self, system_prompt:str, tool_prompt:str=""):
         """
         Initialize the prompt base manager
@@ -301,13 +335,39 @@ class PromptBase(object):
 
         # check threshold, link messages to reduce content
         if self.threshold_ctx_history.is_exceeded(self.messages):
+            index_start = self.get_link_index_start()
+            all_linked = True
             for hook in self.hooks_ctx_history:
                 try:
-                    hook.link_messages(self.messages)
+                    if index_start > NON_SYSTEM_PROMPT_MESSAGE_INDEX:
+                        hook.link_messages(self.messages, index_start=index_start)
+                    else:
+                        hook.link_messages(self.messages)
                 except Exception as e:
+                    all_linked = False
                     logger.exception("failed to call hook link_messages: %s", e)
+
+            # link_messages keeps the last 10 messages;
+            # after a failure, the same messages are linked again in the next turn
+            if all_linked:
+                linked_end = max(index_start, len(self.messages) - 10)
+                self._linked_end = linked_end
+                self._linked_msg = self.messages[linked_end - 1]
         return
 
+    def get_link_index_start(self) -> int:
+        """
+        Get the index to start linking messages, the messages before it are linked.
+
+        Returns:
+            int: NON_SYSTEM_PROMPT_MESSAGE_INDEX if the linked messages are changed.
+        """
+        end = self._linked_end
+        if end > NON_SYSTEM_PROMPT_MESSAGE_INDEX and end <= len(self.messages) \
+            and self.messages[end - 1] is self._linked_msg:
+            return end
+        return NON_SYSTEM_PROMPT_MESSAGE_INDEX
+
     def append_message(self, msg:dict, to_suppress_log=False):
         """
         Append a message to the context and call history hooks
@@ -444,15 +504,23 @@ class PromptBase(object):
         Args:
             to_suppress_log (bool, optional): Whether to suppress logging. Defaults to False.
         """
-        self.messages = []
-        # 0, system
-        self.append_message({"role": ROLE_SYSTEM, "content": self.system_prompt}, to_suppress_log)
-        # 1, env
-        self.append_message({"role": ROLE_SYSTEM, "content": generate_prompt_for_env()}, to_suppress_log)
+        messages = [
+            # 0, system
+            {"role": ROLE_SYSTEM, "content": self.system_prompt},
+            # 1, env
+            {"role": ROLE_SYSTEM, "content": generate_prompt_for_env()},
+        ]
         # 2, tool
         if self.tool_prompt:
             # last
-            self.append_message({"role": ROLE_SYSTEM, "content": self.tool_prompt}, to_suppress_log)
+            messages.append({"role": ROLE_SYSTEM, "content": self.tool_prompt})
+
+        # system messages only, no session message to record and nothing to link,
+        # the hooks of context history are not called.
+        if not to_suppress_log:
+            for msg in messages:
+                logger.debug(msg)
+        self.messages = messages
 
     def update_message_for_env(self):
         """
@@ -5,6 +5,8 @@
   Purpose:
 '''
 
+import re
+
 from topsailai.logger import logger
 from topsailai.utils import (
     json_tool,
@@ -15,18 +17,25 @@ from topsailai.ai_base.llm_control.message import (
 )
 
 
+# the first json object/array in a markdown code block
+JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```', re.DOTALL)
+
+
 class ToolCallInfo(object):
     """
     Data structure to store tool call information.
 
     This class encapsulates the function name and arguments for a tool call.
     """
-    def __init__(self):
-        """Initialize ToolCallInfo with empty function name and arguments."""
+    # one is created for every tool call
+    __slots__ = ("func_name", "func_args")
+
+    def __init__(self, func_name:str="", func_args:dict=None):
+        """Initialize ToolCallInfo, empty function name and arguments by default."""
         # Function name to be called
-        self.func_name = ""
+        self.func_name = func_name
         # Arguments for the function call
-        self.func_args = {}
+        self.func_args = func_args or {}
 
 
 class StepCallBase(object):
@@ -117,71 +126,72 @@ class StepCallBase(object):
         Returns:
             ToolCallInfo|None: Tool call information if found, None otherwise
         """
-        if rsp_msg_obj is not None:
-            # list_dict
-            tool_calls = rsp_msg_obj.tool_calls
-            if tool_calls:
-                tool_call = tool_calls[0]
-
-                # Function name from tool call
-                func_name = tool_call.function.name
-                # Function arguments
-                func_args = None
-                if tool_call.function.arguments:
-                    args_content = tool_call.function.arguments
+        # list_dict
+        tool_calls = rsp_msg_obj.tool_calls if rsp_msg_obj is not None else None
+        if tool_calls:
+            function = tool_calls[0].function
+
+            # Function name from tool call
+            func_name = function.name
+            # Function arguments
+            func_args = None
+            args_content = function.arguments
+            if args_content:
+                try:
+                    func_args = json_tool.json_load(args_content)
+                except Exception as e:
+                    args_content = json_tool.to_json_str(args_content)
                     try:
                         func_args = json_tool.json_load(args_content)
                     except Exception as e:
-                        args_content = json_tool.to_json_str(args_content)
-                        try:
-                            func_args = json_tool.json_load(args_content)
-                        except Exception as e:
-                            logger.exception(e)
-                            return None
-
-                if func_name:
-                    result = ToolCallInfo()
-                    result.func_name = func_name
-                    result.func_args = func_args or {}
-                    return result
-
-        if 'tool_call' in step:
-            # Function name from step
-            func_name = step["tool_call"]
-            # Function arguments from step
-            func_args = step.get('tool_args')
+                        logger.exception(e)
+                        return None
 
             if func_name:
-                result = ToolCallInfo()
-                result.func_name = func_name
-                result.func_args = func_args or {}
-                return result
+                return ToolCallInfo(func_name, func_args)
+
+        # Function name from step
+        func_name = step.get("tool_call")
+        if func_name:
+            # Function arguments from step
+            return ToolCallInfo(func_name, step.get('tool_args'))
 
         if 'raw_text' in step:
             try:
-                # Raw text content
-                raw_text = json_tool.convert_code_block_to_json_str(step["raw_text"]) or step["raw_text"]
-                raw_text = json_tool.to_json_str(raw_text)
                 # Parsed dictionary from raw text
                 raw_dict = None
-                if raw_text:
+                raw_text = step["raw_text"]
+                if isinstance(raw_text, str):
+                    # fast path, well-formed json is parsed only once
+                    payload = raw_text
+                    if "```" in raw_text:
+                        match = JSON_CODE_BLOCK_RE.search(raw_text)
+                        if match:
+                            payload = match.group(1)
+                    if payload.lstrip()[:1] in ("{", "["):
+                        raw_dict = json_tool.safe_json_load(payload)
+                elif isinstance(raw_text, (dict, list)):
+                    # already parsed, no need to dump and load it again
+                    raw_dict = raw_text
+                if raw_dict is None:
+                    # Raw text content, fix the common LLM mistakes on json
+                    raw_text = json_tool.convert_code_block_to_json_str(raw_text) or raw_text
+                    raw_text = json_tool.to_json_str(raw_text)
+                if raw_dict is None and raw_text:
                     try:
                         raw_dict = json_tool.json_load(raw_text)
                     except Exception:
                         if 'step_name' in step and step["step_name"] == "action":
                             raw_dict = format_response(raw_text)
-                    if isinstance(raw_dict, list):
-                        raw_dict = raw_dict[0]
+                if isinstance(raw_dict, list):
+                    raw_dict = raw_dict[0]
                 if raw_dict and 'tool_call' in raw_dict:
                     # Function name from raw text
                     func_name = raw_dict['tool_call']
                     # Function arguments from raw text
                     func_args = raw_dict.get('tool_args')
                     if func_name:
-                        result = ToolCallInfo()
-                        result.func_name = func_name
-                        result.func_args = func_args or {}
-                        return result
+                        return ToolCallInfo(func_name, func_args)
             except Exception:
                 pass
 
@@ -6,13 +6,17 @@
 '''
 
 import os
-import yaml
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
+from topsailai.logger import logger
 from topsailai.utils import (
     env_tool,
     file_tool,
 )
 from topsailai.prompt_hub import prompt_tool
+from topsailai.workspace.folder_constants import FOLDER_CACHE
 from topsailai.ai_team.role import (
     get_manager_prompt,
 )
@@ -27,16 +31,88 @@ if g_flag_only_agent:
     PROMPT_FILE_AI_TEAM_MANAGER = f"{CWD}/ai_team_manager_only_agent.md"
 
 
+# Prefix of the member keys for the abilities, e.g. is_able_to_call_chat
+_ABILITY_KEY_PREFIX = "is_able_to_call_"
+
 g_members = []
 
+# system prompt cache data loaded or saved by this process, key is the cache path
+g_system_prompt_cache = {}
+
 def get_members_cache() -> list:
     """ return members """
     return g_members
 
+def get_team_concurrency() -> int:
+    """
+    Get the upper bound of threads used for the team members.
+
+    Read from TOPSAILAI_TEAM_CONCURRENCY, default is the number of CPUs
+    usable by this process.
+
+    Returns:
+        int: The concurrency, at least 1.
+    """
+    concurrency = env_tool.EnvReaderInstance.get(
+        "TOPSAILAI_TEAM_CONCURRENCY",
+        default=0,
+        formatter=int,
+    ) or 0
+    if concurrency <= 0:
+        if hasattr(os, "sched_getaffinity"):
+            concurrency = len(os.sched_getaffinity(0))
+        else:
+            concurrency = os.cpu_count() or 1
+    return max(1, concurrency)
+
+def _load_member(f_path: str, entries: dict[str, os.DirEntry]) -> dict:
+    """
+    Load a single member from its `.member` file.
+
+    Args:
+        f_path (str): Path of the `.member` file.
+        entries (dict): Entries of the team folder, keyed by file name.
+
+    Returns:
+        dict: The member information, see get_team_list().
+    """
+    with open(f_path, encoding="utf-8") as fd:
+        f_content = fd.read().strip()
+
+    member_id = os.path.basename(f_path).rsplit('.', 1)[0]
+    member = {
+        "member_id": member_id,
+        "member_info": f_content,
+        "is_able_to_call_chat": False,
+        "is_able_to_call_agent": False,
+    }
+
+    # ability
+    for ext in ["chat", "agent"]:
+        entry = entries.get(f"{member_id}.{ext}")
+        member[_ABILITY_KEY_PREFIX + ext] = entry is not None
+        if entry is None:
+            continue
+
+        st_mode = entry.stat().st_mode
+        if st_mode & 0o111 != 0o111:
+            try:
+                os.chmod(entry.path, st_mode | 0o111)
+            except OSError as e:
+                # e.g. the file is owned by another user, keep the member
+                logger.warning(f"failed to set executable bit: {entry.path}, {e}")
+
+    return member
+
+
 def get_team_list() -> list[dict]:
     """
     Get a list of team members from the TOPSAILAI_TEAM_PATH directory.
 
+    The team folder is scanned once, and member files are loaded concurrently
+    in a thread pool, so the startup time tracks the slowest file instead of
+    the sum of all files.
+
     Returns:
         list[dict]: A list of dictionaries containing member information, where each dict has:
             - member_id: The base name of the member file without extension
@@ -50,35 +126,21 @@ def get_team_list() -> list[dict]:
     team_path = os.getenv("TOPSAILAI_TEAM_PATH")
     assert team_path and os.path.isdir(team_path), f"invalid team path: {team_path}"
 
-    team_list = []
-    for f in os.listdir(team_path):
-        if not f.endswith(".member"):
-            continue
+    with os.scandir(team_path) as it:
+        entries = {entry.name: entry for entry in it}
 
-        member = {
-            "member_id": "",
-            "member_info": "",
-            "is_able_to_call_chat": False,
-            "is_able_to_call_agent": False,
-        }
-        team_list.append(member)
-        f_path = os.path.join(team_path, f)
-        with open(f_path, encoding="utf-8") as fd:
-            f_content = fd.read().strip()
+    paths = [entry.path for name, entry in entries.items() if name.endswith(".member")]
+    if not paths:
+        return []
 
-        member["member_id"] = os.path.basename(f_path).rsplit('.', 1)[0]
-        member["member_info"] = f_content
+    max_workers = min(get_team_concurrency(), len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        team_list = list(executor.map(lambda f_path: _load_member(f_path, entries), paths))
 
-        # global vars
+    # global vars
+    for member in team_list:
         g_members.append(member["member_id"])
 
-        # ability
-        for ext in ["chat", "agent"]:
-            f_ext = f_path.rsplit('.', 1)[0] + "." + ext
-            member[f"is_able_to_call_{ext}"] = os.path.exists(f_ext)
-            if member[f"is_able_to_call_{ext}"]:
-                os.system(f"chmod +x {f_ext}")
-
     return team_list
 
 
@@ -98,24 +160,23 @@ def generate_team_prompt(team_list: list[dict], only_agent: bool = True) -> str:
     """
     assert team_list
 
+    # lazy import, only used here
+    import yaml
+    # libyaml based dumper is much faster than the pure python one
+    yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
     if only_agent:
         # remove is_able_to_call...
-        new_team_list = []
-        for team_info in team_list:
-            new_team_info = team_info.copy()
-            new_team_list.append(new_team_info)
-
-            for key in list(new_team_info.keys()):
-                if key.startswith("is_able_to_call_"):
-                    del new_team_info[key]
-
-        team_list = new_team_list
+        team_list = [
+            {key: value for key, value in team_info.items() if not key.startswith(_ABILITY_KEY_PREFIX)}
+            for team_info in team_list
+        ]
 
     content = f"""
 
 ## Team Detail
 ```yaml
-{yaml.safe_dump(team_list)}
+{yaml.dump(team_list, Dumper=yaml_dumper)}
 ```
 """
     return content
@@ -146,6 +207,101 @@ def build_manager_message(message: str) -> str:
     return message
 
 
+def _get_file_signature(file_path: str) -> tuple | None:
+    """ return (mtime_ns, size) of a file, None if it is not a file. """
+    if not file_path or not os.path.isfile(file_path):
+        return None
+    st = os.stat(file_path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _get_system_prompt_cache_path() -> str:
+    """
+    Get the cache file of the system prompt for the current inputs.
+
+    The file name is a fingerprint of every input of generate_system_prompt():
+    the team folder entries, the prompt files (mtime and size) and the related
+    environment variables. Any change of them leads to a different file.
+
+    Returns:
+        str: The cache file path, or "" if the cache cannot be used.
+    """
+    if not env_tool.EnvReaderInstance.check_bool("TOPSAILAI_TEAM_PROMPT_CACHE", default=True):
+        return ""
+
+    team_path = os.getenv("TOPSAILAI_TEAM_PATH")
+    if not team_path or not os.path.isdir(team_path):
+        return ""
+
+    team_sig = []
+    with os.scandir(team_path) as it:
+        for entry in it:
+            if not entry.name.endswith((".member", ".chat", ".agent")):
+                continue
+            st = entry.stat()
+            team_sig.append((entry.name, st.st_mtime_ns, st.st_size))
+    team_sig.sort()
+
+    env_sys_prompt = os.getenv("SYSTEM_PROMPT") or ""
+    env_team_prompt = os.getenv("TOPSAILAI_TEAM_PROMPT") or ""
+    collaboration_file = prompt_tool.get_prompt_file_path("work_mode/sop/collaboration.md")
+
+    fingerprint = (
+        team_path,
+        team_sig,
+        g_flag_only_agent,
+        get_manager_prompt(),
+        (env_sys_prompt, _get_file_signature(env_sys_prompt)),
+        (env_team_prompt, _get_file_signature(env_team_prompt)),
+        (PROMPT_FILE_AI_TEAM_MANAGER, _get_file_signature(PROMPT_FILE_AI_TEAM_MANAGER)),
+        (collaboration_file, _get_file_signature(collaboration_file)),
+    )
+    digest = hashlib.blake2b(repr(fingerprint).encode("utf-8"), digest_size=16).hexdigest()
+
+    return os.path.join(FOLDER_CACHE, "ai_team", f"system_prompt.{digest}.json")
+
+
+def _load_system_prompt_cache(cache_path: str) -> dict | None:
+    """ return the cached data, None if missing or broken. """
+    if not cache_path:
+        return None
+    if cache_path in g_system_prompt_cache:
+        return g_system_prompt_cache[cache_path]
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, encoding="utf-8") as fd:
+            data = json.load(fd)
+        if not isinstance(data, dict):
+            return None
+        for key in ["members", "team_prompt_content", "sys_prompt_content"]:
+            if key not in data:
+                return None
+        g_system_prompt_cache[cache_path] = data
+        return data
+    except Exception as e:
+        logger.warning(f"failed to load system prompt cache [{cache_path}]: {e}")
+    return None
+
+
+def _save_system_prompt_cache(cache_path: str, data: dict):
+    """ write the cache data atomically, errors are ignored. """
+    if not cache_path:
+        return
+    g_system_prompt_cache[cache_path] = data
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, encoding="utf-8", mode="w") as fd:
+            json.dump(data, fd, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"failed to save system prompt cache [{cache_path}]: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return
+
+
 def generate_system_prompt():
     """
     Generate the complete system prompt by combining multiple sources.
@@ -155,6 +311,9 @@ def generate_system_prompt():
     - System prompt from environment variable or file
     - Team prompt from environment variable or default file
 
+    The result is cached on disk and in memory, keyed by a fingerprint of
+    all inputs, so an unchanged team does not re-read and re-dump every file.
+
     Returns:
         str: The complete system prompt content
 
@@ -162,18 +321,27 @@ def generate_system_prompt():
         SYSTEM_PROMPT: File path or content for system prompt
         TOPSAILAI_TEAM_PROMPT: File path for team prompt (defaults to PROMPT_FILE_AI_TEAM)
         TOPSAILAI_TEAM_PATH: Path to team member directory (used by get_team_list())
+        TOPSAILAI_TEAM_PROMPT_CACHE: Set to "0" to disable the cache (default: 1)
     """
+    if not os.getenv("TOPSAILAI_TEAM_PROMPT"):
+        os.environ["TOPSAILAI_TEAM_PROMPT"] = PROMPT_FILE_AI_TEAM
+
+    # cache
+    cache_path = _get_system_prompt_cache_path()
+    cache_data = _load_system_prompt_cache(cache_path)
+    if cache_data:
+        g_members.extend(cache_data["members"])
+        os.environ["TOPSAILAI_TEAM_PROMPT_CONTENT"] = cache_data["team_prompt_content"]
+        return cache_data["sys_prompt_content"]
+
     # team info
     team_list = get_team_list()
     team_info = generate_team_prompt(team_list, g_flag_only_agent)
 
     # system prompt
-    env_sys_prompt = os.getenv("SYSTEM_PROMPT")
-    _, sys_prompt_content = file_tool.get_file_content_fuzzy(env_sys_prompt)
+    sys_prompt_content = prompt_tool.get_system_prompt_content()
 
     # team prompt
-    if not os.getenv("TOPSAILAI_TEAM_PROMPT"):
-        os.environ["TOPSAILAI_TEAM_PROMPT"] = PROMPT_FILE_AI_TEAM
     env_team_prompt = os.getenv("TOPSAILAI_TEAM_PROMPT")
     _, team_prompt_content = file_tool.get_file_content_fuzzy(env_team_prompt)
     if team_prompt_content:
@@ -187,8 +355,6 @@ def generate_system_prompt():
     # agent will use this
     os.environ["TOPSAILAI_TEAM_PROMPT_CONTENT"] = team_prompt_content
 
-    # print(team_prompt_content)
-
     # manager prompt
     _, manager_prompt_content = file_tool.get_file_content_fuzzy(PROMPT_FILE_AI_TEAM_MANAGER)
 
@@ -203,4 +369,13 @@ def generate_system_prompt():
         collaboration_prompt
     ) + "\n"
 
+    _save_system_prompt_cache(
+        cache_path,
+        {
+            "members": [member["member_id"] for member in team_list],
+            "team_prompt_content": team_prompt_content,
+            "sys_prompt_content": sys_prompt_content,
+        }
+    )
+
     return sys_prompt_content
@@ -10,10 +10,7 @@ import os
 from topsailai.ai_team.role import (
     get_member_prompt,
 )
-from topsailai.utils import (
-
-    file_tool,
-)
+from topsailai.prompt_hub import prompt_tool
 
 def extend_system_prompt():
     """
@@ -61,8 +58,7 @@ def get_system_prompt(agent_name:str) -> str:
         You are a helpful AI assistant...
     """
     # system prompt
-    env_sys_prompt = os.getenv("SYSTEM_PROMPT")
-    _, sys_prompt_content = file_tool.get_file_content_fuzzy(env_sys_prompt)
+    sys_prompt_content = prompt_tool.get_system_prompt_content()
 
     # team role
     member_prompt = get_member_prompt(agent_name)
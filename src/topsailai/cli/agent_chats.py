@@ -29,7 +29,6 @@ import sys
 import _import_topsailai
 
 os.chdir(_import_topsailai.PROJECT_FOLDER_BASE)
-from topsailai.workspace.agent_shell import get_agent_chat
 
 
 def main():
@@ -55,6 +54,9 @@ def main():
         - User can exit by typing 'exit', 'quit', or Ctrl+C
     """
     """ main entry """
+    # lazy import, the agent stack takes a long time to import
+    from topsailai.workspace.agent_shell import get_agent_chat
+
     get_agent_chat(disabled_tools=["agent_tool"]).run()
 
 if __name__ == "__main__":
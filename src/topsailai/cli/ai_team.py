@@ -14,6 +14,8 @@
     @TOPSAILAI_TEAM_PROMPT: required, file or content;
     @TOPSAILAI_TEAM_PATH: required, the team folder;
     @TOPSAILAI_TEAM_AGENT_SESSION_NEED_SAVE_MESSAGE: team_agent can store the first message (task) and the last message (final_answer)
+    @TOPSAILAI_TEAM_PROMPT_CACHE: optional, 0 to disable the system prompt cache;
+    @TOPSAILAI_TEAM_CONCURRENCY: optional, max threads for the team members, default is the CPU count;
 '''
 
 import os
@@ -23,6 +25,7 @@ import _import_topsailai
 
 os.chdir(_import_topsailai.PROJECT_FOLDER_BASE)
 
+from topsailai.utils import env_tool
 from topsailai.ai_team.manager import (
     get_members_cache,
     build_manager_message,
@@ -34,10 +37,6 @@ from topsailai.ai_team.role import (
 from topsailai.human.role import (
     get_human_name,
 )
-from topsailai.workspace.input_tool import (
-    SPLIT_LINE,
-)
-from topsailai.workspace.agent_shell import get_agent_chat
 from topsailai.ai_team.common import (
     get_session_id,
     get_session_head_tail_offset,
@@ -93,12 +92,20 @@ def main():
         TOPSAILAI_TEAM_SESSION_HEAD_AND_TAIL_OFFSET: Optional offset for session context (default: 7)
         TOPSAILAI_SESSION_HEAD_TAIL_OFFSET: Fallback offset for session context (default: 7)
     """
+    # lazy import, the agent stack takes a long time to import
+    from topsailai.workspace.input_tool import (
+        SPLIT_LINE,
+    )
+    from topsailai.workspace.agent_shell import get_agent_chat
+
     # agent name
     manager_name = get_manager_name()
 
     # prompt
     sys_prompt_content = generate_system_prompt()
-    # print(sys_prompt_content)
+    if env_tool.is_debug_mode():
+        # one write for the whole prompt
+        sys.stdout.write(sys_prompt_content + "\n")
 
     # show members
     print("\n")
@@ -45,7 +45,6 @@ from topsailai.ai_team.member_agent import (
 from topsailai.utils import (
     env_tool,
 )
-from topsailai.workspace.agent_shell import get_agent_chat
 from topsailai.ai_team.common import (
     get_session_head_tail_offset,
 )
@@ -107,6 +106,9 @@ def main():
         Processing task...
         Answer: Task completed successfully.
     """
+    # lazy import, the agent stack takes a long time to import
+    from topsailai.workspace.agent_shell import get_agent_chat
+
     # agent name
     agent_name = get_member_name()
 
@@ -22,7 +22,7 @@ import _import_topsailai
 
 os.chdir(_import_topsailai.PROJECT_FOLDER_BASE)
 
-from topsailai.ai_base.prompt_base import ROLE_USER
+from topsailai.ai_base.constants import ROLE_USER
 from topsailai.ai_team.role import (
     get_member_name,
     get_member_prompt,
@@ -30,8 +30,8 @@ from topsailai.ai_team.role import (
 from topsailai.utils import (
     env_tool,
     json_tool,
+    text_tool,
 )
-from topsailai.workspace.llm_shell import get_llm_chat
 
 
 def format_messages(messages):
@@ -52,18 +52,18 @@ def format_messages(messages):
         >>> format_messages(msgs)
         [{"role": "user", "content": "Hello"}]
     """
-    for i, msg in enumerate(messages):
-        content  = msg["content"]
-        content_obj = None
-        if content and content[0] in "[{":
-            content_obj = json_tool.safe_json_load(content)
-        if not content_obj:
+    for msg in messages:
+        # only for raw_text of user, skip parsing the other messages
+        if msg["role"] != ROLE_USER:
             continue
 
-        if msg["role"] == ROLE_USER:
-            # only for raw_text
-            if isinstance(content_obj, dict) and "raw_text" in content_obj:
-                msg["content"] = content_obj["raw_text"]
+        content = msg["content"]
+        if not content or content[0] != "{" or '"raw_text"' not in content:
+            continue
+
+        content_obj = json_tool.safe_json_load(content)
+        if isinstance(content_obj, dict) and "raw_text" in content_obj:
+            msg["content"] = content_obj["raw_text"]
     return messages
 
 
@@ -90,6 +90,9 @@ def main():
     Raises:
         Exception: Any exceptions from chat processing are handled internally
     """
+    # lazy import, the llm stack takes a long time to import
+    from topsailai.workspace.llm_shell import get_llm_chat
+
     # team
     team_member_name = get_member_name()
 
@@ -109,9 +112,7 @@ Directly output the content without any formatting.
 
     answer = llm_chat.chat()
     if answer:
-        symbol_start = os.getenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER") or (f"From '{team_member_name}':\n" if team_member_name else "")
-        if symbol_start and not answer.startswith(symbol_start.strip()):
-            answer = symbol_start + answer
+        answer = text_tool.add_answer_symbol(answer, team_member_name)
 
         file_path_result = os.getenv("TOPSAILAI_SAVE_RESULT_TO_FILE")
         if file_path_result:
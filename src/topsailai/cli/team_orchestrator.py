@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Team Orchestrator CLI - Run several AI team members in one process
+
+This module sends the same task to several team members and runs them
+concurrently in one process. Each member gets its own agent in a worker
+thread, so the Python startup, the env parsing and the chat history
+managers are paid once instead of once per team_agent.py subprocess.
+
+Usage:
+    team_orchestrator.py <member_name> [<member_name> ...]
+
+Author: DawsonLin
+Email: lin_dongsen@126.com
+Created: 2026-10-16
+
+Environment Variables:
+    SESSION_ID: Optional session identifier shared by all of the members
+    SYSTEM_PROMPT: Optional file path or content for system prompt
+    TOPSAILAI_TASK: Required, file path or content for the task
+    TOPSAILAI_TEAM_AGENT_SESSION_NEED_SAVE_MESSAGE: Set to "1" to save messages, "0" to not save (default: 0)
+    TOPSAILAI_TEAM_CONCURRENCY: Optional, max members running at the same time, default is the CPU count
+    TOPSAILAI_TEAM_SESSION_HEAD_AND_TAIL_OFFSET: Number for offset (msgs[:offset] + msgs[-offset:]), default is 7
+"""
+
+import asyncio
+import os
+import sys
+
+import _import_topsailai
+
+os.chdir(_import_topsailai.PROJECT_FOLDER_BASE)
+
+# Env
+os.environ["TOPSAILAI_COLLABORATION_MODE"] = "1"
+os.environ["TOPSAILAI_PROJECT_WORKSPACE_LOCK_ENABLED"] = "0"
+os.environ["TOPSAILAI_ENABLE_SESSION_LOCK"] = "0"
+
+from topsailai.ai_team.role import (
+    get_member_name,
+)
+from topsailai.ai_team.member_agent import (
+    get_system_prompt,
+)
+from topsailai.ai_team.manager import (
+    get_team_concurrency,
+)
+from topsailai.ai_team.common import (
+    get_session_head_tail_offset,
+)
+from topsailai.utils import (
+    env_tool,
+)
+
+
+def build_member_message(agent_name:str, message:str) -> str:
+    """
+    Prefix the message with the mention of the member, the same as team_agent.py.
+
+    Args:
+        agent_name (str): The member name, e.g. AIMember.mm-m25
+        message (str): The original input message.
+
+    Returns:
+        str: The message in format "@agent_name: message"
+    """
+    if agent_name not in message[:len(agent_name)+5]:
+        message = f"@{agent_name}: {message}"
+    return message
+
+
+def run_member(member_name:str, task:str) -> str|None:
+    """
+    Run one team member for the task, blocking.
+
+    The agent chat is created in the calling thread, so the agent name is
+    kept in the thread local of the worker thread.
+
+    Args:
+        member_name (str): The member name, with or without the "AIMember." prefix.
+        task (str): The task for the member.
+
+    Returns:
+        str or None: The final answer of the member.
+    """
+    # lazy import, the agent stack takes a long time to import
+    from topsailai.workspace.agent_shell import get_agent_chat
+
+    agent_name = get_member_name(member_name)
+
+    agent_chat = get_agent_chat(
+        system_prompt=get_system_prompt(agent_name),
+        disabled_tools=["agent_tool"],
+        agent_type="react",
+
+        agent_name=agent_name,
+        message=task,
+        session_head_tail_offset=get_session_head_tail_offset(),
+        need_print_session=False,
+        need_input_message=False,
+        need_project_workspace_lock=False,
+    )
+
+    return agent_chat.run(
+        times=1,
+        func_build_message=lambda message, **_: build_member_message(agent_name, message),
+        need_save_answer=env_tool.EnvReaderInstance.check_bool("TOPSAILAI_TEAM_AGENT_SESSION_NEED_SAVE_MESSAGE"),
+        need_confirm_abort=False,
+        need_symbol_for_answer=True,
+        only_save_final=True,
+    )
+
+
+async def run_members(member_names:list[str], task:str, concurrency:int=None) -> list:
+    """
+    Run the members concurrently, at most `concurrency` at the same time.
+
+    Args:
+        member_names (list[str]): The members to run.
+        task (str): The task for every member.
+        concurrency (int): Defaults to get_team_concurrency().
+
+    Returns:
+        list: The answers, in the order of member_names.
+    """
+    semaphore = asyncio.Semaphore(concurrency or get_team_concurrency())
+
+    async def _run(member_name):
+        async with semaphore:
+            return await asyncio.to_thread(run_member, member_name, task)
+
+    return await asyncio.gather(*[_run(member_name) for member_name in member_names])
+
+
+def main():
+    """
+    Main entry point for the Team Orchestrator.
+
+    Returns:
+        dict: key is the member name, value is the answer of the member.
+    """
+    member_names = [name for name in sys.argv[1:] if name.strip()]
+    if not member_names:
+        print(f"Usage: {os.path.basename(sys.argv[0])} <member_name> [<member_name> ...]")
+        return None
+
+    task = env_tool.EnvReaderInstance.read_file_or_content("TOPSAILAI_TASK")
+    if not task:
+        print("missing TOPSAILAI_TASK")
+        return None
+
+    # the agent chat reads sys.argv[1:] as the message,
+    # the member names must not be sent to the members
+    del sys.argv[1:]
+
+    answers = asyncio.run(run_members(member_names, task))
+    return dict(zip(member_names, answers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Unit tests for team_orchestrator.py."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+CLI_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+SRC_ROOT = os.path.abspath(os.path.join(CLI_ROOT, "..", "src"))
+sys.path.insert(0, SRC_ROOT)
+sys.path.insert(0, CLI_ROOT)
+
+# the module sets the team env and changes the folder on import
+_cwd = os.getcwd()
+with patch.dict(os.environ):
+    import team_orchestrator as orchestrator
+os.chdir(_cwd)
+
+
+class TestBuildMemberMessage:
+    def test_prefix_mention(self):
+        assert orchestrator.build_member_message("AIMember.a", "do it") == "@AIMember.a: do it"
+
+    def test_keep_existing_mention(self):
+        message = "@AIMember.a: do it"
+        assert orchestrator.build_member_message("AIMember.a", message) == message
+
+
+class TestRunMembers:
+    def test_members_run_concurrently_in_order(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _run_member(member_name, task):
+            # both members must be running at the same time to pass
+            barrier.wait()
+            return f"{member_name}:{task}"
+
+        with patch.object(orchestrator, "run_member", side_effect=_run_member):
+            answers = asyncio.run(orchestrator.run_members(["a", "b"], "task", concurrency=2))
+
+        assert answers == ["a:task", "b:task"]
+
+    def test_concurrency_limit(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def _run_member(member_name, task):
+            with lock:
+                running.append(member_name)
+                peak.append(len(running))
+            threading.Event().wait(0.05)
+            with lock:
+                running.remove(member_name)
+            return member_name
+
+        with patch.object(orchestrator, "run_member", side_effect=_run_member):
+            answers = asyncio.run(orchestrator.run_members(["a", "b", "c"], "task", concurrency=1))
+
+        assert answers == ["a", "b", "c"]
+        assert max(peak) == 1
+
+
+class TestMain:
+    def test_usage_without_members(self, capsys):
+        with patch.object(sys, "argv", ["team_orchestrator.py"]):
+            assert orchestrator.main() is None
+        assert "Usage" in capsys.readouterr().out
+
+    def test_answers_by_member(self):
+        with patch.object(sys, "argv", ["team_orchestrator.py", "a", "b"]), \
+            patch.object(orchestrator.env_tool.EnvReaderInstance, "read_file_or_content", return_value="task"), \
+            patch.object(orchestrator, "run_member", side_effect=lambda name, task: name.upper()):
+            assert orchestrator.main() == {"a": "A", "b": "B"}
+
+    def test_member_names_not_in_agent_message(self):
+        from topsailai.workspace import input_tool
+
+        messages = []
+
+        def _run_member(member_name, task):
+            # the same as get_agent_chat with need_input_message=False
+            messages.append(input_tool.get_message(need_input=False) + "\n" + task)
+            return member_name
+
+        with patch.object(sys, "argv", ["team_orchestrator.py", "alice", "bob"]), \
+            patch.object(orchestrator.env_tool.EnvReaderInstance, "read_file_or_content", return_value="task"), \
+            patch.object(orchestrator, "run_member", side_effect=_run_member):
+            assert orchestrator.main() == {"alice": "alice", "bob": "bob"}
+
+        assert messages == ["\ntask", "\ntask"]
@@ -153,6 +153,19 @@ class MessageStorageBase(object):
         """
         raise NotImplementedError
 
+    def add_messages(self, msgs: list[ChatHistoryMessageData]):
+        """
+        Add many messages, the same as add_message for each one.
+
+        Subclasses can override it to add the messages in one transaction.
+
+        Args:
+            msgs (list[ChatHistoryMessageData]): The messages to add.
+        """
+        for msg in msgs:
+            self.add_message(msg)
+        return
+
     def get_message(self, msg_id: str) -> ChatHistoryMessageData:
         """
         Retrieve a single message by its msg_id and update access metadata.
@@ -228,15 +241,15 @@ class ContextManager(MessageStorageBase):
     """
 
     # Roles that should be ignored when processing messages
-    ignored_roles = set([ROLE_SYSTEM, ROLE_USER])
+    ignored_roles = frozenset((ROLE_SYSTEM, ROLE_USER))
 
     # Step names that should be considered for archiving
-    attention_step_names = set(["action", "observation"])
+    attention_step_names = frozenset(("action", "observation"))
 
     # Prefix for archived message references
     prefix_raw_text_retrieve_msg = "retrieve_msg by msg_id="
 
-    def _link_msg_id(self, content_dict: dict):
+    def _link_msg_id(self, content_dict: dict, session_id: str = None, pending: list = None):
         """
         Link content to a message ID by archiving large content.
 
@@ -245,7 +258,12 @@ class ContextManager(MessageStorageBase):
 
         Args:
             content_dict (dict): The content dictionary to archive.
+            session_id (str, optional): The session of the message. Defaults to the current session.
+            pending (list, optional): If set, the archived message is appended to it
+                and the caller adds it to storage, instead of adding it here.
         """
+        if session_id is None:
+            session_id = get_session_id()
         # Extract message content from the dictionary
         message = None
         if len(content_dict) == 2 and "raw_text" in content_dict:
@@ -260,12 +278,15 @@ class ContextManager(MessageStorageBase):
         # Create a new message data object
         msg_obj = ChatHistoryMessageData(
             message=message,
-            session_id=get_session_id(),
+            session_id=session_id,
             msg_id=None,
         )
 
         # Add the message to storage
-        self.add_message(msg_obj)
+        if pending is None:
+            self.add_message(msg_obj)
+        else:
+            pending.append(msg_obj)
 
         # Replace original content with archive reference
         content_dict.clear()
@@ -302,8 +323,12 @@ class ContextManager(MessageStorageBase):
                 "tool_calls": str(msg["tool_calls"])
             }
 
-        # Skip non-JSON content
-        if content[0] not in ["{", "["]:
+        # Skip non-JSON content, e.g. empty string, multimodal list
+        if not isinstance(content, str) or not content.startswith(("{", "[")):
+            return None
+
+        # Skip the content without any attention step, no need to parse it
+        if not any(f'"{step_name}"' in content for step_name in self.attention_step_names):
             return None
 
         # Parse JSON content
@@ -316,6 +341,19 @@ class ContextManager(MessageStorageBase):
         return content_obj
 
 
+    @staticmethod
+    def _is_oversize(content_dict: dict, max_size: int) -> bool:
+        """
+        Check if len(str(content_dict)) > max_size.
+
+        str(content_dict) contains the repr of each value, a long string value
+        is enough to decide, the large content is not stringified.
+        """
+        for value in content_dict.values():
+            if isinstance(value, str) and len(value) > max_size:
+                return True
+        return len(str(content_dict)) > max_size
+
     def link_messages(self, messages, index_start=NON_SYSTEM_PROMPT_MESSAGE_INDEX, index_end=-11, max_size=1024):
         """
         Link large messages to storage by archiving them.
@@ -337,14 +375,17 @@ class ContextManager(MessageStorageBase):
             "[LinkMessages] some messages will be archived: index=[%s:%s], messages_length=[%s]",
             index_start, end_idx, len(messages)
         )
+        session_id = get_session_id()
+
+        # archived messages, they are added to storage at once
+        pending = []
+        # (message, the message before it is changed), to restore if failed to add
+        changed = []
         for msg in messages[index_start:end_idx]:
-            # Skip ignored roles (except for user messages with tool calls)
-            if msg["role"] in self.ignored_roles:
-                if msg["role"] == ROLE_USER and "tool_call_id" in msg:
-                    # User messages with tool calls need to be linked
-                    pass
-                else:
-                    continue
+            # Skip ignored roles (except for user messages with tool calls, they need to be linked)
+            role = msg["role"]
+            if role in self.ignored_roles and not (role == ROLE_USER and "tool_call_id" in msg):
+                continue
 
             content_obj = self.__get_content_object(msg)
 
@@ -354,7 +395,9 @@ class ContextManager(MessageStorageBase):
             # Process each content dictionary
             new_content_obj = []
             flag_changed = False
-            for content_dict in format_tool.to_list(content_obj):
+            # content_obj is a list or dict from json_load, or a dict of tool message
+            items = content_obj if isinstance(content_obj, list) else [content_obj]
+            for content_dict in items:
                 new_content_obj.append(content_dict)
 
                 # Check if this content should be considered for archiving
@@ -362,15 +405,16 @@ class ContextManager(MessageStorageBase):
                     continue
                 if content_dict["step_name"] not in self.attention_step_names:
                     continue
-                if len(str(content_dict)) <= max_size:
+                if not self._is_oversize(content_dict, max_size):
                     continue
 
                 # Archive large content
-                self._link_msg_id(content_dict)
+                self._link_msg_id(content_dict, session_id, pending)
                 flag_changed = True
 
             # Update message content if any changes were made
             if flag_changed:
+                changed.append((msg, dict(msg)))
                 msg["content"] = json_tool.json_dump(new_content_obj)
                 # DONOT DELETE "tool_call_id" DUE TO MAY CAUSE bad_request_error
                 #if "tool_call_id" in msg and msg['tool_call_id']:
@@ -378,6 +422,15 @@ class ContextManager(MessageStorageBase):
                 if "tool_calls" in msg and msg['tool_calls']:
                     del msg["tool_calls"]
 
+        if pending:
+            try:
+                self.add_messages(pending)
+            except Exception:
+                # the references are not stored, keep the original messages
+                for msg, old_msg in changed:
+                    msg.clear()
+                    msg.update(old_msg)
+                raise
         return
 
     def retrieve_message(self, msg_id: str) -> str:
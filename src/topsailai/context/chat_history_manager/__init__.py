@@ -14,10 +14,22 @@ Purpose: Manage chat history messages for AI Agent context management
 import os
 from topsailai.utils import module_tool
 
-# Dictionary containing all available chat history manager implementations
-# Key: Manager class name
-# Value: Manager class reference
-ALL_MANAGERS = module_tool.get_function_map(
-    "topsailai.context.chat_history_manager",
-    "MANAGERS",
-)
\ No newline at end of file
+
+def __getattr__(name):
+    """
+    Load ALL_MANAGERS on first access (PEP 562).
+
+    The managers are found by importing the submodules, e.g. sql imports SQLAlchemy,
+    it is slow and not needed if no manager is used.
+    """
+    if name == "ALL_MANAGERS":
+        # Dictionary containing all available chat history manager implementations
+        # Key: Manager class name
+        # Value: Manager class reference
+        value = module_tool.get_function_map(
+            "topsailai.context.chat_history_manager",
+            "MANAGERS",
+        )
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -133,6 +133,10 @@ class ChatHistorySQLAlchemy(ChatHistoryBase):
             connect_args["check_same_thread"] = False
             if ":memory:" in conn:
                 pool_kwargs["poolclass"] = StaticPool
+        else:
+            # drop the stale connections of the database server
+            pool_kwargs["pool_pre_ping"] = True
+            pool_kwargs["pool_recycle"] = 1800
 
         # Create database engine and session factory
         self.engine = create_engine(conn, connect_args=connect_args, **pool_kwargs)
@@ -195,6 +199,62 @@ class ChatHistorySQLAlchemy(ChatHistoryBase):
             # Always close the session
             session.close()
 
+    def add_messages(self, msgs: list[ChatHistoryMessageData]):
+        """
+        Add many messages in one transaction, see add_message.
+
+        Args:
+            msgs (list[ChatHistoryMessageData]): The messages to add.
+        """
+        if not msgs:
+            return
+
+        session = self.SessionLocal()
+        try:
+            msg_ids = set(msg.msg_id for msg in msgs)
+            existing_msg_ids = set(
+                row.msg_id for row in session.query(Message.msg_id).filter(Message.msg_id.in_(msg_ids))
+            )
+            existing_mappings = set(
+                (row.msg_id, row.session_id) for row in session.query(
+                    SessionMessage.msg_id, SessionMessage.session_id
+                ).filter(SessionMessage.msg_id.in_(msg_ids))
+            )
+
+            now = datetime.now()
+            for msg in msgs:
+                if msg.msg_id not in existing_msg_ids:
+                    existing_msg_ids.add(msg.msg_id)
+                    session.add(
+                        Message(
+                            msg_id=msg.msg_id,
+                            message=msg.message,
+                            msg_size=len(msg.message),
+                            access_count=0,
+                            create_time=now,
+                            access_time=now,
+                        )
+                    )
+
+                mapping_key = (msg.msg_id, msg.session_id)
+                if mapping_key not in existing_mappings:
+                    existing_mappings.add(mapping_key)
+                    session.add(
+                        SessionMessage(
+                            msg_id=msg.msg_id,
+                            session_id=msg.session_id,
+                            create_time=now,
+                        )
+                    )
+
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"add_messages failed: {e}")
+            raise e
+        finally:
+            session.close()
+
     def get_message(self, msg_id) -> ChatHistoryMessageData:
         """
         Retrieve a single message by its msg_id and update access metadata.
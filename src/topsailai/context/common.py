@@ -6,8 +6,9 @@
   Purpose:
 '''
 
+import time
+
 from topsailai.utils import (
-    time_tool,
     env_tool,
 )
 
@@ -26,6 +27,9 @@ def get_session_id() -> str:
         >>> get_session_id()
         '20260120123456'
     """
-    session_id = env_tool.get_session_id() or time_tool.get_current_date(with_t=True).replace('-', '')
+    session_id = env_tool.get_session_id()
+    if not session_id:
+        # the same as get_current_date(with_t=True) without '-' and ':'
+        return time.strftime("%Y%m%dT%H%M%S")
     session_id = session_id.replace(':', '')
     return session_id
@@ -7,6 +7,8 @@
 
 import os
 import time
+import queue
+import atexit
 import threading
 from typing import Optional
 
@@ -17,7 +19,6 @@ from topsailai.utils import (
     thread_local_tool,
 )
 
-from .chat_history_manager import ALL_MANAGERS
 from .chat_history_manager.__base import (
     ChatHistoryBase,
     ChatHistoryMessageData,
@@ -25,8 +26,36 @@ from .chat_history_manager.__base import (
 from .session_manager.__base import (
     SessionStorageBase,
     SessionData,
+    DEFAULT_CONN,
 )
-from .session_manager.sql import SessionSQLAlchemy, DEFAULT_CONN
+
+
+def __getattr__(name):
+    """
+    Import the SQLAlchemy backends on first use (PEP 562),
+    SQLAlchemy is slow to import and not needed without any manager.
+    """
+    if name == "ALL_MANAGERS":
+        from .chat_history_manager import ALL_MANAGERS as value
+    elif name == "SessionSQLAlchemy":
+        from .session_manager.sql import SessionSQLAlchemy as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _get_lazy_global(name:str):
+    """ the global of this module, it is loaded by __getattr__ if missing """
+    module_globals = globals()
+    if name in module_globals:
+        return module_globals[name]
+    return __getattr__(name)
+
+
+# key is (CONTEXT_HISTORY_MANAGERS, count), value is list[ChatHistoryBase]
+g_managers_cache = {}
+g_managers_lock = threading.Lock()
 
 
 def get_managers_by_env(count=10) -> list[ChatHistoryBase]:
@@ -53,7 +82,27 @@ def get_managers_by_env(count=10) -> list[ChatHistoryBase]:
     if not env_ctx_history_managers:
         return
 
+    # managers are reused, every message append must not open a new engine
+    cache_key = (env_ctx_history_managers, count)
+    with g_managers_lock:
+        mgrs = g_managers_cache.get(cache_key)
+        if mgrs is None:
+            mgrs = _new_managers(env_ctx_history_managers, count)
+            if mgrs:
+                g_managers_cache[cache_key] = mgrs
+    return list(mgrs)
+
+
+def reset_managers_cache():
+    """ drop the cached chat history managers """
+    with g_managers_lock:
+        g_managers_cache.clear()
+
+
+def _new_managers(env_ctx_history_managers:str, count:int) -> list[ChatHistoryBase]:
+    """ instantiate the chat history managers of CONTEXT_HISTORY_MANAGERS """
     mgrs = []
+    all_managers = _get_lazy_global("ALL_MANAGERS")
 
     # Parse manager specifications from environment variable
     # Format: "manager_name param1=value1 param2=value2;"
@@ -67,7 +116,7 @@ def get_managers_by_env(count=10) -> list[ChatHistoryBase]:
         mgr_name = mgr_list[0]
 
         # Validate manager name
-        if mgr_name not in ALL_MANAGERS:
+        if mgr_name not in all_managers:
             logger.warning(f"invalid context history manager: [{mgr}]")
             continue
 
@@ -90,7 +139,7 @@ def get_managers_by_env(count=10) -> list[ChatHistoryBase]:
 
         # Instantiate the manager
         mgrs.append(
-            ALL_MANAGERS[mgr_name](*args, **kwargs)
+            all_managers[mgr_name](*args, **kwargs)
         )
 
         # Stop if we've reached the maximum count
@@ -105,6 +154,27 @@ def get_managers_by_env(count=10) -> list[ChatHistoryBase]:
     return mgrs
 
 
+# key is conn, value is SessionStorageBase
+g_session_managers = {}
+g_session_managers_lock = threading.Lock()
+
+
+def _get_session_manager_by_conn(conn:str) -> SessionStorageBase:
+    """ the session manager is reused by conn, its engine and pool are kept warm """
+    with g_session_managers_lock:
+        session_mgr = g_session_managers.get(conn)
+        if session_mgr is None:
+            session_mgr = _get_lazy_global("SessionSQLAlchemy")(conn)
+            g_session_managers[conn] = session_mgr
+    return session_mgr
+
+
+def reset_session_managers():
+    """ drop the cached session managers """
+    with g_session_managers_lock:
+        g_session_managers.clear()
+
+
 def get_session_manager(conn=None, default_conn=DEFAULT_CONN) -> SessionStorageBase:
     """
     Get a session manager instance with fallback logic.
@@ -128,17 +198,17 @@ def get_session_manager(conn=None, default_conn=DEFAULT_CONN) -> SessionStorageB
     """
     # Priority 1: Use provided connection string
     if conn:
-        return SessionSQLAlchemy(conn)
+        return _get_session_manager_by_conn(conn)
 
     # Priority 2: Get manager from environment configuration
     mgrs = get_managers_by_env(1)
     if mgrs:
         msg_mgr = mgrs[0]
-        return SessionSQLAlchemy(msg_mgr.conn)
+        return _get_session_manager_by_conn(msg_mgr.conn)
 
     # Priority 3: Use default connection string
     if default_conn:
-        return SessionSQLAlchemy(default_conn)
+        return _get_session_manager_by_conn(default_conn)
 
     # If all options fail, raise exception
     raise Exception("fail to get session manager")
@@ -174,6 +244,9 @@ def get_messages_by_session(
     if not session_id:
         return []
 
+    # read what was added
+    flush_session_messages()
+
     # Create session manager if not provided
     if session_mgr is None:
         session_mgr = get_session_manager()
@@ -407,10 +480,48 @@ def create_session(session_id:str, task:str, session_name:str=None, session_mgr:
     return True
 
 
+# background writer of session messages, see TOPSAILAI_SESSION_ASYNC_WRITE
+g_session_write_queue = None
+g_session_write_lock = threading.Lock()
+
+def _session_writer(q:queue.Queue):
+    """ single consumer, the messages are written in order """
+    while True:
+        history_mgrs, session_id, message = q.get()
+        try:
+            for mgr in history_mgrs:
+                mgr.add_session_message(message, session_id=session_id)
+        except Exception as e:
+            logger.exception("failed to write session message: session_id=%s, %s", session_id, e)
+        finally:
+            q.task_done()
+
+def _get_session_write_queue() -> queue.Queue:
+    """ return the queue of the background writer, start it at the first call """
+    global g_session_write_queue
+    with g_session_write_lock:
+        if g_session_write_queue is None:
+            g_session_write_queue = queue.Queue()
+            threading.Thread(
+                target=_session_writer,
+                args=(g_session_write_queue,),
+                name="session_writer",
+                daemon=True,
+            ).start()
+            atexit.register(flush_session_messages)
+    return g_session_write_queue
+
+def flush_session_messages():
+    """ wait until the queued session messages are written """
+    if g_session_write_queue is not None:
+        g_session_write_queue.join()
+
 def add_session_message(session_id:str, message:dict) -> bool:
     """
     Add a message to a session across all configured chat history managers.
 
+    The message is queued to a background writer when TOPSAILAI_SESSION_ASYNC_WRITE is enabled.
+
     Args:
         session_id (str): The session identifier to add the message to.
         message (dict): The message content to add.
@@ -423,6 +534,11 @@ def add_session_message(session_id:str, message:dict) -> bool:
     if not history_mgrs:
         return False
 
+    if env_tool.EnvReaderInstance.check_bool("TOPSAILAI_SESSION_ASYNC_WRITE"):
+        # the caller may change the message later
+        _get_session_write_queue().put((history_mgrs, session_id, dict(message)))
+        return True
+
     # Add message to all managers
     for mgr in history_mgrs:
         mgr.add_session_message(message, session_id=session_id)
@@ -438,6 +554,9 @@ def del_session_messages(session_id:str, message_ids:list[str]) -> bool:
     if not message_ids:
         return False
 
+    # the messages to delete may be still queued
+    flush_session_messages()
+
     message_ids = to_list(message_ids)
     # Add message to all managers
     for mgr in history_mgrs:
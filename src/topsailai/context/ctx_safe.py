@@ -19,6 +19,7 @@ MAX_MSG_SIZE = env_tool.EnvReaderInstance.get(
 LARGE_MSG_SIZE = 10000 + MAX_MSG_SIZE
 
 SUFFIX_TRUNCATE = " ... (force to truncate)"
+SUFFIX_TRUNCATE_BYTES = SUFFIX_TRUNCATE.encode("utf-8")
 
 
 def is_need_truncate(msg_len: int) -> bool:
@@ -35,6 +36,10 @@ def is_need_truncate(msg_len: int) -> bool:
         - AgentWriter has a higher threshold (LARGE_MSG_SIZE) than other agents (MAX_MSG_SIZE)
         - This allows AgentWriter to handle larger content while maintaining size limits for other agents
     """
+    # Below both limits, the agent does not matter
+    if msg_len < MAX_MSG_SIZE:
+        return False
+
     # Get the current agent name from thread-local storage
     agent_name = get_agent_name()
 
@@ -52,6 +57,17 @@ def is_need_truncate(msg_len: int) -> bool:
     return False
 
 
+def _get_utf8_cut_size(data:bytes, size:int) -> int:
+    """ move the cut back to the start of a UTF-8 character, 3 bytes at most """
+    if size >= len(data):
+        return len(data)
+    cut = size
+    # 0b10xxxxxx is a continuation byte
+    while cut > size - 3 and cut > 0 and (data[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return cut
+
+
 def truncate_message(msg) -> str | bytes:
     """
     Truncate a message to the maximum allowed size with appropriate suffix.
@@ -65,27 +81,26 @@ def truncate_message(msg) -> str | bytes:
     Note:
         - If the message is truncated, a suffix " ... (force to truncate)" is added
         - The function handles both string and bytes input types
+        - The bytes message is cut at the start of a UTF-8 character
         - A warning message is printed when truncation occurs
     """
-    suffix = ""
+    # bytes are not cut in the middle of a UTF-8 character
+    if isinstance(msg, bytes):
+        cut_size = _get_utf8_cut_size(msg, MAX_MSG_SIZE)
+    else:
+        cut_size = MAX_MSG_SIZE
 
     # Check if truncation is needed based on message length
-    if is_need_truncate(len(msg)):
-        # Print error message indicating truncation
-        print_tool.print_error(f"truncate message with the size: [{MAX_MSG_SIZE}]")
-        # Set truncation suffix
-        suffix = SUFFIX_TRUNCATE
+    if not is_need_truncate(len(msg)):
+        return msg[:cut_size]
+
+    # Print error message indicating truncation
+    print_tool.print_error(f"truncate message with the size: [{MAX_MSG_SIZE}]")
 
-    # Handle bytes type message
+    # Return truncated message (first MAX_MSG_SIZE characters) plus suffix of the same type
     if isinstance(msg, bytes):
-        if suffix:
-            # Convert string suffix to bytes for consistency
-            suffix = bytes(suffix, "utf-8")
-        else:
-            suffix = b""
-
-    # Return truncated message (first MAX_MSG_SIZE characters) plus suffix
-    return msg[:MAX_MSG_SIZE] + suffix
+        return msg[:cut_size] + SUFFIX_TRUNCATE_BYTES
+    return msg[:cut_size] + SUFFIX_TRUNCATE
 
 
 def truncate_text(text:str, size:int) -> str:
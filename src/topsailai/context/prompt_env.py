@@ -104,8 +104,12 @@ class CurrentSystem(_Base):
     collected from the operating system.
     """
 
-    # Class-level system info to avoid repeated system calls
-    system_info = get_system_info()
+    # Class-level system info to avoid repeated system calls,
+    # it is collected on the first prompt, not at import
+    system_info = None
+
+    # (system_info, prompt), the prompt is formatted once for the system_info
+    _prompt_cache = (None, "")
 
     @property
     def prompt(self) -> str:
@@ -116,11 +120,17 @@ class CurrentSystem(_Base):
             str: Formatted string containing system information
                  with each item on a separate line
         """
-        result = "SystemInfo:\n"
+        system_info = self.system_info
+        if system_info is None:
+            system_info = CurrentSystem.system_info = get_system_info()
+
+        cached_info, cached_prompt = CurrentSystem._prompt_cache
+        if cached_info is system_info:
+            return cached_prompt
+
         # Format each system info item with bullet points
-        for k, v in self.system_info.items():
-            if v:
-                result += f"- {k}:{v}\n"
+        result = "SystemInfo:\n" + "".join(f"- {k}:{v}\n" for k, v in system_info.items() if v)
+        CurrentSystem._prompt_cache = (system_info, result)
         return result
 
 
@@ -178,6 +188,38 @@ def get_prompt_file_path(relative_path:str) -> str:
     return ""
 
 
+# key is file path, value is ((st_mtime_ns, st_size), content)
+g_env_prompt_files = {}
+
+
+def read_env_prompt_file(file_path:str) -> str:
+    """
+    Read the ENV_PROMPT file, the content is read again only if the file is changed.
+
+    Args:
+        file_path (str): the file path
+
+    Returns:
+        str: the file content
+    """
+    stat = os.stat(file_path)
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    item = g_env_prompt_files.get(file_path)
+    if item and item[0] == stat_key:
+        return item[1]
+
+    with open(file_path, encoding='utf-8') as fp:
+        content = fp.read()
+    g_env_prompt_files[file_path] = (stat_key, content)
+    return content
+
+
+def reset_env_prompt_files():
+    """ drop the cached ENV_PROMPT files """
+    g_env_prompt_files.clear()
+    return
+
+
 def generate_prompt_for_env() -> str:
     """
     Generate a comprehensive environment prompt for AI context.
@@ -202,8 +244,7 @@ def generate_prompt_for_env() -> str:
     if env_prompt:
         env_prompt_file = get_prompt_file_path(env_prompt)
         if env_prompt_file:
-            with open(env_prompt_file, encoding='utf-8') as fp:
-                env_prompt = fp.read()
+            env_prompt = read_env_prompt_file(env_prompt_file)
 
     # Combine all prompt components with proper formatting
     return "# Environment\n" + "\n".join(
@@ -13,6 +13,9 @@ from topsailai.context.chat_history_manager.__base import (
     ChatHistoryMessageData,
 )
 
+# default connection of the session storage
+DEFAULT_CONN = "sqlite:///memory.db"
+
 class SessionData(object):
     """
     Data container for a single session in the AI engineering framework.
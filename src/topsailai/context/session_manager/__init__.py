@@ -15,10 +15,17 @@ Created: 2025-10-29
 """
 
 from .__base import SessionData, SessionStorageBase
-from .sql import SessionSQLAlchemy
 
 __all__ = [
     'SessionData',
     'SessionStorageBase', 
     'SessionSQLAlchemy'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """ import SessionSQLAlchemy on first access (PEP 562), SQLAlchemy is slow to import """
+    if name == "SessionSQLAlchemy":
+        from .sql import SessionSQLAlchemy
+        return SessionSQLAlchemy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
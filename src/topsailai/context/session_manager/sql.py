@@ -23,9 +23,7 @@ from datetime import datetime, timedelta
 from topsailai.context.chat_history_manager.sql import ChatHistorySQLAlchemy
 from topsailai.logger.log_chat import logger
 
-from .__base import SessionStorageBase, SessionData
-
-DEFAULT_CONN = "sqlite:///memory.db"
+from .__base import SessionStorageBase, SessionData, DEFAULT_CONN
 
 Base = declarative_base()
 
@@ -81,6 +79,10 @@ class SessionSQLAlchemy(SessionStorageBase):
             connect_args["check_same_thread"] = False
             if ":memory:" in conn:
                 pool_kwargs["poolclass"] = StaticPool
+        else:
+            # drop the stale connections of the database server
+            pool_kwargs["pool_pre_ping"] = True
+            pool_kwargs["pool_recycle"] = 1800
         self.engine = create_engine(conn, connect_args=connect_args, **pool_kwargs)
         Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -15,6 +15,7 @@ import threading
 from typing import Optional
 
 import tiktoken
+import tiktoken.model
 
 from topsailai.logger.log_chat import logger
 from topsailai.utils.print_tool import print_info
@@ -88,12 +89,51 @@ class CompletionUsage(BaseModel):
 #####################################################################
 
 
+# key is encoding name, value is the encoding object, None if it cannot be loaded
+g_encodings = {}
+g_encodings_lock = threading.Lock()
+
+
+def get_encoding(encoding_name="cl100k_base"):
+    """
+    Get the tiktoken encoding, it is loaded once in the process.
+
+    The failure is cached too, loading the BPE file may need network,
+    it should not be retried on every count.
+
+    Args:
+        encoding_name (str): The encoding name.
+
+    Returns:
+        Encoding: None if the encoding cannot be loaded.
+    """
+    if encoding_name in g_encodings:
+        return g_encodings[encoding_name]
+
+    with g_encodings_lock:
+        if encoding_name not in g_encodings:
+            try:
+                g_encodings[encoding_name] = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                logger.warning(f"failed to get encoding [{encoding_name}]: {e}")
+                g_encodings[encoding_name] = None
+        return g_encodings[encoding_name]
+
+
+def reset_encodings():
+    """ drop the loaded encodings """
+    with g_encodings_lock:
+        g_encodings.clear()
+    return
+
+
 def count_tokens(text, encoding_name="cl100k_base"):
     """
     Count the number of tokens in the given text using the specified encoding.
 
     This function uses the tiktoken library to encode text and count tokens,
     which is essential for managing LLM API costs and context window limits.
+    The special tokens (e.g. <|endoftext|>) in the text are counted as plain text.
 
     Args:
         text (str): The text to count tokens for. Can be any string content.
@@ -113,12 +153,14 @@ def count_tokens(text, encoding_name="cl100k_base"):
         >>> count_tokens("Hello world", "gpt2")
         3
     """
-    try:
-        # Get the encoding object for the specified encoding name
-        encoding = tiktoken.get_encoding(encoding_name)
+    # Get the encoding object for the specified encoding name
+    encoding = get_encoding(encoding_name)
+    if encoding is None:
+        return 0
 
+    try:
         # Encode the text into tokens and count the length
-        tokens = encoding.encode(text)
+        tokens = encoding.encode_ordinary(text)
         return len(tokens)
 
     except Exception as e:
@@ -127,6 +169,24 @@ def count_tokens(text, encoding_name="cl100k_base"):
         return 0
 
 
+def get_msg_cache_key(msg):
+    """
+    Get the key to cache the token count of a message.
+
+    A dict message whose values are all strings is keyed by its items, the hashes
+    of the strings are cached by Python, so the message is not stringified again.
+
+    Args:
+        msg: a message, dict or any object that can be converted to string
+
+    Returns:
+        hashable: the key
+    """
+    if isinstance(msg, dict) and all(isinstance(v, str) for v in msg.values()):
+        return tuple(msg.items())
+    return hash(msg if isinstance(msg, str) else str(msg))
+
+
 def count_tokens_for_model(text, model_name="gpt-4"):
     """
     Count tokens for a specific model using its default encoding.
@@ -153,8 +213,10 @@ def count_tokens_for_model(text, model_name="gpt-4"):
         2
     """
     try:
-        # Get the encoding specifically designed for the model
-        encoding = tiktoken.encoding_for_model(model_name)
+        # Get the encoding specifically designed for the model, it is loaded once
+        encoding = get_encoding(tiktoken.model.encoding_name_for_model(model_name))
+        if encoding is None:
+            return 0
 
         # Encode the text and count the resulting tokens
         tokens = encoding.encode(text)
@@ -192,6 +254,7 @@ class TokenStat(threading.Thread):
         _last_msg_time (int): Timestamp of the last message processed
         buffer: Temporary storage for incoming messages
         rlock (threading.RLock): Reentrant lock for thread-safe operations
+        cond (threading.Condition): Condition of rlock, notified when the buffer is set
         flag_running (bool): Control flag for thread execution
         first_byte_sum_ms (float): Sum of first-byte times for stream responses
         first_byte_count (int): Number of stream responses with first-byte timing
@@ -244,9 +307,14 @@ class TokenStat(threading.Thread):
         # Thread synchronization and data management
         self.buffer = None          # Temporary message storage
         self.rlock = threading.RLock()  # Reentrant lock for thread safety
+        self.cond = threading.Condition(self.rlock)  # Wakes the thread up for a new buffer
 
         self.flag_running = True    # Control flag for thread execution
 
+        # (token count, text length) of the last messages, key is from get_msg_cache_key.
+        # The history prefix is the same across the turns, only the new messages are encoded.
+        self._tok_cache = {}
+
         # First-byte timing statistics for stream responses (milliseconds)
         self.first_byte_sum_ms = 0.0
         self.first_byte_count = 0
@@ -377,6 +445,40 @@ class TokenStat(threading.Thread):
             if self.first_byte_min_ms is None or first_byte_ms < self.first_byte_min_ms:
                 self.first_byte_min_ms = first_byte_ms
 
+    def count_msgs(self, msgs):
+        """
+        Count the tokens and the text length of the messages.
+
+        For a list of messages, each message is counted by itself and the counts are
+        cached by get_msg_cache_key, the unchanged history is not encoded again.
+        The cache only keeps the messages of the last call.
+
+        Args:
+            msgs: list of messages, or any object that can be converted to string
+
+        Returns:
+            tuple: (token count, text length)
+        """
+        if not isinstance(msgs, list):
+            if not isinstance(msgs, str):
+                msgs = str(msgs)
+            return count_tokens(msgs), len(msgs)
+
+        token_count = 0
+        text_len = 0
+        tok_cache = {}
+        for msg in msgs:
+            key = get_msg_cache_key(msg)
+            item = tok_cache.get(key) or self._tok_cache.get(key)
+            if item is None:
+                text = msg if isinstance(msg, str) else str(msg)
+                item = (count_tokens(text), len(text))
+            tok_cache[key] = item
+            token_count += item[0]
+            text_len += item[1]
+        self._tok_cache = tok_cache
+        return token_count, text_len
+
     def add_msgs(self, msgs):
         """
         Add messages to the buffer for token calculation.
@@ -411,6 +513,9 @@ class TokenStat(threading.Thread):
             # Update timestamp for last message activity
             self._last_msg_time = int(time.time())
 
+            # Wake up the thread to count the buffer
+            self.cond.notify()
+
     def run(self):
         """
         Main thread loop for processing token statistics.
@@ -421,17 +526,14 @@ class TokenStat(threading.Thread):
         - Thread lifecycle management based on lifetime and idle time
         - Resource cleanup and graceful shutdown
 
-        The loop runs with a 10ms sleep interval to balance responsiveness
-        and CPU usage efficiency.
+        The loop waits on the condition, it is woken up by add_msgs, and at
+        least once per second to see flag_running and the lifetime.
         """
         # Set running flag to indicate thread is active
         self.flag_running = True
 
-        # Control frequency for lifetime checks
-        count_freq = 0
-        need_freq = False
-        if self._end_time:
-            need_freq = True
+        # Time of the next lifetime check
+        next_check_time = 0
 
         # Maximum idle time before considering shutdown (10 minutes)
         max_idle_time = 600
@@ -463,35 +565,28 @@ class TokenStat(threading.Thread):
 
         # Main thread execution loop
         while self.flag_running:
-            # Perform lifetime check periodically if needed
-            if need_freq:
-                count_freq += 1
-                # Check every 10 seconds (1000 iterations * 0.01 sleep)
-                if count_freq > 1000:
-                    count_freq = 0
+            # Perform lifetime check every 10 seconds if needed
+            if self._end_time:
+                now_ts = time.monotonic()
+                if now_ts >= next_check_time:
+                    next_check_time = now_ts + 10
                     if not check():
                         break
 
-            # Short sleep to prevent excessive CPU usage
-            time.sleep(0.01)
+            # Sleep until there are messages in the buffer to process
+            with self.cond:
+                if not self.buffer:
+                    self.cond.wait(timeout=1)
 
-            # Check if there are messages in the buffer to process
-            buffer = self.buffer
-            if not buffer:
-                continue
+                buffer = self.buffer
+                if not buffer:
+                    continue
 
-            # Process the buffered messages
-            with self.rlock:
                 # Clear the buffer to indicate processing has started
                 self.buffer = None
 
-                # Convert messages to string for token counting
-                if not isinstance(buffer, str):
-                    buffer = str(buffer)
-
-                # Calculate text length and token count
-                self.current_text_len = len(buffer)
-                self.current_count = count_tokens(buffer)
+                # Calculate token count and text length
+                self.current_count, self.current_text_len = self.count_msgs(buffer)
 
                 # Update cumulative statistics
                 self.total_count += self.current_count
@@ -6,6 +6,7 @@
 '''
 
 import os
+from functools import lru_cache
 
 from topsailai.logger import logger
 from topsailai.utils import env_tool
@@ -86,6 +87,27 @@ def read_prompt(relative_path):
 
     return ""
 
+@lru_cache(maxsize=8)
+def _read_prompt_file(file_path:str, mtime_ns:int) -> str:
+    """ file content, cached by (path, mtime) so an edited file is read again """
+    with open(file_path, encoding='utf-8') as fd:
+        return fd.read()
+
+def get_system_prompt_content(system_prompt:str=None) -> str:
+    """ return string for system prompt content.
+
+    :system_prompt: file path or content, default is env SYSTEM_PROMPT
+    """
+    if not system_prompt:
+        system_prompt = os.getenv("SYSTEM_PROMPT")
+    if not system_prompt:
+        return ""
+    try:
+        mtime_ns = os.stat(system_prompt).st_mtime_ns
+    except (OSError, ValueError):
+        return system_prompt
+    return _read_prompt_file(system_prompt, mtime_ns)
+
 def is_only_pure_system_prompt() -> bool:
     """ only the working mode. """
     return os.getenv("PURE_SYSTEM_PROMPT", "0") == "1"
@@ -288,6 +310,13 @@ def get_prompt_by_tools(tools:list[str], need_reload=False) -> str:
 
     return prompt_content
 
+# key is the tools signature, value is the final tool prompt
+g_tool_prompt_cache = {}
+
+def reset_tool_prompt_cache():
+    """ drop all cached tool prompts """
+    g_tool_prompt_cache.clear()
+
 def generate_prompt_by_tools(tools:list[str]|dict, need_reload=False) -> str:
     """ generate final tool prompt as system prompt """
     tools_name = None
@@ -298,9 +327,29 @@ def generate_prompt_by_tools(tools:list[str]|dict, need_reload=False) -> str:
         tools_name = list(tools.keys())
         tools_map = tools
 
-    tool_prompt = ""
     tools_name.sort()
 
+    # every agent with the same tools gets the same prompt
+    cache_key = (
+        tuple(tools_name),
+        tuple(getattr(tools_map[tool_name], "__doc__", None) for tool_name in tools_name) if tools_map else (),
+        env_tool.is_use_tool_calls(),
+        os.getenv("TOPSAILAI_EXTRA_TOOLS"),
+        os.getenv("EXTRA_TOOLS"),
+    )
+    if not need_reload:
+        tool_prompt = g_tool_prompt_cache.get(cache_key)
+        if tool_prompt is not None:
+            return tool_prompt
+
+    tool_prompt = _generate_prompt_by_tools(tools_name, tools_map, need_reload=need_reload)
+    g_tool_prompt_cache[cache_key] = tool_prompt
+    return tool_prompt
+
+def _generate_prompt_by_tools(tools_name:list[str], tools_map:dict=None, need_reload=False) -> str:
+    """ build the tool prompt without cache """
+    tool_prompt = ""
+
     if not env_tool.is_use_tool_calls():
         # get tool docs as prompt
         from topsailai.tools.base.common import get_tool_prompt
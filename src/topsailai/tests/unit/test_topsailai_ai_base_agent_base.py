@@ -247,6 +247,37 @@ class TestAgentBaseRun(unittest.TestCase):
 
         self.assertIsNone(get_agent2llm_message_source())
 
+    def test_arun_runs_in_worker_thread(self):
+        """Test arun awaits run in a worker thread."""
+        import asyncio
+        import threading
+        from topsailai.ai_base.agent_base import AgentBase
+
+        agent = AgentBase(
+            system_prompt="You are a helpful assistant",
+            tools={"tool1": MagicMock()},
+            agent_name="TestAgent"
+        )
+        threads = []
+
+        def fake_run(step_call, user_input):
+            threads.append(threading.current_thread())
+            return f"result:{user_input}"
+
+        agent._run = MagicMock(side_effect=fake_run)
+        agent.flag_dump_messages = False
+
+        async def main():
+            return await asyncio.gather(
+                agent.arun(self.step_call_mock, "a"),
+                agent.arun(self.step_call_mock, "b"),
+            )
+
+        result = asyncio.run(main())
+
+        self.assertEqual(result, ["result:a", "result:b"])
+        self.assertNotIn(threading.main_thread(), threads)
+
 
 class TestAgentRunRunEdgeCases(unittest.TestCase):
     """Test AgentRun._run edge cases with proper setup."""
@@ -340,6 +371,58 @@ class TestAgentRunRunEdgeCases(unittest.TestCase):
 
         self.assertEqual(call_order, ["inject", "chat"])
 
+    def test_get_chat_tools_rebuilt_only_on_change(self):
+        """Test the chat tools are cached until the available tools change."""
+        from topsailai.ai_base.agent_base import AgentRun
+        import topsailai.ai_base.agent_base as module
+
+        agent = AgentRun(
+            system_prompt="You are a helpful assistant",
+            tools={},
+            agent_name="TestAgent"
+        )
+        agent.available_tools = {"tool1": MagicMock()}
+        module.get_tools_for_chat.reset_mock()
+        module.get_tools_for_chat.side_effect = lambda tools: {name: {} for name in tools}
+
+        self.assertEqual(agent.get_chat_tools(), {"tool1": {}})
+        self.assertEqual(agent.get_chat_tools(), {"tool1": {}})
+        module.get_tools_for_chat.assert_called_once()
+
+        agent.available_tools["tool2"] = MagicMock()
+        self.assertEqual(agent.get_chat_tools(), {"tool1": {}, "tool2": {}})
+        self.assertEqual(module.get_tools_for_chat.call_count, 2)
+
+    def test_run_reads_stream_env_once(self):
+        """Test _run reads LLM_RESPONSE_STREAM once for all iterations."""
+        from topsailai.ai_base.agent_base import AgentRun
+        import topsailai.ai_base.agent_base as module
+
+        agent = AgentRun(
+            system_prompt="You are a helpful assistant",
+            tools={},
+            agent_name="TestAgent"
+        )
+        agent.available_tools = {}
+        agent.messages = []
+        agent.new_session = MagicMock()
+        agent.add_assistant_message = MagicMock(side_effect=lambda *args, **kwargs: agent.messages.append({}))
+        agent.call_hooks_pre_chat = MagicMock()
+        agent.update_message_for_env = MagicMock()
+        agent.llm_model.chat = MagicMock(side_effect=[(MagicMock(), [{"step_name": "action"}]), (None, None)])
+
+        def _step_call(*args, **kwargs):
+            # make progress, then skip the rest of the response
+            agent.messages.append({})
+            raise module.AgentNoCareResult()
+
+        module.env_tool.EnvReaderInstance.check_bool.reset_mock()
+        result = agent._run(_step_call, "test input")
+
+        self.assertIsNone(result)
+        self.assertEqual(agent.llm_model.chat.call_count, 2)
+        module.env_tool.EnvReaderInstance.check_bool.assert_called_once_with("LLM_RESPONSE_STREAM")
+
 
 if __name__ == '__main__':
     unittest.main()
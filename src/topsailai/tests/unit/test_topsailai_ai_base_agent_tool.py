@@ -97,6 +97,34 @@ class TestAgentToolInit(unittest.TestCase):
         )
         self.assertIsNotNone(agent)
 
+    def test_init_excluded_tool_kits_by_prefix(self):
+        """Test excluded_tool_kits drops tool kits by name prefix."""
+        from topsailai.ai_base.agent_tool import AgentTool
+
+        tool_kits = ["file_tool", "cmd_tool", "agent_tool", "agent_tool2"]
+        with patch('topsailai.ai_base.agent_tool.prompt_tool.get_tools_by_env', side_effect=lambda x: x) as mock_by_env:
+            AgentTool(
+                system_prompt="You are a helpful assistant",
+                tool_kits=tool_kits,
+                excluded_tool_kits=["agent"],
+            )
+        mock_by_env.assert_called_once_with(["file_tool", "cmd_tool"])
+        # the caller's list is left as it is
+        self.assertEqual(tool_kits, ["file_tool", "cmd_tool", "agent_tool", "agent_tool2"])
+
+    def test_init_excluded_tool_kit_by_exact_name(self):
+        """Test an excluded tool kit name does not drop the tool kits it is a prefix of."""
+        from topsailai.ai_base.agent_tool import AgentTool
+
+        tool_kits = ["file_tool-read_file", "file_tool-read_file_lines", "file_tool-read_files"]
+        with patch('topsailai.ai_base.agent_tool.prompt_tool.get_tools_by_env', side_effect=lambda x: x) as mock_by_env:
+            AgentTool(
+                system_prompt="You are a helpful assistant",
+                tool_kits=tool_kits,
+                excluded_tool_kits=["file_tool-read_file"],
+            )
+        mock_by_env.assert_called_once_with(["file_tool-read_file_lines", "file_tool-read_files"])
+
 
 class TestAgentToolAttributes(unittest.TestCase):
     """Test cases for AgentTool attributes."""
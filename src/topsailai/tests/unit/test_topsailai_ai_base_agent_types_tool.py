@@ -69,6 +69,26 @@ class TestGetToolFunc(unittest.TestCase):
         result = get_tool_func({"other_tool": lambda: None}, "test_tool")
         self.assertIsNone(result)
 
+    def test_normalized_name_follows_new_tools(self):
+        """Test a tool added to the map is found by its normalized name."""
+        from topsailai.ai_base.agent_types.tool import get_tool_func
+
+        tool_map = {"x_tool.func1": lambda: 1}
+        self.assertIsNone(get_tool_func(tool_map, "x_tool-func2"))
+        tool_map["x_tool.func2"] = lambda: 2
+        self.assertEqual(get_tool_func(tool_map, "x_tool-func2")(), 2)
+
+    def test_normalized_name_follows_replaced_tools(self):
+        """Test a tool removed and another added, the map size is the same."""
+        from topsailai.ai_base.agent_types.tool import get_tool_func
+
+        tool_map = {"a.x": lambda: 1}
+        self.assertEqual(get_tool_func(tool_map, "a-x")(), 1)
+        del tool_map["a.x"]
+        tool_map["b.y"] = lambda: 2
+        self.assertEqual(get_tool_func(tool_map, "b-y")(), 2)
+        self.assertIsNone(get_tool_func(tool_map, "a-x"))
+
 
 class TestExecToolFunc(unittest.TestCase):
     """Test cases for exec_tool_func function."""
@@ -54,6 +54,9 @@ class TestLLMModelGetLLMModel(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        from topsailai.ai_base.llm_base import reset_llm_clients
+        reset_llm_clients()
+        self.addCleanup(reset_llm_clients)
         self.api_key = "test-api-key-123"
         self.api_base = "https://custom.api.endpoint.com/v1"
 
@@ -105,6 +108,27 @@ class TestLLMModelGetLLMModel(unittest.TestCase):
         
         mock_openai.assert_called_once()
 
+    @patch("topsailai.ai_base.llm_base.openai.OpenAI")
+    @patch("topsailai.ai_base.llm_base.logger")
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_get_llm_model_reuses_client(self, mock_base_init, mock_logger, mock_openai):
+        """Test get_llm_model shares one client per (api_key, api_base) until rebuild."""
+        from topsailai.ai_base.llm_base import LLMModel
+        model = LLMModel()
+        model.model_name = "test-model"
+
+        result1 = model.get_llm_model(api_key=self.api_key, api_base=self.api_base)
+        result2 = LLMModel().get_llm_model(api_key=self.api_key, api_base=self.api_base)
+        model.get_llm_model(api_key="other-key", api_base=self.api_base)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(mock_openai.call_count, 2)
+
+        model.models = []
+        model.rebuild_llm_models()
+        model.get_llm_model(api_key=self.api_key, api_base=self.api_base)
+        self.assertEqual(mock_openai.call_count, 4)
+
 
 class TestLLMModelCallLLMModel(unittest.TestCase):
     """Test cases for LLMModel.call_llm_model method."""
@@ -254,6 +278,35 @@ class TestLLMModelCallLLMModelByStream(unittest.TestCase):
         self.assertIn("first byte timeout threshold reached/exceeded", warning_msg)
         self.assertIn("0.1s", warning_msg)
 
+    @patch("topsailai.ai_base.llm_base.logger")
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_call_llm_model_by_stream_flushes_senders_on_failure(self, mock_base_init, mock_logger):
+        """Test the content senders are finished when a stream fails partway."""
+        import io
+        from topsailai.ai_base.llm_control.content_endpoint import ContentStdout
+
+        mock_chunk = MagicMock()
+        mock_chunk.choices = [MagicMock()]
+        mock_chunk.choices[0].delta.content = "partial"
+        mock_chunk.choices[0].delta.tool_calls = None
+
+        def _stream():
+            yield mock_chunk
+            raise ConnectionError("stream is broken")
+
+        sender = ContentStdout()
+        model = self._create_mock_model()
+        model.content_senders = [sender]
+        model.model.create.return_value = _stream()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout, \
+                patch.object(sender, "finish", wraps=sender.finish) as mock_finish:
+            with self.assertRaises(ConnectionError):
+                model.call_llm_model_by_stream(self.messages)
+
+        self.assertTrue(mock_stdout.getvalue().endswith("partial"))
+        mock_finish.assert_called_once()
+
     @patch("topsailai.ai_base.llm_base.logger")
     @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
     def test_call_llm_model_by_stream_yields_chunks(self, mock_base_init, mock_logger):
@@ -893,6 +946,38 @@ class TestLLMModelChat(unittest.TestCase):
         self.assertEqual(result, ["success"])
 
 
+    @patch.dict("os.environ", {"TOPSAILAI_LLM_RESPONSE_CACHE_SIZE": "8"})
+    @patch("topsailai.ai_base.llm_base.format_response")
+    @patch("topsailai.ai_base.llm_base.logger")
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_chat_deterministic_response_cached(self, mock_base_init, mock_logger, mock_format):
+        """Test a repeated chat with temperature 0 is answered from the response cache."""
+        from topsailai.ai_base.llm_control.response_cache import reset_response_cache
+        reset_response_cache()
+        self.addCleanup(reset_response_cache)
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].delta = MagicMock()
+        mock_response.choices[0].delta.content = "Cached content"
+        mock_response.choices[0].delta.tool_calls = None
+
+        mock_format.return_value = ["cached"]
+
+        model = self._create_mock_model()
+        model.temperature = 0
+        model.model.create.side_effect = lambda **_: iter([mock_response])
+
+        first = model.chat(self.messages, for_stream=True, for_response=True)
+        second = model.chat(self.messages, for_stream=True, for_response=True)
+        model.chat([{"role": "user", "content": "Other"}], for_stream=True)
+
+        self.assertEqual(model.model.create.call_count, 2)
+        self.assertEqual(second[1], ["cached"])
+        self.assertEqual(second[0].content, first[0].content)
+        self.assertIsNot(second[0], first[0])
+
+
 class TestLLMModelErrorHandling(unittest.TestCase):
     """Test cases for LLMModel error handling."""
 
@@ -1127,3 +1212,129 @@ class TestLLMModelChatAgentRuntimeInput(unittest.TestCase):
         mock_get_input.assert_called_once()
         mock_get_with_timeout.assert_not_called()
         mock_builtin.assert_called_once_with(">>> LLM Retry [yes/no] ")
+
+
+class TestLLMModelAsyncChat(unittest.TestCase):
+    """Test cases for LLMModel.achat and LLMModel.abatch_chat."""
+
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_achat_passes_arguments(self, mock_base_init):
+        """Test achat runs chat with the same arguments."""
+        import asyncio
+        from topsailai.ai_base.llm_base import LLMModel
+
+        model = LLMModel()
+        with patch.object(LLMModel, "chat", return_value="ok") as mock_chat:
+            result = asyncio.run(model.achat([{"role": "user", "content": "a"}], for_raw=True))
+
+        self.assertEqual(result, "ok")
+        mock_chat.assert_called_once_with([{"role": "user", "content": "a"}], for_raw=True)
+
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_abatch_chat_keeps_order_and_limits_concurrency(self, mock_base_init):
+        """Test abatch_chat returns results in order with at most `concurrency` chats at once."""
+        import asyncio
+        import threading
+        import time
+        from topsailai.ai_base.llm_base import LLMModel
+
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0}
+
+        def _chat(messages, **kwargs):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return messages[0]["content"]
+
+        model = LLMModel()
+        list_of_messages = [[{"role": "user", "content": str(i)}] for i in range(6)]
+        with patch.object(LLMModel, "chat", side_effect=_chat):
+            result = asyncio.run(model.abatch_chat(list_of_messages, concurrency=2, for_raw=True))
+
+        self.assertEqual(result, [str(i) for i in range(6)])
+        self.assertLessEqual(state["max_running"], 2)
+
+    @patch("topsailai.ai_base.llm_base.LLMModelBase.__init__", return_value=None)
+    def test_abatch_chat_overlapping_chats_have_own_state(self, mock_base_init):
+        """Test the overlapping chats do not share the token stat, senders and model selection."""
+        import asyncio
+        import threading
+        from topsailai.ai_base.llm_base import LLMModel
+
+        model = LLMModel()
+        model.models = [{"api_key": "k1", "_model": MagicMock()}, {"api_key": "k2", "_model": MagicMock()}]
+        model.model_config = {"api_key": "", "api_base": ""}
+        model.model = MagicMock()
+        model.tokenStat = MagicMock()
+        sender = MagicMock()
+        model.content_senders = [sender]
+
+        barrier = threading.Barrier(2, timeout=5)
+        used = []
+
+        def _create(chat_model, messages, **kwargs):
+            # both chats must be in the call at the same time to pass
+            chat_model.chat_model
+            barrier.wait()
+            used.append(chat_model)
+            response = MagicMock()
+            response.choices[0].message.content = messages[0]["content"]
+            return response
+
+        list_of_messages = [[{"role": "user", "content": "a"}], [{"role": "user", "content": "b"}]]
+        with patch.object(LLMModel, "_create_with_first_byte_timeout", autospec=True, side_effect=_create), \
+            patch.object(LLMModel, "get_response_usage", return_value=None), \
+            patch.object(LLMModel, "get_response_cache", return_value=(None, None)), \
+            patch.object(LLMModel, "fix_response_content", side_effect=lambda rsp_obj, rsp_content: rsp_content), \
+            patch.object(LLMModel, "check_response_content"):
+            result = asyncio.run(model.abatch_chat(list_of_messages, concurrency=2, for_raw=True))
+
+        self.assertEqual(result, ["a", "b"])
+        self.assertEqual(len(used), 2)
+        self.assertIsNot(used[0], used[1])
+        self.assertIsNot(used[0].tokenStat, used[1].tokenStat)
+        self.assertNotIn(model, used)
+        self.assertFalse(any(m.tokenStat.flag_running for m in used))
+        model.tokenStat.add_msgs.assert_not_called()
+        sender.send.assert_not_called()
+        self.assertEqual(model.model_config, {"api_key": "", "api_base": ""})
+
+
+class TestRetrySeconds(unittest.TestCase):
+    """Test cases for get_retry_seconds and get_retry_after."""
+
+    def test_backoff_range_grows(self):
+        """Test the backoff is in [3, 3*2**times] and capped at 120."""
+        from topsailai.ai_base.llm_base import get_retry_seconds
+
+        for times in range(1, 12):
+            upper = min(120, 3 * 2 ** min(times, 6))
+            for _ in range(20):
+                sec = get_retry_seconds(times)
+                self.assertGreaterEqual(sec, 3)
+                self.assertLessEqual(sec, upper)
+
+    def test_retry_after_is_used(self):
+        """Test Retry-After is used and clamped to the range."""
+        from topsailai.ai_base.llm_base import get_retry_seconds
+
+        self.assertEqual(get_retry_seconds(1, 17), 17)
+        self.assertEqual(get_retry_seconds(1, 1000), 120)
+        self.assertEqual(get_retry_seconds(1, 0.5), 3)
+
+    def test_get_retry_after(self):
+        """Test Retry-After is read from the response headers."""
+        from topsailai.ai_base.llm_base import get_retry_after
+
+        e = MagicMock()
+        e.response.headers = {"retry-after": "12"}
+        self.assertEqual(get_retry_after(e), 12.0)
+
+        e.response.headers = {}
+        self.assertIsNone(get_retry_after(e))
+
+        self.assertIsNone(get_retry_after(Exception("no response")))
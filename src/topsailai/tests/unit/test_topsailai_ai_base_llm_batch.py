@@ -0,0 +1,123 @@
+"""
+Unit tests for ai_base/llm_batch.py module.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import simplejson
+
+
+def _output_line(custom_id, content, status_code=200):
+    return simplejson.dumps({
+        "id": f"req_{custom_id}",
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 1,
+                "model": "test-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content},
+                    }
+                ],
+            },
+        },
+        "error": None,
+    })
+
+
+class TestBatchClient(unittest.TestCase):
+    """Test cases for BatchClient."""
+
+    def _create_client(self):
+        from topsailai.ai_base.llm_batch import BatchClient
+
+        llm_model = MagicMock()
+        llm_model.build_parameters_for_chat.side_effect = lambda messages, **kwargs: {
+            "model": "test-model",
+            "messages": messages,
+        }
+        llm_model.fix_response_content.side_effect = lambda rsp_obj, rsp_content: rsp_content
+        return BatchClient(llm_model, poll_interval=0)
+
+    def test_build_batch_file(self):
+        """Test one JSONL line per messages with custom_id by index."""
+        client = self._create_client()
+
+        content = client.build_batch_file([[{"role": "user", "content": "a"}], [{"role": "user", "content": "b"}]])
+
+        lines = [simplejson.loads(line) for line in content.decode("utf-8").splitlines()]
+        self.assertEqual([line["custom_id"] for line in lines], ["t0", "t1"])
+        self.assertEqual(lines[1]["url"], "/v1/chat/completions")
+        self.assertEqual(lines[1]["body"]["messages"], [{"role": "user", "content": "b"}])
+
+    def test_parse_results(self):
+        """Test the contents are demuxed by custom_id, failed rows are None."""
+        client = self._create_client()
+
+        result = client.parse_results("\n".join([
+            _output_line("t1", "second"),
+            _output_line("t0", "first"),
+            _output_line("t2", "", status_code=500),
+        ]))
+
+        self.assertEqual(result, {"t0": "first", "t1": "second", "t2": None})
+        self.assertEqual(client.llm_model.check_response_content.call_count, 2)
+
+    def test_parse_results_bad_rows(self):
+        """Test a malformed row or an empty choices list does not drop the other results."""
+        client = self._create_client()
+        empty_choices = simplejson.loads(_output_line("t1", "x"))
+        empty_choices["response"]["body"]["choices"] = []
+
+        result = client.parse_results("\n".join([
+            "{not json",
+            simplejson.dumps(empty_choices),
+            _output_line("t0", "first"),
+        ]))
+
+        self.assertEqual(result, {"t0": "first", "t1": None})
+
+    def test_client_does_not_select_model(self):
+        """Test the client is taken from llm_model.model, chat_model is not called."""
+        client = self._create_client()
+
+        self.assertIs(client.client, client.llm_model.model._client)
+
+    def test_chat_batch(self):
+        """Test chat_batch submits, polls until completed and downloads the output."""
+        client = self._create_client()
+        client.client = MagicMock()
+        client.client.batches.create.return_value = MagicMock(id="batch_1")
+        client.client.batches.retrieve.side_effect = [
+            MagicMock(status="in_progress"),
+            MagicMock(status="completed", output_file_id="file_out"),
+        ]
+        client.client.files.content.return_value = MagicMock(text=_output_line("t0", "first"))
+
+        result = client.chat_batch([[{"role": "user", "content": "a"}], [{"role": "user", "content": "b"}]])
+
+        self.assertEqual(result, {"t0": "first", "t1": None})
+        self.assertEqual(client.client.batches.retrieve.call_count, 2)
+        client.client.files.content.assert_called_once_with("file_out")
+
+    @patch("topsailai.ai_base.llm_batch.time.monotonic")
+    def test_wait_timeout(self, mock_monotonic):
+        """Test wait raises TimeoutError when the batch is not finished in time."""
+        mock_monotonic.side_effect = [0, 100]
+        client = self._create_client()
+        client.client = MagicMock()
+        client.client.batches.retrieve.return_value = MagicMock(status="in_progress")
+
+        with self.assertRaises(TimeoutError):
+            client.wait("batch_1", timeout=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -65,6 +65,19 @@ class TestParseModelSettings:
         assert result[0]["api_key"] == "key1"
         assert result[0]["api_base"] == "base1"
 
+    @patch.dict(os.environ, {"TOPSAILAI_MODEL_SETTINGS": "api_key=k1,model=m_cached"}, clear=False)
+    def test_parse_model_settings_cached(self):
+        """Test the settings are parsed once and each caller gets its own dicts."""
+        # the module may be reloaded by other tests, use the globals of the function
+        cache = parse_model_settings.__globals__["g_model_settings_cache"]
+
+        result1 = parse_model_settings()
+        result1[0]["_model"] = "model object"
+        result2 = parse_model_settings()
+
+        assert result2 == [{"api_key": "k1", "model": "m_cached"}]
+        assert any(key[0] == "api_key=k1,model=m_cached" for key in cache)
+
 
 class TestLLMModelBase:
     """Tests for LLMModelBase class."""
@@ -204,6 +217,30 @@ class TestLLMModelBase:
         assert params["top_p"] == 0.9
         assert params["frequency_penalty"] == 0.1
 
+    def test_build_parameters_for_chat_keeps_original_messages(self, monkeypatch):
+        """Test build_parameters_for_chat formats copies of the messages."""
+        monkeypatch.delenv("MAX_TOKENS", raising=False)
+
+        class TestModel(LLMModelBase):
+            def get_model_name(self, default=""):
+                return "test-model"
+            def get_llm_model(self, api_key=None, api_base=None):
+                return MagicMock()
+            def get_response_message(self, response):
+                return MagicMock()
+            def chat(self, *args, **kwargs):
+                pass
+
+        model = TestModel(model_name="gpt-4")
+
+        messages = [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi"}]
+        params = model.build_parameters_for_chat(messages)
+        params["messages"][1]["content"] = "formatted"
+
+        assert messages[1]["content"] == "Hi"
+        assert params["messages"][0] is not messages[0]
+        assert params["messages"][0] == messages[0]
+
     def test_get_llm_models_empty_settings(self, monkeypatch):
         """Test get_llm_models with empty settings."""
         monkeypatch.delenv("MAX_TOKENS", raising=False)
@@ -301,3 +338,27 @@ class TestLLMModelBaseEdgeCases:
 
         params = model.build_parameters_for_chat(messages, stream=False)
         assert params["stream"] is False
+
+    def test_debug_response_uses_model_dump_json(self, monkeypatch):
+        """Test debug_response serializes a pydantic response by model_dump_json."""
+        monkeypatch.delenv("MAX_TOKENS", raising=False)
+        monkeypatch.setenv("DEBUG", "1")
+        from openai.types.chat import ChatCompletionMessage
+
+        class TestModel(LLMModelBase):
+            def get_model_name(self, default=""):
+                return "test-model"
+            def get_llm_model(self, api_key=None, api_base=None):
+                return MagicMock()
+            def get_response_message(self, response):
+                return MagicMock()
+            def chat(self, *args, **kwargs):
+                pass
+
+        model = TestModel()
+        response = ChatCompletionMessage(role="assistant", content="")
+        # the module may be reloaded by other tests, patch the globals of the method
+        with patch.dict(LLMModelBase.debug_response.__globals__, {"print_debug": MagicMock()}):
+            model.debug_response(response, "")
+            mock_print_debug = LLMModelBase.debug_response.__globals__["print_debug"]
+            mock_print_debug.assert_called_once_with("[RESPONSE] \n" + response.model_dump_json(indent=2))
@@ -6,6 +6,7 @@ Purpose: Unit tests for ai_base/llm_control/content_endpoint.py
 """
 
 import pytest
+from unittest.mock import patch
 
 from topsailai.ai_base.llm_control.content_endpoint import (
     ContentSender,
@@ -58,6 +59,7 @@ class TestContentStdout:
         """send() should write the provided string to stdout."""
         sender = ContentStdout()
         sender.send("hello world")
+        sender.flush()
 
         captured = capsys.readouterr()
         assert captured.out == "hello world"
@@ -68,6 +70,7 @@ class TestContentStdout:
         sender = ContentStdout()
         content = "你好世界 🌍 café"
         sender.send(content)
+        sender.finish()
 
         captured = capsys.readouterr()
         assert captured.out == content
@@ -81,6 +84,38 @@ class TestContentStdout:
         assert captured.out == ""
 
     def test_finish_returns_true(self):
-        """finish() should inherit the base behavior and return True."""
+        """finish() should return True."""
         sender = ContentStdout()
         assert sender.finish() is True
+
+    def test_send_writes_every_token(self, capsys):
+        """send() should write every token at once, without waiting for the newline."""
+        sender = ContentStdout()
+        sender.send("hello")
+        assert capsys.readouterr().out == "hello"
+        sender.send(" world")
+        assert capsys.readouterr().out == " world"
+
+    def test_send_flushes_per_line_or_interval(self):
+        """send() should flush stdout at the end of a line, or after FLUSH_INTERVAL."""
+        sender = ContentStdout()
+        with patch("sys.stdout") as mock_stdout, \
+                patch("topsailai.ai_base.llm_control.content_endpoint.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            sender.send("first")
+            assert mock_stdout.flush.call_count == 1
+
+            sender.send(" token")
+            assert mock_stdout.flush.call_count == 1
+
+            sender.send("!\n")
+            assert mock_stdout.flush.call_count == 2
+
+            sender.send("slow")
+            assert mock_stdout.flush.call_count == 2
+            mock_monotonic.return_value = 101.0
+            sender.send(" token")
+            assert mock_stdout.flush.call_count == 3
+
+        assert [c.args[0] for c in mock_stdout.write.call_args_list] == \
+            ["first", " token", "!\n", "slow", " token"]
@@ -64,6 +64,24 @@ class TestToList:
         assert result == [42]
 
 
+class TestIsTopsailaiFormat:
+    """Test suite for _is_topsailai_format function."""
+
+    @pytest.mark.parametrize("response,expected", [
+        ("topsailai.thought\nthinking", True),
+        ("text\ntopsailai.action\n{}", True),
+        ("  topsailai.action\n{}", True),
+        ("text topsailai.thought\n", True),
+        ('{"step_name": "action"}', False),
+        ("text about topsailai.thought only", False),
+    ])
+    def test_is_topsailai_format(self, response, expected):
+        """Verify the markers of the topsailai format are detected."""
+        from topsailai.ai_base.llm_control.message import _is_topsailai_format
+
+        assert _is_topsailai_format(response) is expected
+
+
 class TestGetResponseMessage:
     """Test suite for get_response_message function."""
 
@@ -0,0 +1,114 @@
+"""
+Unit tests for ai_base/llm_control/response_cache.py module.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from topsailai.ai_base.llm_control import response_cache
+from topsailai.ai_base.llm_control.response_cache import (
+    LLMResponseCache,
+    build_response_cache_key,
+    get_response_cache,
+    normalize_messages_for_key,
+    reset_response_cache,
+)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for LLMResponseCache."""
+
+    def test_get_and_set(self):
+        cache = LLMResponseCache(2)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", ({"content": "x"}, "x"))
+        self.assertEqual(cache.get("a"), ({"content": "x"}, "x"))
+
+    def test_evicts_least_recently_used(self):
+        cache = LLMResponseCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+
+    @patch("topsailai.ai_base.llm_control.response_cache.time.monotonic")
+    def test_expired(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        cache = LLMResponseCache(2, ttl=10)
+        cache.set("a", 1)
+        mock_monotonic.return_value = 111
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+
+class TestGetResponseCache(unittest.TestCase):
+    """Test cases for get_response_cache."""
+
+    def setUp(self):
+        reset_response_cache()
+
+    def tearDown(self):
+        reset_response_cache()
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("TOPSAILAI_LLM_RESPONSE_CACHE_SIZE", None)
+            self.assertIsNone(get_response_cache())
+
+    def test_shared(self):
+        with patch.dict(os.environ, {"TOPSAILAI_LLM_RESPONSE_CACHE_SIZE": "3"}):
+            cache = get_response_cache()
+            self.assertIsNotNone(cache)
+            self.assertEqual(cache.max_size, 3)
+            self.assertIs(get_response_cache(), cache)
+            self.assertIs(response_cache.g_response_cache, cache)
+
+
+class TestBuildResponseCacheKey(unittest.TestCase):
+    """Test cases for build_response_cache_key."""
+
+    def test_key_ignores_dict_order(self):
+        key1 = build_response_cache_key({"model": "m", "messages": [{"role": "user", "content": "hi"}]})
+        key2 = build_response_cache_key({"messages": [{"content": "hi", "role": "user"}], "model": "m"})
+        self.assertEqual(key1, key2)
+
+    def test_key_changes_with_messages(self):
+        key1 = build_response_cache_key({"model": "m", "messages": [{"role": "user", "content": "hi"}]})
+        key2 = build_response_cache_key({"model": "m", "messages": [{"role": "user", "content": "hello"}]})
+        self.assertNotEqual(key1, key2)
+
+
+class TestNormalizeMessagesForKey(unittest.TestCase):
+    """Test cases for normalize_messages_for_key."""
+
+    def test_collapse_whitespace(self):
+        messages = [{"role": "user", "content": "  hello \t world  \n\n    next   line \n"}]
+        result = normalize_messages_for_key(messages)
+        self.assertEqual(result, [{"role": "user", "content": "hello world\n\n    next line"}])
+        # the original message is not changed
+        self.assertEqual(messages[0]["content"], "  hello \t world  \n\n    next   line \n")
+
+    def test_same_key_for_whitespace_only_difference(self):
+        key1 = build_response_cache_key({"messages": normalize_messages_for_key([{"content": "a  b\n"}])})
+        key2 = build_response_cache_key({"messages": normalize_messages_for_key([{"content": " a\tb "}])})
+        self.assertEqual(key1, key2)
+
+    def test_different_key_for_line_breaks_and_indentation(self):
+        def _key(content):
+            return build_response_cache_key({"messages": normalize_messages_for_key([{"content": content}])})
+
+        self.assertNotEqual(_key("if a:\n    b\nc"), _key("if a:\nb\n    c"))
+        self.assertNotEqual(_key("a\nb"), _key("a b"))
+
+    def test_keep_non_text_content(self):
+        content = [{"type": "text", "text": "a  b"}]
+        result = normalize_messages_for_key([{"role": "user", "content": content}])
+        self.assertIs(result[0]["content"], content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -98,6 +98,7 @@ class TestHookExecute(unittest.TestCase):
     def setUp(self):
         """Clear thread local storage before each test to ensure test isolation."""
         rid_all_thread_vars()
+        hook_execute.__globals__["reset_hook_funcs"]()
 
     @patch.dict(os.environ, {}, clear=True)
     @patch('topsailai.ai_base.llm_hooks.executor.module_tool.get_var')
@@ -176,6 +177,22 @@ class TestHookExecute(unittest.TestCase):
         result = hook_execute("TOPSAILAI_HOOK_AFTER_LLM_CHAT", "original content")
         self.assertEqual(result, "original content")
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_execute_resolves_hook_once(self):
+        """Test the hook function is resolved once and reused on later calls"""
+        # patch the globals of hook_execute, the module may be reloaded by other tests
+        hook_globals = hook_execute.__globals__
+        mock_hook = MagicMock(return_value="modified content")
+        runtime_hooks = ["topsailai.ai_base.llm_hooks.hook_after_chat.hook1"]
+
+        with patch.object(hook_globals["module_tool"], "get_var", return_value=mock_hook) as mock_get_var, \
+                patch.object(hook_globals["env_tool"].EnvReaderInstance, "get_list_str", return_value=None), \
+                patch.dict(hook_globals, {"get_hooks_runtime": lambda key, content: runtime_hooks}):
+            hook_execute("TOPSAILAI_HOOK_AFTER_LLM_CHAT", "content 1")
+            hook_execute("TOPSAILAI_HOOK_AFTER_LLM_CHAT", "content 2")
+
+        self.assertEqual(mock_get_var.call_count, 1)
+        self.assertEqual(mock_hook.call_count, 2)
 
 if __name__ == '__main__':
     unittest.main()
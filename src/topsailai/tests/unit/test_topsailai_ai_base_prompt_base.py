@@ -158,6 +158,23 @@ class TestPromptBase(unittest.TestCase):
         self.assertEqual(len(pb.messages), 2)  # Back to system + env
         self.assertEqual(pb.messages[0]["role"], "system")
 
+    @patch("topsailai.ai_base.prompt_base.get_managers_by_env")
+    @patch("topsailai.ai_base.prompt_base.generate_prompt_for_env")
+    def test_reset_messages_skips_ctx_history_hooks(self, mock_generate_prompt, mock_get_managers):
+        """Test reset builds the system messages without calling the context history hooks."""
+        from topsailai.ai_base.prompt_base import PromptBase
+
+        mock_generate_prompt.return_value = "env_prompt"
+        mock_get_managers.return_value = []
+
+        pb = PromptBase(system_prompt="test", tool_prompt="tools")
+        pb.call_hooks_ctx_history = MagicMock()
+
+        pb.reset_messages(to_suppress_log=True)
+
+        self.assertEqual([msg["content"] for msg in pb.messages], ["test", "env_prompt", "tools"])
+        pb.call_hooks_ctx_history.assert_not_called()
+
     @patch("topsailai.ai_base.prompt_base.get_managers_by_env")
     @patch("topsailai.ai_base.prompt_base.generate_prompt_for_env")
     @patch("topsailai.ai_base.prompt_base.print_step")
@@ -436,6 +453,51 @@ class TestPromptBase(unittest.TestCase):
 
         mock_hook.link_messages.assert_called()
 
+    @patch("topsailai.ai_base.prompt_base.get_managers_by_env")
+    @patch("topsailai.ai_base.prompt_base.generate_prompt_for_env")
+    def test_call_hooks_ctx_history_links_new_messages_only(self, mock_generate_prompt, mock_get_managers):
+        """Test link_messages starts after the linked messages, until they are changed."""
+        from topsailai.ai_base.prompt_base import PromptBase
+
+        mock_generate_prompt.return_value = "env_prompt"
+        mock_get_managers.return_value = []
+
+        pb = PromptBase(system_prompt="test")
+        mock_hook = MagicMock()
+        pb.hooks_ctx_history.append(mock_hook)
+        pb.threshold_ctx_history.is_exceeded = MagicMock(return_value=True)
+
+        for i in range(20):
+            pb.add_user_message(f"message {i}")
+
+        # the previous call linked messages[:len-1-10]
+        mock_hook.link_messages.assert_called_with(pb.messages, index_start=len(pb.messages) - 11)
+
+        pb.reset_messages(to_suppress_log=True)
+        pb.add_user_message("new message")
+        mock_hook.link_messages.assert_called_with(pb.messages)
+
+    @patch("topsailai.ai_base.prompt_base.get_managers_by_env")
+    @patch("topsailai.ai_base.prompt_base.generate_prompt_for_env")
+    def test_call_hooks_ctx_history_relinks_after_failure(self, mock_generate_prompt, mock_get_managers):
+        """Test the messages are linked again from the start after a failed link_messages."""
+        from topsailai.ai_base.prompt_base import PromptBase
+
+        mock_generate_prompt.return_value = "env_prompt"
+        mock_get_managers.return_value = []
+
+        pb = PromptBase(system_prompt="test")
+        mock_hook = MagicMock()
+        mock_hook.link_messages.side_effect = RuntimeError("database is locked")
+        pb.hooks_ctx_history.append(mock_hook)
+        pb.threshold_ctx_history.is_exceeded = MagicMock(return_value=True)
+
+        for i in range(20):
+            pb.add_user_message(f"message {i}")
+
+        mock_hook.link_messages.assert_called_with(pb.messages)
+        self.assertEqual(pb._linked_end, 0)
+
     # =========================================================================
     # Group D: Session Management Tests
     # =========================================================================
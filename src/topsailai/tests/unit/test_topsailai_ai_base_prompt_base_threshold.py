@@ -237,6 +237,20 @@ class TestThresholdContextHistory(unittest.TestCase):
         result = instance.is_exceeded(messages)
         self.assertTrue(result)
 
+    def test_count_messages_tokens_caches_history(self):
+        """Test only the new messages are encoded in the next check."""
+        from topsailai.ai_base.prompt_base import ThresholdContextHistory
+        instance = ThresholdContextHistory()
+
+        messages = [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}]
+        mock_count_tokens = MagicMock(return_value=7)
+        with patch.dict(instance.count_messages_tokens.__func__.__globals__, {"count_tokens": mock_count_tokens}):
+            self.assertEqual(instance.count_messages_tokens(messages), 14)
+            messages.append({"role": "user", "content": "c"})
+            self.assertEqual(instance.count_messages_tokens(messages), 21)
+
+        self.assertEqual(mock_count_tokens.call_count, 3)
+
     @patch("topsailai.ai_base.prompt_base.thread_local_tool")
     def test_is_exceeded_by_uncached_token_max(self, mock_thread_local_tool):
         """Test is_exceeded returns True when uncached tokens exceed uncached_token_max."""
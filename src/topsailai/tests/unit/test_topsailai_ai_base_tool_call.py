@@ -44,6 +44,15 @@ class TestToolCallInfo(unittest.TestCase):
         self.assertEqual(info.func_args["arg1"], "value1")
         self.assertEqual(info.func_args["arg2"], 42)
 
+    def test_init_with_values(self):
+        """Test ToolCallInfo takes the function name and args, without a __dict__."""
+        from topsailai.ai_base.tool_call import ToolCallInfo
+
+        info = ToolCallInfo("test_function", None)
+        self.assertEqual(info.func_name, "test_function")
+        self.assertEqual(info.func_args, {})
+        self.assertFalse(hasattr(info, "__dict__"))
+
 
 class TestStepCallBaseStatusCodes(unittest.TestCase):
     """Test cases for StepCallBase status codes."""
@@ -230,6 +239,51 @@ class TestGetToolCallInfo(unittest.TestCase):
         self.assertEqual(result.func_name, "raw_function")
         self.assertEqual(result.func_args["arg3"], True)
 
+    @patch('topsailai.ai_base.tool_call.json_tool.to_json_str')
+    def test_get_tool_call_info_raw_json_parsed_once(self, mock_to_json_str):
+        """Test well-formed raw_text json skips the LLM mistake fixing."""
+        from topsailai.ai_base.tool_call import StepCallBase
+
+        step = {
+            "raw_text": '[{"tool_call": "raw_function", "tool_args": {"arg3": 1}}]'
+        }
+
+        result = StepCallBase().get_tool_call_info(step, None)
+
+        self.assertEqual(result.func_name, "raw_function")
+        self.assertEqual(result.func_args, {"arg3": 1})
+        mock_to_json_str.assert_not_called()
+
+    @patch('topsailai.ai_base.tool_call.json_tool.to_json_str')
+    def test_get_tool_call_info_from_raw_code_block(self, mock_to_json_str):
+        """Test json in a code block is extracted without the LLM mistake fixing."""
+        from topsailai.ai_base.tool_call import StepCallBase
+
+        step = {
+            "raw_text": '```json\n{"tool_call": "raw_function", "tool_args": {"a": {"b": 1}}}\n```'
+        }
+
+        result = StepCallBase().get_tool_call_info(step, None)
+
+        self.assertEqual(result.func_name, "raw_function")
+        self.assertEqual(result.func_args, {"a": {"b": 1}})
+        mock_to_json_str.assert_not_called()
+
+    @patch('topsailai.ai_base.tool_call.json_tool.to_json_str')
+    def test_get_tool_call_info_from_raw_dict(self, mock_to_json_str):
+        """Test a raw_text which is already a dict is used without dump and load."""
+        from topsailai.ai_base.tool_call import StepCallBase
+
+        step = {
+            "raw_text": {"tool_call": "raw_function", "tool_args": {"arg3": 1}}
+        }
+
+        result = StepCallBase().get_tool_call_info(step, None)
+
+        self.assertEqual(result.func_name, "raw_function")
+        self.assertEqual(result.func_args, {"arg3": 1})
+        mock_to_json_str.assert_not_called()
+
     def test_get_tool_call_info_returns_none_when_no_tool(self):
         """Test returns None when no tool call information is found."""
         from topsailai.ai_base.tool_call import StepCallBase
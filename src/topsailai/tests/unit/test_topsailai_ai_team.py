@@ -293,6 +293,71 @@ class TestManagerFunctions(unittest.TestCase):
         os.remove(f"{base_path}.chat")
         os.remove(f"{base_path}.agent")
 
+    def test_get_team_list_sets_executable_bit(self):
+        """Test get_team_list makes .chat and .agent files executable"""
+        self._create_member_file("exec-member", "Info")
+        base_path = os.path.join(self.temp_dir, "exec-member")
+        for ext in ["chat", "agent"]:
+            open(f"{base_path}.{ext}", 'w').close()
+            os.chmod(f"{base_path}.{ext}", 0o644)
+
+        from topsailai.ai_team.manager import get_team_list
+        get_team_list()
+
+        for ext in ["chat", "agent"]:
+            self.assertTrue(os.access(f"{base_path}.{ext}", os.X_OK))
+
+    def test_generate_system_prompt_uses_cache(self):
+        """Test generate_system_prompt reuses the cached prompt when nothing changed"""
+        self._create_member_file("cached-member", "Cached info")
+        cache_dir = os.path.join(self.temp_dir, "cache")
+
+        from topsailai.ai_team import manager
+        manager.g_members = []
+        with patch.object(manager, "FOLDER_CACHE", cache_dir):
+            result1 = manager.generate_system_prompt()
+
+            manager.g_members = []
+            with patch.object(manager, "get_team_list", side_effect=AssertionError("cache missed")):
+                result2 = manager.generate_system_prompt()
+
+        self.assertEqual(result1, result2)
+        self.assertIn("Cached info", result2)
+        self.assertEqual(manager.get_members_cache(), ["cached-member"])
+        self.assertIn("cached-member", os.environ["TOPSAILAI_TEAM_PROMPT_CONTENT"])
+        manager.g_members = []
+
+    def test_generate_system_prompt_uses_memory_cache(self):
+        """Test generate_system_prompt does not re-read the cache file in the same process"""
+        self._create_member_file("memory-member", "Memory info")
+        cache_dir = os.path.join(self.temp_dir, "cache")
+
+        from topsailai.ai_team import manager
+        manager.g_members = []
+        with patch.object(manager, "FOLDER_CACHE", cache_dir):
+            result1 = manager.generate_system_prompt()
+            with patch.object(manager.json, "load", side_effect=AssertionError("file read")):
+                result2 = manager.generate_system_prompt()
+
+        self.assertEqual(result1, result2)
+        manager.g_members = []
+
+    def test_generate_system_prompt_cache_invalidated_on_change(self):
+        """Test generate_system_prompt rebuilds the prompt when a member file changes"""
+        filepath = self._create_member_file("changed-member", "Old info")
+        cache_dir = os.path.join(self.temp_dir, "cache")
+
+        from topsailai.ai_team import manager
+        with patch.object(manager, "FOLDER_CACHE", cache_dir):
+            result1 = manager.generate_system_prompt()
+            with open(filepath, 'w') as f:
+                f.write("New info, longer")
+            result2 = manager.generate_system_prompt()
+
+        self.assertIn("Old info", result1)
+        self.assertIn("New info, longer", result2)
+        manager.g_members = []
+
     def test_get_team_list_ignores_non_member_files(self):
         """Test get_team_list ignores non-.member files"""
         self._create_member_file("valid-member", "Info")
@@ -415,34 +480,34 @@ class TestMemberAgentFunctions(unittest.TestCase):
         result = extend_system_prompt()
         self.assertIsNone(result)
 
-    @patch('topsailai.ai_team.member_agent.file_tool')
+    @patch('topsailai.ai_team.member_agent.prompt_tool')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
-    def test_get_system_prompt_returns_string(self, mock_get_member_prompt, mock_file_tool):
+    def test_get_system_prompt_returns_string(self, mock_get_member_prompt, mock_prompt_tool):
         """Test get_system_prompt returns a string"""
-        mock_file_tool.get_file_content_fuzzy.return_value = (None, "Base prompt content")
+        mock_prompt_tool.get_system_prompt_content.return_value = "Base prompt content"
         mock_get_member_prompt.return_value = "\n---\nYOUR ROLE IS Member\n---\n"
 
         from topsailai.ai_team.member_agent import get_system_prompt
         result = get_system_prompt("TestAgent")
         self.assertIsInstance(result, str)
 
-    @patch('topsailai.ai_team.member_agent.file_tool')
+    @patch('topsailai.ai_team.member_agent.prompt_tool')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
-    def test_get_system_prompt_includes_base_prompt(self, mock_get_member_prompt, mock_file_tool):
+    def test_get_system_prompt_includes_base_prompt(self, mock_get_member_prompt, mock_prompt_tool):
         """Test get_system_prompt includes base system prompt"""
         base_content = "Base system prompt"
-        mock_file_tool.get_file_content_fuzzy.return_value = (None, base_content)
+        mock_prompt_tool.get_system_prompt_content.return_value = base_content
         mock_get_member_prompt.return_value = "\n---\nYOUR ROLE IS Member\n---\n"
 
         from topsailai.ai_team.member_agent import get_system_prompt
         result = get_system_prompt("TestAgent")
         self.assertIn(base_content, result)
 
-    @patch('topsailai.ai_team.member_agent.file_tool')
+    @patch('topsailai.ai_team.member_agent.prompt_tool')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
-    def test_get_system_prompt_includes_member_prompt(self, mock_get_member_prompt, mock_file_tool):
+    def test_get_system_prompt_includes_member_prompt(self, mock_get_member_prompt, mock_prompt_tool):
         """Test get_system_prompt includes member prompt"""
-        mock_file_tool.get_file_content_fuzzy.return_value = (None, "Base")
+        mock_prompt_tool.get_system_prompt_content.return_value = "Base"
         member_prompt = "\n---\nYOUR ROLE IS Member\n---\n"
         mock_get_member_prompt.return_value = member_prompt
 
@@ -450,11 +515,11 @@ class TestMemberAgentFunctions(unittest.TestCase):
         result = get_system_prompt("TestAgent")
         self.assertIn(member_prompt, result)
 
-    @patch('topsailai.ai_team.member_agent.file_tool')
+    @patch('topsailai.ai_team.member_agent.prompt_tool')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
-    def test_get_system_prompt_calls_extend_system_prompt(self, mock_get_member_prompt, mock_file_tool):
+    def test_get_system_prompt_calls_extend_system_prompt(self, mock_get_member_prompt, mock_prompt_tool):
         """Test get_system_prompt calls extend_system_prompt"""
-        mock_file_tool.get_file_content_fuzzy.return_value = (None, "Base")
+        mock_prompt_tool.get_system_prompt_content.return_value = "Base"
         mock_get_member_prompt.return_value = "\n---\nYOUR ROLE IS Member\n---\n"
 
         from topsailai.ai_team.member_agent import get_system_prompt
@@ -38,6 +38,24 @@ class TestGetMembersCache(unittest.TestCase):
         self.assertEqual(result, ["member1", "member2"])
 
 
+class TestGetTeamConcurrency(unittest.TestCase):
+    """Test cases for get_team_concurrency function."""
+
+    @patch.dict('os.environ', {"TOPSAILAI_TEAM_CONCURRENCY": "3"})
+    def test_get_team_concurrency_from_env(self):
+        """Test that TOPSAILAI_TEAM_CONCURRENCY is used when set."""
+        from topsailai.ai_team.manager import get_team_concurrency
+        self.assertEqual(get_team_concurrency(), 3)
+
+    @patch.dict('os.environ', {"TOPSAILAI_TEAM_CONCURRENCY": "0"})
+    @patch('topsailai.ai_team.manager.os.sched_getaffinity', create=True)
+    def test_get_team_concurrency_defaults_to_cpu_affinity(self, mock_affinity):
+        """Test that the usable CPU count is the default."""
+        from topsailai.ai_team.manager import get_team_concurrency
+        mock_affinity.return_value = {0, 1, 2, 3, 4}
+        self.assertEqual(get_team_concurrency(), 5)
+
+
 class TestGetTeamList(unittest.TestCase):
     """Tests for get_team_list() function."""
 
@@ -51,43 +69,49 @@ class TestGetTeamList(unittest.TestCase):
         from topsailai.ai_team import manager
         manager.g_members = []
 
+    @staticmethod
+    def _mock_entries(mock_scandir, names, st_mode=0o100755):
+        """Make os.scandir yield fake entries for the given file names."""
+        entries = []
+        for name in names:
+            entry = MagicMock()
+            entry.name = name
+            entry.path = f"/path/to/team/{name}"
+            entry.stat.return_value.st_mode = st_mode
+            entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = entries
+        return entries
+
     @patch('topsailai.ai_team.manager.os.getenv')
-    @patch('topsailai.ai_team.manager.os.listdir')
+    @patch('topsailai.ai_team.manager.os.scandir')
     @patch('topsailai.ai_team.manager.os.path.isdir')
-    @patch('topsailai.ai_team.manager.os.path.join')
-    @patch('topsailai.ai_team.manager.os.path.exists')
     @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Test member info")
-    def test_get_team_list_reads_from_team_path(self, mock_open, mock_exists, mock_join, mock_isdir, mock_listdir, mock_getenv):
+    def test_get_team_list_reads_from_team_path(self, mock_open, mock_isdir, mock_scandir, mock_getenv):
         """Test that get_team_list reads .member files from team path directory."""
         from topsailai.ai_team.manager import get_team_list
         
         mock_getenv.return_value = "/path/to/team"
         mock_isdir.return_value = True
-        mock_listdir.return_value = ["test_member.member"]
-        mock_join.return_value = "/path/to/team/test_member.member"
-        mock_exists.return_value = False
+        self._mock_entries(mock_scandir, ["test_member.member"])
         
         result = get_team_list()
         
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["member_id"], "test_member")
         self.assertEqual(result[0]["member_info"], "Test member info")
+        mock_scandir.assert_called_once_with("/path/to/team")
 
     @patch('topsailai.ai_team.manager.os.getenv')
-    @patch('topsailai.ai_team.manager.os.listdir')
+    @patch('topsailai.ai_team.manager.os.scandir')
     @patch('topsailai.ai_team.manager.os.path.isdir')
-    @patch('topsailai.ai_team.manager.os.path.join')
-    @patch('topsailai.ai_team.manager.os.path.exists')
     @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Member content here")
-    def test_get_team_list_parses_member_info(self, mock_open, mock_exists, mock_join, mock_isdir, mock_listdir, mock_getenv):
+    def test_get_team_list_parses_member_info(self, mock_open, mock_isdir, mock_scandir, mock_getenv):
         """Test that get_team_list correctly parses member_id and member_info."""
         from topsailai.ai_team.manager import get_team_list
         
         mock_getenv.return_value = "/path/to/team"
         mock_isdir.return_value = True
-        mock_listdir.return_value = ["my_member.member"]
-        mock_join.return_value = "/path/to/team/my_member.member"
-        mock_exists.return_value = False
+        self._mock_entries(mock_scandir, ["my_member.member"])
         
         result = get_team_list()
         
@@ -95,22 +119,17 @@ class TestGetTeamList(unittest.TestCase):
         self.assertEqual(result[0]["member_info"], "Member content here")
 
     @patch('topsailai.ai_team.manager.os.getenv')
-    @patch('topsailai.ai_team.manager.os.listdir')
+    @patch('topsailai.ai_team.manager.os.scandir')
     @patch('topsailai.ai_team.manager.os.path.isdir')
-    @patch('topsailai.ai_team.manager.os.path.join')
-    @patch('topsailai.ai_team.manager.os.path.exists')
-    @patch('topsailai.ai_team.manager.os.system')
+    @patch('topsailai.ai_team.manager.os.chmod')
     @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Chat member")
-    def test_get_team_list_detects_chat_ability(self, mock_open, mock_system, mock_exists, mock_join, mock_isdir, mock_listdir, mock_getenv):
+    def test_get_team_list_detects_chat_ability(self, mock_open, mock_chmod, mock_isdir, mock_scandir, mock_getenv):
         """Test that get_team_list detects .chat file existence."""
         from topsailai.ai_team.manager import get_team_list
         
         mock_getenv.return_value = "/path/to/team"
         mock_isdir.return_value = True
-        mock_listdir.return_value = ["chat_member.member"]
-        mock_join.return_value = "/path/to/team/chat_member.member"
-        # Return True for .chat file existence
-        mock_exists.side_effect = lambda path: ".chat" in path
+        self._mock_entries(mock_scandir, ["chat_member.member", "chat_member.chat"])
         
         result = get_team_list()
         
@@ -118,28 +137,76 @@ class TestGetTeamList(unittest.TestCase):
         self.assertFalse(result[0]["is_able_to_call_agent"])
 
     @patch('topsailai.ai_team.manager.os.getenv')
-    @patch('topsailai.ai_team.manager.os.listdir')
+    @patch('topsailai.ai_team.manager.os.scandir')
     @patch('topsailai.ai_team.manager.os.path.isdir')
-    @patch('topsailai.ai_team.manager.os.path.join')
-    @patch('topsailai.ai_team.manager.os.path.exists')
-    @patch('topsailai.ai_team.manager.os.system')
+    @patch('topsailai.ai_team.manager.os.chmod')
     @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Agent member")
-    def test_get_team_list_detects_agent_ability(self, mock_open, mock_system, mock_exists, mock_join, mock_isdir, mock_listdir, mock_getenv):
+    def test_get_team_list_detects_agent_ability(self, mock_open, mock_chmod, mock_isdir, mock_scandir, mock_getenv):
         """Test that get_team_list detects .agent file existence."""
         from topsailai.ai_team.manager import get_team_list
         
         mock_getenv.return_value = "/path/to/team"
         mock_isdir.return_value = True
-        mock_listdir.return_value = ["agent_member.member"]
-        mock_join.return_value = "/path/to/team/agent_member.member"
-        # Return True for .agent file existence
-        mock_exists.side_effect = lambda path: ".agent" in path
+        self._mock_entries(mock_scandir, ["agent_member.member", "agent_member.agent"])
         
         result = get_team_list()
         
         self.assertFalse(result[0]["is_able_to_call_chat"])
         self.assertTrue(result[0]["is_able_to_call_agent"])
 
+    @patch('topsailai.ai_team.manager.os.getenv')
+    @patch('topsailai.ai_team.manager.os.scandir')
+    @patch('topsailai.ai_team.manager.os.path.isdir')
+    @patch('topsailai.ai_team.manager.os.chmod')
+    @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Chat member")
+    def test_get_team_list_skips_chmod_when_executable(self, mock_open, mock_chmod, mock_isdir, mock_scandir, mock_getenv):
+        """Test that get_team_list does not chmod files that are already executable."""
+        from topsailai.ai_team.manager import get_team_list
+        
+        mock_getenv.return_value = "/path/to/team"
+        mock_isdir.return_value = True
+        self._mock_entries(mock_scandir, ["chat_member.member", "chat_member.chat"], st_mode=0o100755)
+        
+        get_team_list()
+        
+        mock_chmod.assert_not_called()
+
+    @patch('topsailai.ai_team.manager.os.getenv')
+    @patch('topsailai.ai_team.manager.os.scandir')
+    @patch('topsailai.ai_team.manager.os.path.isdir')
+    @patch('topsailai.ai_team.manager.os.chmod')
+    @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Chat member")
+    def test_get_team_list_chmods_when_not_executable(self, mock_open, mock_chmod, mock_isdir, mock_scandir, mock_getenv):
+        """Test that get_team_list adds the executable bits when missing."""
+        from topsailai.ai_team.manager import get_team_list
+        
+        mock_getenv.return_value = "/path/to/team"
+        mock_isdir.return_value = True
+        self._mock_entries(mock_scandir, ["chat_member.member", "chat_member.chat"], st_mode=0o100644)
+        
+        get_team_list()
+        
+        mock_chmod.assert_called_once_with("/path/to/team/chat_member.chat", 0o100755)
+
+    @patch('topsailai.ai_team.manager.os.getenv')
+    @patch('topsailai.ai_team.manager.os.scandir')
+    @patch('topsailai.ai_team.manager.os.path.isdir')
+    @patch('topsailai.ai_team.manager.os.chmod')
+    @patch('topsailai.ai_team.manager.open', new_callable=mock_open, read_data="Chat member")
+    def test_get_team_list_keeps_member_when_chmod_fails(self, mock_open, mock_chmod, mock_isdir, mock_scandir, mock_getenv):
+        """Test that a chmod failure does not drop the member."""
+        from topsailai.ai_team.manager import get_team_list
+        
+        mock_getenv.return_value = "/path/to/team"
+        mock_isdir.return_value = True
+        mock_chmod.side_effect = PermissionError("not owner")
+        self._mock_entries(mock_scandir, ["chat_member.member", "chat_member.chat"], st_mode=0o100644)
+        
+        result = get_team_list()
+        
+        self.assertEqual(len(result), 1)
+        self.assertTrue(result[0]["is_able_to_call_chat"])
+
     @patch('topsailai.ai_team.manager.os.getenv')
     @patch('topsailai.ai_team.manager.os.path.isdir')
     def test_get_team_list_asserts_invalid_path(self, mock_isdir, mock_getenv):
@@ -69,42 +69,42 @@ class TestGetSystemPrompt(unittest.TestCase):
         self.mock_file_content = "You are a helpful AI assistant."
         self.mock_member_prompt = "\n\n## Role\nYou are a team member."
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_returns_string_type(self, mock_extend, mock_get_member, mock_file):
         """Test that get_system_prompt returns string type."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = self.mock_member_prompt
         
         result = get_system_prompt("mm-m25")
         
         self.assertIsInstance(result, str)
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_contains_base_system_prompt(self, mock_extend, mock_get_member, mock_file):
         """Test that result contains base system prompt content."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = self.mock_member_prompt
         
         result = get_system_prompt("mm-m25")
         
         self.assertIn(self.mock_file_content, result)
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_appends_member_prompt_when_not_present(self, mock_extend, mock_get_member, mock_file):
         """Test that member prompt is appended when not in system prompt."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = self.mock_member_prompt
         
         result = get_system_prompt("mm-m25")
@@ -112,7 +112,7 @@ class TestGetSystemPrompt(unittest.TestCase):
         self.assertIn(self.mock_member_prompt, result)
         mock_get_member.assert_called_once_with("mm-m25")
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_does_not_append_duplicate_member_prompt(self, mock_extend, mock_get_member, mock_file):
@@ -121,7 +121,7 @@ class TestGetSystemPrompt(unittest.TestCase):
         
         # Member prompt already in system prompt
         combined_content = self.mock_file_content + self.mock_member_prompt
-        mock_file.return_value = (None, combined_content)
+        mock_file.return_value = combined_content
         mock_get_member.return_value = self.mock_member_prompt
         
         result = get_system_prompt("mm-m25")
@@ -129,56 +129,56 @@ class TestGetSystemPrompt(unittest.TestCase):
         # Should only appear once
         self.assertEqual(result.count(self.mock_member_prompt), 1)
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_calls_extend_system_prompt(self, mock_extend, mock_get_member, mock_file):
         """Test that extend_system_prompt is called."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = self.mock_member_prompt
         
         get_system_prompt("mm-m25")
         
         mock_extend.assert_called_once()
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_handles_empty_system_prompt(self, mock_extend, mock_get_member, mock_file):
         """Test that function handles empty system prompt gracefully."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, "")
+        mock_file.return_value = ""
         mock_get_member.return_value = self.mock_member_prompt
         
         result = get_system_prompt("mm-m25")
         
         self.assertIn(self.mock_member_prompt, result)
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_handles_empty_member_prompt(self, mock_extend, mock_get_member, mock_file):
         """Test that function handles empty member prompt gracefully."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = ""
         
         result = get_system_prompt("mm-m25")
         
         self.assertEqual(result, self.mock_file_content)
     
-    @patch('topsailai.ai_team.member_agent.file_tool.get_file_content_fuzzy')
+    @patch('topsailai.ai_team.member_agent.prompt_tool.get_system_prompt_content')
     @patch('topsailai.ai_team.member_agent.get_member_prompt')
     @patch('topsailai.ai_team.member_agent.extend_system_prompt')
     def test_uses_agent_name_parameter(self, mock_extend, mock_get_member, mock_file):
         """Test that agent_name parameter is passed to get_member_prompt."""
         from topsailai.ai_team.member_agent import get_system_prompt
         
-        mock_file.return_value = (None, self.mock_file_content)
+        mock_file.return_value = self.mock_file_content
         mock_get_member.return_value = self.mock_member_prompt
         
         get_system_prompt("test-agent-42")
@@ -132,13 +132,13 @@ class TestContextManagerConstants:
     def test_ignored_roles(self):
         """Test that ignored_roles contains system and user roles."""
         assert hasattr(ContextManager, 'ignored_roles')
-        assert isinstance(ContextManager.ignored_roles, set)
+        assert isinstance(ContextManager.ignored_roles, frozenset)
         assert len(ContextManager.ignored_roles) > 0
 
     def test_attention_step_names(self):
         """Test that attention_step_names contains action and observation."""
         assert hasattr(ContextManager, 'attention_step_names')
-        assert isinstance(ContextManager.attention_step_names, set)
+        assert isinstance(ContextManager.attention_step_names, frozenset)
         assert "action" in ContextManager.attention_step_names
         assert "observation" in ContextManager.attention_step_names
 
@@ -217,6 +217,23 @@ class TestContextManager(unittest.TestCase):
         self.assertIsInstance(call_args, ChatHistoryMessageData)
         self.assertEqual(call_args.session_id, "test_session")
 
+    @patch('topsailai.context.chat_history_manager.__base.get_session_id')
+    @patch('topsailai.context.chat_history_manager.__base.count_tokens')
+    @patch('topsailai.context.chat_history_manager.__base.logger')
+    @patch('topsailai.context.chat_history_manager.__base.json_tool')
+    def test_link_msg_id_with_session_id(self, mock_json_tool, mock_logger, mock_count_tokens, mock_get_session_id):
+        """Test that the given session_id is used without reading the current session."""
+        mock_count_tokens.return_value = 8
+        mock_json_tool.json_dump.side_effect = lambda x, **kwargs: str(x)
+
+        content_dict = {"raw_text": "Test content", "role": "user"}
+        self.manager.add_message = MagicMock()
+        self.manager._link_msg_id(content_dict, "given_session")
+
+        call_args = self.manager.add_message.call_args[0][0]
+        self.assertEqual(call_args.session_id, "given_session")
+        mock_get_session_id.assert_not_called()
+
     @patch('topsailai.context.chat_history_manager.__base.get_session_id')
     @patch('topsailai.context.chat_history_manager.__base.count_tokens')
     @patch('topsailai.context.chat_history_manager.__base.logger')
@@ -280,6 +297,48 @@ class TestContextManager(unittest.TestCase):
         mock_json_tool.json_load.assert_not_called()
         self.manager._link_msg_id.assert_not_called()
 
+    def test_is_oversize(self):
+        """Test _is_oversize agrees with len(str(content_dict)) > max_size."""
+        cases = [
+            {"step_name": "observation", "raw_text": "x" * 101},
+            {"step_name": "observation", "raw_text": "x" * 50},
+            {"step_name": "action", "raw_text": "x" * 60, "tool_args": {"a": "y" * 60}},
+        ]
+        for content_dict in cases:
+            self.assertEqual(
+                self.manager._is_oversize(content_dict, 100),
+                len(str(content_dict)) > 100,
+            )
+
+    @patch('topsailai.context.chat_history_manager.__base.json_tool')
+    @patch('topsailai.context.chat_history_manager.__base.format_tool')
+    def test_link_messages_skips_empty_content(self, mock_format_tool, mock_json_tool):
+        """Test that empty or non-string content is skipped without error."""
+        messages = [
+            {"role": "assistant", "content": ""},
+            {"role": "assistant", "content": [{"type": "text", "text": "hi"}]},
+        ]
+        self.manager._link_msg_id = MagicMock()
+        self.manager.link_messages(messages, index_start=0, index_end=-1)
+
+        mock_json_tool.json_load.assert_not_called()
+        self.manager._link_msg_id.assert_not_called()
+
+    @patch('topsailai.context.chat_history_manager.__base.json_tool')
+    @patch('topsailai.context.chat_history_manager.__base.format_tool')
+    def test_link_messages_skips_content_without_attention_step(self, mock_format_tool, mock_json_tool):
+        """Test that JSON content without action/observation step is not parsed."""
+        mock_format_tool.to_list.side_effect = lambda x: x if isinstance(x, list) else [x]
+
+        messages = [
+            {"role": "assistant", "content": '[{"step_name": "archive", "raw_text": "retrieve_msg by msg_id=1"}]'},
+        ]
+        self.manager._link_msg_id = MagicMock()
+        self.manager.link_messages(messages, index_start=0, index_end=-1)
+
+        mock_json_tool.json_load.assert_not_called()
+        self.manager._link_msg_id.assert_not_called()
+
     @patch('topsailai.context.chat_history_manager.__base.json_tool')
     @patch('topsailai.context.chat_history_manager.__base.format_tool')
     def test_link_messages_handles_invalid_json(self, mock_format_tool, mock_json_tool):
@@ -357,6 +416,43 @@ class TestContextManager(unittest.TestCase):
 
         self.assertNotEqual(messages[0]["content"], large_content)
 
+    def test_link_messages_adds_archived_messages_at_once(self):
+        """Test the archived blocks are added by one add_messages call."""
+        messages = [
+            {"role": "assistant", "content": json.dumps([{"step_name": "action", "raw_text": "x" * 200}])},
+            {"role": "tool", "content": json.dumps([{"step_name": "observation", "raw_text": "y" * 200}])},
+        ]
+        self.manager.add_messages = MagicMock()
+        module_globals = self.manager.link_messages.__func__.__globals__
+        with patch.dict(module_globals, {"get_session_id": lambda: "test_session", "count_tokens": lambda text: 100}):
+            self.manager.link_messages(messages, index_start=0, index_end=-1, max_size=100)
+
+        self.manager.add_messages.assert_called_once()
+        msgs = self.manager.add_messages.call_args[0][0]
+        self.assertEqual([msg.message for msg in msgs], ["x" * 200, "y" * 200])
+        self.assertEqual(set(msg.session_id for msg in msgs), {"test_session"})
+
+    @patch('topsailai.context.chat_history_manager.__base.get_session_id')
+    @patch('topsailai.context.chat_history_manager.__base.count_tokens')
+    @patch('topsailai.context.chat_history_manager.__base.logger')
+    def test_link_messages_restores_messages_when_add_fails(self, mock_logger, mock_count_tokens, mock_get_session_id):
+        """Test the messages are not changed if the archived blocks cannot be stored."""
+        mock_get_session_id.return_value = "test_session"
+        mock_count_tokens.return_value = 100
+
+        message = {
+            "role": "assistant",
+            "content": json.dumps([{"step_name": "action", "raw_text": "x" * 200}]),
+            "tool_calls": [{"id": "call_1"}],
+        }
+        old_message = dict(message)
+        self.manager.add_messages = MagicMock(side_effect=RuntimeError("db is down"))
+
+        with self.assertRaises(RuntimeError):
+            self.manager.link_messages([message], index_start=0, index_end=-1, max_size=100)
+
+        self.assertEqual(message, old_message)
+
     def test_retrieve_message_returns_content(self):
         """Test that retrieve_message returns message content."""
         mock_msg = MagicMock()
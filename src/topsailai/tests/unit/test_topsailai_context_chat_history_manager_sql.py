@@ -44,6 +44,19 @@ class TestChatHistorySQLAlchemy:
         assert len(messages_session2) == 1
         assert messages_session1[0].msg_id == messages_session2[0].msg_id
 
+    def test_add_messages(self, manager):
+        manager.add_message(ChatHistoryMessageData("Hello world", None, "session1"))
+        msgs = [
+            ChatHistoryMessageData("Hello world", None, "session2"),  # existing message, new session
+            ChatHistoryMessageData("Message 1", None, "session2"),
+            ChatHistoryMessageData("Message 1", None, "session2"),  # duplicate in the batch
+        ]
+        manager.add_messages(msgs)
+
+        messages_session2 = manager.get_messages_by_session("session2")
+        assert sorted(m.message for m in messages_session2) == ["Hello world", "Message 1"]
+        assert len(manager.get_messages_by_session("session1")) == 1
+
     def test_get_message_updates_stats(self, manager):
         msg = ChatHistoryMessageData("Test message", None, "session1")
         manager.add_message(msg)
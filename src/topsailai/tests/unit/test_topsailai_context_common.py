@@ -26,34 +26,34 @@ class TestGetSessionId:
             assert result == "custom_session_123"
             mock_env.get_session_id.assert_called_once()
 
-    def test_get_session_id_from_time_tool(self, monkeypatch):
+    def test_get_session_id_from_time(self, monkeypatch):
         """Test fallback to time-based generation when env var not set."""
         monkeypatch.delenv("SESSION_ID", raising=False)
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = None
-            with patch('topsailai.context.common.time_tool') as mock_time:
-                mock_time.get_current_date.return_value = "2026-04-18T17:32:58"
+            with patch('topsailai.context.common.time') as mock_time:
+                mock_time.strftime.return_value = "20260418T173258"
                 result = get_session_id()
                 assert result == "20260418T173258"
-                mock_time.get_current_date.assert_called_once_with(with_t=True)
+                mock_time.strftime.assert_called_once_with("%Y%m%dT%H%M%S")
 
     def test_get_session_id_env_priority(self, monkeypatch):
         """Test that env var takes priority over time-based generation."""
         monkeypatch.setenv("SESSION_ID", "priority_session")
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = "priority_session"
-            with patch('topsailai.context.common.time_tool') as mock_time:
+            with patch('topsailai.context.common.time') as mock_time:
                 result = get_session_id()
                 assert result == "priority_session"
-                mock_time.get_current_date.assert_not_called()
+                mock_time.strftime.assert_not_called()
 
     def test_get_session_id_empty_env(self, monkeypatch):
         """Test that empty string env var falls back to time-based generation."""
         monkeypatch.setenv("SESSION_ID", "")
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = ""
-            with patch('topsailai.context.common.time_tool') as mock_time:
-                mock_time.get_current_date.return_value = "2026-01-01T00:00:00"
+            with patch('topsailai.context.common.time') as mock_time:
+                mock_time.strftime.return_value = "20260101T000000"
                 result = get_session_id()
                 assert result == "20260101T000000"
 
@@ -62,8 +62,8 @@ class TestGetSessionId:
         monkeypatch.delenv("SESSION_ID", raising=False)
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = None
-            with patch('topsailai.context.common.time_tool') as mock_time:
-                mock_time.get_current_date.return_value = "2026-12-31T23:59:59"
+            with patch('topsailai.context.common.time') as mock_time:
+                mock_time.strftime.return_value = "20261231T235959"
                 result = get_session_id()
                 assert '-' not in result
                 assert ':' not in result
@@ -74,8 +74,8 @@ class TestGetSessionId:
         monkeypatch.delenv("SESSION_ID", raising=False)
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = None
-            with patch('topsailai.context.common.time_tool') as mock_time:
-                mock_time.get_current_date.return_value = "2026-04-18T17:32:58"
+            with patch('topsailai.context.common.time') as mock_time:
+                mock_time.strftime.return_value = "20260418T173258"
                 result = get_session_id()
                 assert isinstance(result, str)
                 assert result == "20260418T173258"
@@ -89,8 +89,8 @@ class TestGetSessionIdEdgeCases:
         monkeypatch.delenv("SESSION_ID", raising=False)
         with patch('topsailai.context.common.env_tool') as mock_env:
             mock_env.get_session_id.return_value = None
-            with patch('topsailai.context.common.time_tool') as mock_time:
-                mock_time.get_current_date.return_value = "2026-04-18T17:32:58"
+            with patch('topsailai.context.common.time') as mock_time:
+                mock_time.strftime.return_value = "20260418T173258"
                 result = get_session_id()
                 assert result == "20260418T173258"
 
@@ -102,18 +102,25 @@ class TestGetSessionIdEdgeCases:
             result = get_session_id()
             assert result == "session-with-special.chars"
 
-    def test_get_session_id_time_format_variations(self, monkeypatch):
-        """Test various time format outputs are handled correctly."""
+    def test_get_session_id_matches_date_format(self, monkeypatch):
+        """Test the generated id is the compact form of get_current_date(with_t=True)."""
+        import re
+        from datetime import datetime
+        from topsailai.utils import time_tool
         monkeypatch.delenv("SESSION_ID", raising=False)
-        test_cases = [
-            ("2026-01-01T00:00:00", "20260101T000000"),
-            ("2026-12-31T23:59:59", "20261231T235959"),
-            ("2026-06-15T12:30:45", "20260615T123045"),
-        ]
-        with patch('topsailai.context.common.env_tool') as mock_env:
-            mock_env.get_session_id.return_value = None
-            for time_input, expected in test_cases:
-                with patch('topsailai.context.common.time_tool') as mock_time:
-                    mock_time.get_current_date.return_value = time_input
-                    result = get_session_id()
-                    assert result == expected
+        # both ids are formatted from the same moment, not from two clock reads
+        now = datetime(2026, 4, 18, 17, 32, 58)
+        mock_env = MagicMock()
+        mock_env.get_session_id.return_value = None
+        mock_time = MagicMock()
+        mock_time.strftime.side_effect = now.strftime
+        mock_datetime = MagicMock()
+        mock_datetime.now.return_value = now
+        get_current_date = time_tool.get_current_date
+        # patch the globals of the functions themselves, other tests may reload the modules
+        with patch.dict(get_session_id.__globals__, {"env_tool": mock_env, "time": mock_time}), \
+                patch.dict(get_current_date.__globals__, {"datetime": mock_datetime}):
+            result = get_session_id()
+            expected = get_current_date(with_t=True).replace('-', '').replace(':', '')
+        assert re.fullmatch(r"\d{8}T\d{6}", result)
+        assert result == expected == "20260418T173258"
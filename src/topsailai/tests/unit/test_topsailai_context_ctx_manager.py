@@ -24,6 +24,8 @@ class TestGetManagersByEnv(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        from topsailai.context.ctx_manager import reset_managers_cache
+        reset_managers_cache()
         # Store original environment
         self.original_env = os.environ.copy()
 
@@ -53,6 +55,27 @@ class TestGetManagersByEnv(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIsInstance(result, list)
 
+    @patch('topsailai.context.ctx_manager.ALL_MANAGERS')
+    @patch('topsailai.context.ctx_manager.logger')
+    def test_get_managers_by_env_reuses_managers(self, mock_logger, mock_all_managers):
+        """Test managers are instantiated once for the same configuration."""
+        from topsailai.context.ctx_manager import get_managers_by_env
+
+        mock_manager_cls = MagicMock()
+        mock_all_managers.__contains__ = MagicMock(return_value=True)
+        mock_all_managers.__getitem__ = MagicMock(return_value=mock_manager_cls)
+
+        os.environ['CONTEXT_HISTORY_MANAGERS'] = 'sql.ChatHistorySQLAlchemy conn=sqlite://memory.db'
+        first = get_managers_by_env()
+        second = get_managers_by_env()
+        self.assertEqual(first, second)
+        mock_manager_cls.assert_called_once_with(conn='sqlite://memory.db')
+
+        # a new configuration gets new managers
+        os.environ['CONTEXT_HISTORY_MANAGERS'] = 'sql.ChatHistorySQLAlchemy conn=sqlite://other.db'
+        get_managers_by_env()
+        self.assertEqual(mock_manager_cls.call_count, 2)
+
     @patch('topsailai.context.ctx_manager.ALL_MANAGERS')
     @patch('topsailai.context.ctx_manager.logger')
     def test_get_managers_by_env_with_empty_env(self, mock_logger, mock_all_managers):
@@ -138,6 +161,12 @@ class TestGetManagersByEnv(unittest.TestCase):
 class TestGetSessionManager(unittest.TestCase):
     """Test cases for get_session_manager() function."""
 
+    def setUp(self):
+        """Set up test fixtures."""
+        from topsailai.context.ctx_manager import reset_session_managers
+        reset_session_managers()
+        self.addCleanup(reset_session_managers)
+
     @patch('topsailai.context.ctx_manager.SessionSQLAlchemy')
     @patch('topsailai.context.ctx_manager.get_managers_by_env')
     def test_get_session_manager_with_provided_conn(self, mock_get_managers, mock_session_sql):
@@ -191,6 +220,22 @@ class TestGetSessionManager(unittest.TestCase):
         # Verify
         mock_session_sql.assert_called_once_with('sqlite://default.db')
 
+    @patch('topsailai.context.ctx_manager.SessionSQLAlchemy')
+    @patch('topsailai.context.ctx_manager.get_managers_by_env')
+    def test_get_session_manager_reused_by_conn(self, mock_get_managers, mock_session_sql):
+        """Test get_session_manager builds one session manager per connection string."""
+        from topsailai.context.ctx_manager import get_session_manager
+
+        mock_session_sql.side_effect = lambda conn: MagicMock(conn=conn)
+
+        first = get_session_manager(conn='sqlite://a.db')
+        second = get_session_manager(conn='sqlite://a.db')
+        other = get_session_manager(conn='sqlite://b.db')
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(mock_session_sql.call_count, 2)
+
     @patch('topsailai.context.ctx_manager.SessionSQLAlchemy')
     @patch('topsailai.context.ctx_manager.get_managers_by_env')
     def test_get_session_manager_raises_exception(self, mock_get_managers, mock_session_sql):
@@ -582,6 +627,26 @@ class TestAddSessionMessage(unittest.TestCase):
         # Verify
         self.assertFalse(result)
 
+    @patch.dict(os.environ, {"TOPSAILAI_SESSION_ASYNC_WRITE": "1"})
+    @patch('topsailai.context.ctx_manager.get_managers_by_env')
+    def test_add_session_message_async_write(self, mock_get_managers):
+        """Test add_session_message queues the message to the background writer in order."""
+        from topsailai.context.ctx_manager import add_session_message, flush_session_messages
+
+        written = []
+        mock_manager = MagicMock()
+        mock_manager.add_session_message.side_effect = lambda message, session_id: written.append(message["content"])
+        mock_get_managers.return_value = [mock_manager]
+
+        message = {'role': 'user', 'content': 'Hello'}
+        self.assertTrue(add_session_message(session_id='test-session', message=message))
+        # changed by the caller after queued
+        message['content'] = 'changed'
+        self.assertTrue(add_session_message(session_id='test-session', message={'role': 'user', 'content': 'World'}))
+
+        flush_session_messages()
+        self.assertEqual(written, ['Hello', 'World'])
+
 
 class TestDelSessionMessages(unittest.TestCase):
     """Test cases for del_session_messages() function."""
@@ -738,6 +803,27 @@ class TestModuleIntegration(unittest.TestCase):
         self.assertTrue(callable(del_session_messages))
         self.assertTrue(callable(cut_messages))
 
+    def test_sqlalchemy_is_imported_on_first_use(self):
+        """Test importing the module does not import SQLAlchemy, the backends are loaded on first use."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from topsailai.context import ctx_manager\n"
+            "assert 'sqlalchemy' not in sys.modules\n"
+            "assert 'sql.ChatHistorySQLAlchemy' in ctx_manager.ALL_MANAGERS\n"
+            "assert ctx_manager.SessionSQLAlchemy.__name__ == 'SessionSQLAlchemy'\n"
+            "assert 'sqlalchemy' in sys.modules\n"
+        )
+        import topsailai
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(topsailai.__file__)), env.get("PYTHONPATH", "")]
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 
 
 
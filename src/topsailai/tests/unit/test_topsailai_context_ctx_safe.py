@@ -84,6 +84,14 @@ class TestIsNeedTruncate(unittest.TestCase):
         result = is_need_truncate(LARGE_MSG_SIZE + 1)
         self.assertTrue(result)
 
+    @patch('topsailai.context.ctx_safe.get_agent_name')
+    def test_small_message_skips_agent_lookup(self, mock_get_agent_name):
+        """Test that a message below MAX_MSG_SIZE does not look up the agent."""
+        from topsailai.context.ctx_safe import is_need_truncate, MAX_MSG_SIZE
+        result = is_need_truncate(MAX_MSG_SIZE - 1)
+        self.assertFalse(result)
+        mock_get_agent_name.assert_not_called()
+
     @patch('topsailai.context.ctx_safe.get_agent_name')
     def test_need_truncate_zero_length(self, mock_get_agent_name):
         """Test no truncation for zero length message."""
@@ -192,6 +200,20 @@ class TestTruncateMessage(unittest.TestCase):
         result = truncate_message(unicode_message)
         self.assertTrue(result.endswith(SUFFIX_TRUNCATE))
 
+    @patch('topsailai.context.ctx_safe.get_agent_name')
+    @patch('topsailai.context.ctx_safe.print_tool')
+    def test_truncate_bytes_keeps_utf8_characters(self, mock_print_tool, mock_get_agent_name):
+        """Test that bytes truncation does not split a multi-byte UTF-8 character."""
+        mock_get_agent_name.return_value = "StandardAgent"
+        from topsailai.context.ctx_safe import truncate_message, MAX_MSG_SIZE, SUFFIX_TRUNCATE_BYTES
+        # each character is 3 bytes, MAX_MSG_SIZE falls inside a character
+        long_message = b"a" + "\u4e2d".encode("utf-8") * (MAX_MSG_SIZE // 3 + 10)
+        result = truncate_message(long_message)
+        self.assertTrue(result.endswith(SUFFIX_TRUNCATE_BYTES))
+        body = result[:-len(SUFFIX_TRUNCATE_BYTES)]
+        self.assertLessEqual(len(body), MAX_MSG_SIZE)
+        self.assertEqual(body.decode("utf-8")[1:], "\u4e2d" * ((len(body) - 1) // 3))
+
     @patch('topsailai.context.ctx_safe.get_agent_name')
     @patch('topsailai.context.ctx_safe.print_tool')
     def test_truncate_preserves_content_before_limit(self, mock_print_tool, mock_get_agent_name):
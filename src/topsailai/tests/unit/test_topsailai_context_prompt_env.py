@@ -183,6 +183,27 @@ class TestCurrentSystem:
             assert "SystemInfo:" in result
             # Should not have any bullet points
 
+    def test_current_system_prompt_cached(self):
+        """Test that the prompt is formatted once for the same system_info."""
+        from topsailai.context.prompt_env import CurrentSystem
+
+        with patch.object(CurrentSystem, 'system_info', {'uname': 'Linux'}):
+            first = CurrentSystem().prompt
+            assert CurrentSystem().prompt is first
+
+        with patch.object(CurrentSystem, 'system_info', {'uname': 'Other'}):
+            assert "- uname:Other" in CurrentSystem().prompt
+
+    def test_current_system_info_collected_on_first_prompt(self):
+        """Test that the system info is collected on the first prompt only."""
+        from topsailai.context.prompt_env import CurrentSystem
+
+        with patch.object(CurrentSystem, 'system_info', None):
+            with patch('topsailai.context.prompt_env.get_system_info', return_value={'uname': 'Lazy'}) as mock_get:
+                assert "- uname:Lazy" in CurrentSystem().prompt
+                assert "- uname:Lazy" in CurrentSystem().prompt
+                mock_get.assert_called_once()
+
 
 class TestGeneratePromptForEnv:
     """Tests for generate_prompt_for_env function."""
@@ -233,6 +254,23 @@ class TestGeneratePromptForEnv:
                 
                 assert "Content from file" in result
 
+    def test_read_env_prompt_file_reads_again_when_changed(self, tmp_path):
+        """Test the ENV_PROMPT file is cached until it is changed."""
+        from topsailai.context import prompt_env
+
+        env_file = tmp_path / "env_prompt.txt"
+        env_file.write_text("first")
+        assert prompt_env.read_env_prompt_file(str(env_file)) == "first"
+
+        with patch("builtins.open", side_effect=AssertionError("should not read")):
+            assert prompt_env.read_env_prompt_file(str(env_file)) == "first"
+
+        env_file.write_text("second content")
+        assert prompt_env.read_env_prompt_file(str(env_file)) == "second content"
+
+        prompt_env.reset_env_prompt_files()
+        assert prompt_env.g_env_prompt_files == {}
+
     def test_generate_prompt_with_slash_path(self, monkeypatch):
         """Test prompt generation with ENV_PROMPT starting with slash."""
         monkeypatch.setenv("ENV_PROMPT", "/etc/custom_env")
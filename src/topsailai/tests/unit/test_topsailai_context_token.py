@@ -73,6 +73,69 @@ class TestCountTokens(unittest.TestCase):
         self.assertGreater(result, 5)
 
 
+class TestGetEncoding(unittest.TestCase):
+    """Test cases for the cached encodings."""
+
+    def setUp(self):
+        self.module_globals = count_tokens.__globals__
+        self.module_globals["reset_encodings"]()
+
+    def tearDown(self):
+        self.module_globals["reset_encodings"]()
+
+    def test_encoding_is_loaded_once(self):
+        """Test the encoding is loaded once and special tokens are plain text."""
+        encoding = MagicMock()
+        encoding.encode_ordinary.return_value = [1, 2, 3]
+        with patch.object(self.module_globals["tiktoken"], "get_encoding", return_value=encoding) as mock_get_encoding:
+            self.assertEqual(count_tokens("hi <|endoftext|>", encoding_name="test_enc"), 3)
+            self.assertEqual(count_tokens("hi", encoding_name="test_enc"), 3)
+
+        mock_get_encoding.assert_called_once_with("test_enc")
+        encoding.encode_ordinary.assert_called_with("hi")
+
+    def test_encoding_failure_is_cached(self):
+        """Test a failed encoding is not loaded again."""
+        with patch.object(self.module_globals["tiktoken"], "get_encoding", side_effect=ValueError("offline")) as mock_get_encoding:
+            self.assertEqual(count_tokens("a", encoding_name="test_enc"), 0)
+            self.assertEqual(count_tokens("b", encoding_name="test_enc"), 0)
+
+        self.assertEqual(mock_get_encoding.call_count, 1)
+
+    def test_model_encoding_is_loaded_once(self):
+        """Test the encoding of a model is shared with count_tokens."""
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2]
+        with patch.object(self.module_globals["tiktoken"], "get_encoding", return_value=encoding) as mock_get_encoding:
+            self.assertEqual(count_tokens_for_model("hi", "gpt-4"), 2)
+            self.assertEqual(count_tokens_for_model("hi", "gpt-3.5-turbo"), 2)
+
+        mock_get_encoding.assert_called_once_with("cl100k_base")
+
+    def test_model_encoding_unknown_model(self):
+        """Test an unknown model counts 0 tokens."""
+        self.assertEqual(count_tokens_for_model("hi", "unknown-model-xyz"), 0)
+
+
+class TestGetMsgCacheKey(unittest.TestCase):
+    """Test cases for get_msg_cache_key function."""
+
+    def test_plain_message_is_keyed_by_items(self):
+        """Test a dict of strings is keyed by items, equal messages get equal keys."""
+        key_func = count_tokens.__globals__["get_msg_cache_key"]
+        msg = {"role": "user", "content": "hi"}
+        self.assertEqual(key_func(msg), (("role", "user"), ("content", "hi")))
+        self.assertEqual(key_func(dict(msg)), key_func(msg))
+        self.assertNotEqual(key_func({"role": "user", "content": "hello"}), key_func(msg))
+
+    def test_other_message_is_keyed_by_text(self):
+        """Test the messages with non-string values are keyed by their text."""
+        key_func = count_tokens.__globals__["get_msg_cache_key"]
+        msg = {"role": "assistant", "tool_calls": [{"id": "1"}]}
+        self.assertEqual(key_func(msg), hash(str(msg)))
+        self.assertEqual(key_func("text"), hash("text"))
+
+
 class TestCountTokensForModel(unittest.TestCase):
     """Test cases for count_tokens_for_model function."""
 
@@ -206,6 +269,23 @@ class TestTokenStat(unittest.TestCase):
         self.assertGreater(stat.total_count, first_total)
         stat.flag_running = False
 
+    def test_token_stat_count_msgs_caches_history(self):
+        """Test only the new messages are encoded in the next turn."""
+        stat = TokenStat(self.llm_id, lifetime=0)
+        stat.flag_running = False
+        msgs = [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}]
+
+        mock_count_tokens = MagicMock(return_value=3)
+        with patch.dict(stat.count_msgs.__func__.__globals__, {"count_tokens": mock_count_tokens}):
+            self.assertEqual(stat.count_msgs(msgs), (6, len(str(msgs[0])) + len(str(msgs[1]))))
+            self.assertEqual(mock_count_tokens.call_count, 2)
+
+            msgs.append({"role": "assistant", "content": "hello"})
+            self.assertEqual(stat.count_msgs(msgs)[0], 9)
+            self.assertEqual(mock_count_tokens.call_count, 3)
+
+        self.assertEqual(len(stat._tok_cache), 3)
+
     def test_token_stat_output_token_stat(self):
         """Test output_token_stat method."""
         stat = TokenStat(self.llm_id, lifetime=0)
@@ -457,6 +457,10 @@ class TestGetPromptByTools(unittest.TestCase):
 class TestGeneratePromptByTools(unittest.TestCase):
     """Test generate_prompt_by_tools function"""
 
+    def setUp(self):
+        from topsailai.prompt_hub.prompt_tool import reset_tool_prompt_cache
+        reset_tool_prompt_cache()
+
     @patch('topsailai.prompt_hub.prompt_tool.get_prompt_by_tools')
     @patch('topsailai.prompt_hub.prompt_tool.get_extra_tools')
     @patch('topsailai.prompt_hub.prompt_tool.env_tool.is_use_tool_calls')
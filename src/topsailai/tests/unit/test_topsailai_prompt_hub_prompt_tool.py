@@ -307,6 +307,10 @@ class TestGetPromptByTools(unittest.TestCase):
 class TestGeneratePromptByTools(unittest.TestCase):
     """Test generate_prompt_by_tools function."""
 
+    def setUp(self):
+        from topsailai.prompt_hub.prompt_tool import reset_tool_prompt_cache
+        reset_tool_prompt_cache()
+
     @patch('topsailai.prompt_hub.prompt_tool.get_extra_tools')
     @patch('topsailai.prompt_hub.prompt_tool.get_prompt_by_tools')
     @patch('topsailai.prompt_hub.prompt_tool.env_tool')
@@ -347,6 +351,39 @@ class TestGeneratePromptByTools(unittest.TestCase):
             result = generate_prompt_by_tools(["tool1"])
             self.assertIn("tool docs", result)
 
+    @patch('topsailai.prompt_hub.prompt_tool.get_extra_tools')
+    @patch('topsailai.prompt_hub.prompt_tool.get_prompt_by_tools')
+    @patch('topsailai.prompt_hub.prompt_tool.env_tool')
+    def test_generate_prompt_by_tools_uses_cache(self, mock_env, mock_get_prompt, mock_extra):
+        """Verify the same tools build the prompt only once."""
+        from topsailai.prompt_hub.prompt_tool import generate_prompt_by_tools
+        mock_env.is_use_tool_calls.return_value = True
+        mock_get_prompt.return_value = "tool prompt"
+        mock_extra.return_value = ""
+        first = generate_prompt_by_tools(["tool2", "tool1"])
+        second = generate_prompt_by_tools(["tool1", "tool2"])
+        self.assertEqual(first, second)
+        mock_get_prompt.assert_called_once()
+
+        # other tools are not served from the cache
+        generate_prompt_by_tools(["tool3"])
+        self.assertEqual(mock_get_prompt.call_count, 2)
+
+    @patch('topsailai.prompt_hub.prompt_tool.get_extra_tools')
+    @patch('topsailai.prompt_hub.prompt_tool.get_prompt_by_tools')
+    @patch('topsailai.prompt_hub.prompt_tool.env_tool')
+    def test_generate_prompt_by_tools_need_reload_bypasses_cache(self, mock_env, mock_get_prompt, mock_extra):
+        """Verify need_reload rebuilds the prompt and refreshes the cache."""
+        from topsailai.prompt_hub.prompt_tool import generate_prompt_by_tools
+        mock_env.is_use_tool_calls.return_value = True
+        mock_extra.return_value = ""
+        mock_get_prompt.return_value = "old"
+        generate_prompt_by_tools(["tool1"])
+        mock_get_prompt.return_value = "new"
+        self.assertIn("new", generate_prompt_by_tools(["tool1"], need_reload=True))
+        self.assertIn("new", generate_prompt_by_tools(["tool1"]))
+        self.assertEqual(mock_get_prompt.call_count, 2)
+
 
 class TestGetPromptFilePath(unittest.TestCase):
     """Test get_prompt_file_path function."""
@@ -565,6 +602,10 @@ class TestModuleExports(unittest.TestCase):
 class TestPromptConstructionOrder(unittest.TestCase):
     """Tests verifying deterministic prompt construction order."""
 
+    def setUp(self):
+        from topsailai.prompt_hub.prompt_tool import reset_tool_prompt_cache
+        reset_tool_prompt_cache()
+
     @patch('topsailai.prompt_hub.prompt_tool.get_extra_tools')
     @patch('topsailai.prompt_hub.prompt_tool.get_prompt_by_tools')
     @patch('topsailai.prompt_hub.prompt_tool.env_tool')
@@ -619,5 +660,41 @@ class TestPromptConstructionOrder(unittest.TestCase):
         self.assertEqual(set(called_keys), {"tools/z_module.md", "tools/a_module.md", "tools/m_module.md"})
 
 
+class TestGetSystemPromptContent(unittest.TestCase):
+    """Test get_system_prompt_content function."""
+
+    def test_returns_content_when_not_a_file(self):
+        """Verify non-path values are returned as prompt content."""
+        from topsailai.prompt_hub.prompt_tool import get_system_prompt_content
+        self.assertEqual(get_system_prompt_content("You are a helper."), "You are a helper.")
+
+    def test_reads_env_system_prompt(self):
+        """Verify SYSTEM_PROMPT is used when no argument is given."""
+        from topsailai.prompt_hub.prompt_tool import get_system_prompt_content
+        with patch.dict(os.environ, {"SYSTEM_PROMPT": "env prompt"}):
+            self.assertEqual(get_system_prompt_content(), "env prompt")
+        with patch.dict(os.environ, {"SYSTEM_PROMPT": ""}):
+            self.assertEqual(get_system_prompt_content(), "")
+
+    def test_file_is_read_once_until_modified(self):
+        """Verify the prompt file is cached by (path, mtime)."""
+        import tempfile
+        from topsailai.prompt_hub import prompt_tool
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sys.md")
+            with open(path, "w", encoding="utf-8") as fd:
+                fd.write("first")
+            with patch('builtins.open', wraps=open) as spy_open:
+                self.assertEqual(prompt_tool.get_system_prompt_content(path), "first")
+                self.assertEqual(prompt_tool.get_system_prompt_content(path), "first")
+                self.assertEqual(spy_open.call_count, 1)
+
+            with open(path, "w", encoding="utf-8") as fd:
+                fd.write("second")
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            self.assertEqual(prompt_tool.get_system_prompt_content(path), "second")
+
+
 if __name__ == '__main__':
     unittest.main()
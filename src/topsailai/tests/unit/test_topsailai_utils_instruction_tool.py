@@ -19,6 +19,7 @@ from topsailai.utils.instruction_tool import (
     HookInstruction,
     TRIGGER_CHARS,
     SPLIT_LINE,
+    hook_message,
 )
 
 
@@ -124,6 +125,16 @@ class TestConstants(unittest.TestCase):
         self.assertIsInstance(SPLIT_LINE, str)
         self.assertTrue(len(SPLIT_LINE) > 0)
 
+    def test_hook_message_exit_words(self):
+        """Test hook_message exits on the exit words."""
+        for word in ["exit", "quit", "/exit", "/quit", "q", "  q  "]:
+            with self.assertRaises(SystemExit):
+                hook_message(word, None)
+
+    def test_hook_message_plain_text(self):
+        """Test hook_message ignores plain text."""
+        self.assertFalse(hook_message("quite", None))
+
 
 class TestHookInstructionBase(unittest.TestCase):
     """Test cases for base HookInstruction in utils/instruction_tool.py."""
@@ -190,6 +201,25 @@ class TestHookInstructionBase(unittest.TestCase):
             hook_inst.add_hook('/test', dummy)
             mock_refresh.assert_called_once()
 
+    def test_load_instructions_refreshes_once(self):
+        """Test load_instructions refreshes completions once for the batch."""
+        hook_inst = self._make_hook_instruction()
+        instructions = {f'/cmd{i}': _make_dummy_func() for i in range(5)}
+        with patch.object(hook_inst, 'refresh_input_completions') as mock_refresh:
+            hook_inst.load_instructions(instructions)
+            mock_refresh.assert_called_once()
+        for key in instructions:
+            self.assertIn(key, hook_inst.hook_map)
+
+    def test_init_generates_completions_once(self):
+        """Test __init__ does not regenerate completions per hook."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "completions.json")
+            instructions = {f'/cmd{i}': _make_dummy_func() for i in range(5)}
+            with patch.object(HookInstruction, 'generate_input_completions') as mock_gen:
+                HookInstruction(file_input_completions=path, instructions=instructions)
+                mock_gen.assert_called_once()
+
     def test_del_hook_removes_function(self):
         """Test del_hook removes a specific function and its key when empty."""
         hook_inst = self._make_hook_instruction()
@@ -94,6 +94,62 @@ def test_json_load():
         json_load('invalid json')
 
 
+def test_json_load_prefers_orjson(monkeypatch):
+    """Test json_load parses with orjson when it is installed."""
+    from types import SimpleNamespace
+    from topsailai.utils import json_tool
+
+    fake_orjson = SimpleNamespace(
+        loads=lambda content: {"parsed_by": "orjson"},
+        JSONDecodeError=ValueError,
+    )
+    monkeypatch.setattr(json_tool, "orjson", fake_orjson)
+    assert json_tool.json_load('{"key": "value"}') == {"parsed_by": "orjson"}
+
+
+def test_json_load_falls_back_to_simplejson(monkeypatch):
+    """Test json_load retries with simplejson when orjson rejects the content."""
+    from types import SimpleNamespace
+    from topsailai.utils import json_tool
+
+    def _loads(content):
+        raise ValueError("rejected")
+
+    monkeypatch.setattr(json_tool, "orjson", SimpleNamespace(loads=_loads, JSONDecodeError=ValueError))
+    assert json_tool.json_load('{"key": 18446744073709551616}') == {"key": 18446744073709551616}
+
+    monkeypatch.setattr(json_tool, "orjson", None)
+    assert json_tool.json_load('{"key": "value"}') == {"key": "value"}
+
+
+def test_to_json_str_does_not_depend_on_orjson(monkeypatch):
+    """Test to_json_str dumps by simplejson whether orjson is installed or not."""
+    from types import SimpleNamespace
+    from topsailai.utils import json_tool
+
+    def _dumps(*args, **kwargs):
+        raise AssertionError("orjson.dumps is not expected")
+
+    monkeypatch.setattr(json_tool, "orjson", SimpleNamespace(dumps=_dumps))
+    assert json_tool.to_json_str({"key": "value"}) == '{\n  "key": "value"\n}'
+
+
+@pytest.mark.parametrize("content", [
+    {"time": __import__("datetime").datetime(2026, 1, 2, 3, 4, 5)},
+    {"nan": float("nan"), "inf": float("inf")},
+    {"price": __import__("decimal").Decimal("1.10")},
+    {"big": 1e20, 2: "non-str key"},
+])
+def test_to_json_str_same_with_orjson(monkeypatch, content):
+    """Test the output is the same whether orjson is installed or not."""
+    from topsailai.utils import json_tool
+
+    monkeypatch.setattr(json_tool, "orjson", pytest.importorskip("orjson"))
+    with_orjson = json_tool.to_json_str(content)
+    monkeypatch.setattr(json_tool, "orjson", None)
+    assert with_orjson == json_tool.to_json_str(content)
+
+
 def test_safe_json_dump():
     """Test safe_json_dump function with various inputs."""
     # Test string input
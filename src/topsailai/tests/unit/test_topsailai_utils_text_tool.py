@@ -2,7 +2,7 @@ import pytest
 import chardet
 from io import StringIO
 import sys
-from topsailai.utils.text_tool import safe_decode, check_repetition, print_repetition_report
+from topsailai.utils.text_tool import safe_decode, check_repetition, print_repetition_report, add_answer_symbol
 
 
 def test_safe_decode_string_input():
@@ -407,5 +407,28 @@ class TestPrintRepetitionReport:
         assert "Analysis Started" in output
 
 
+def test_add_answer_symbol_default(monkeypatch):
+    """Test the default symbol is built from the agent name."""
+    monkeypatch.delenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER", raising=False)
+    assert add_answer_symbol("done", "AIMember.a") == "From 'AIMember.a':\ndone"
+    assert add_answer_symbol("done") == "done"
+    assert add_answer_symbol("") == ""
+
+
+def test_add_answer_symbol_from_env_not_duplicated(monkeypatch):
+    """Test the env symbol wins and is not added twice."""
+    monkeypatch.setenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER", "Prefix: ")
+    answer = add_answer_symbol("done", "AIMember.a")
+    assert answer == "Prefix: done"
+    assert add_answer_symbol(answer, "AIMember.a") == answer
+
+
+def test_add_answer_symbol_without_newline_not_duplicated(monkeypatch):
+    """Test an answer starting with the symbol but no newline is left alone."""
+    monkeypatch.delenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER", raising=False)
+    answer = "From 'AIMember.x': done"
+    assert add_answer_symbol(answer, "AIMember.x") == answer
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -400,6 +400,31 @@ class TestAgentChatRunEdgeCases(unittest.TestCase):
         self.assertTrue(hasattr(AgentChat, 'run'))
         self.assertTrue(callable(getattr(AgentChat, 'run')))
 
+    def test_arun_runs_sessions_concurrently(self):
+        """Test AgentChat.arun runs blocking sessions off the event loop."""
+        import asyncio
+        import threading
+        from topsailai.workspace.agent.agent_shell_base import AgentChat
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_run(self, message=None, **kwargs):
+            # both sessions must be running at the same time to pass
+            barrier.wait()
+            return f"answer:{message}"
+
+        async def main():
+            chat1 = AgentChat.__new__(AgentChat)
+            chat2 = AgentChat.__new__(AgentChat)
+            return await asyncio.gather(
+                chat1.arun(message="a"),
+                chat2.arun(message="b"),
+            )
+
+        with patch.object(AgentChat, "run", fake_run):
+            result = asyncio.run(main())
+        self.assertEqual(result, ["answer:a", "answer:b"])
+
 
 class TestGetSessionTokenTotals(unittest.TestCase):
     """Test cases for _get_session_token_totals helper."""
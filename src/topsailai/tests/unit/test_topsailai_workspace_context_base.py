@@ -210,6 +210,31 @@ class TestMessageOperations(unittest.TestCase):
         # Should still have 1 message
         self.assertEqual(len(runtime.messages), 1)
 
+    @patch.dict('os.environ', {"TOPSAILAI_CTX_WINDOW": "2"})
+    @patch('topsailai.workspace.context.base.AgentBase')
+    def test_append_message_bounded_by_ctx_window(self, mock_agent_base):
+        """Test that append_message drops the oldest messages beyond TOPSAILAI_CTX_WINDOW."""
+        from topsailai.workspace.context.base import ContextRuntimeBase
+
+        runtime = ContextRuntimeBase()
+        messages = runtime.messages
+        for i in range(3):
+            runtime.append_message({"role": "user", "content": f"m{i}"})
+
+        self.assertIs(runtime.messages, messages)
+        self.assertEqual([m["content"] for m in runtime.messages], ["m1", "m2"])
+
+    @patch.dict('os.environ', {"TOPSAILAI_CTX_WINDOW": "2"})
+    @patch('topsailai.workspace.context.base.AgentBase')
+    def test_set_messages_bounded_by_ctx_window(self, mock_agent_base):
+        """Test that set_messages keeps only the newest TOPSAILAI_CTX_WINDOW messages."""
+        from topsailai.workspace.context.base import ContextRuntimeBase
+
+        runtime = ContextRuntimeBase()
+        runtime.set_messages([{"role": "user", "content": f"m{i}"} for i in range(4)])
+
+        self.assertEqual([m["content"] for m in runtime.messages], ["m2", "m3"])
+
 
 class TestGetQuantityThreshold(unittest.TestCase):
     """Test suite for _get_quantity_threshold method."""
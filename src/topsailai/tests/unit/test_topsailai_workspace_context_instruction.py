@@ -126,9 +126,22 @@ class TestContextRuntimeInstructions(unittest.TestCase):
         self.mock_ctx_runtime_data.messages = ["msg1", "msg2"]
         self.mock_subprocess.return_value = "pid_123"
 
-        self.instruction.ctx_story()
+        with patch('topsailai.workspace.context.instruction.threading.Thread') as mock_thread:
+            self.instruction.ctx_story()
+
+        mock_thread.assert_called_once()
+        self.assertIs(mock_thread.call_args.kwargs["target"], self.mock_subprocess)
+        self.assertEqual(mock_thread.call_args.kwargs["args"], (["msg1", "msg2"],))
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_ctx_story_wait(self):
+        """Test ctx_story with "wait" launches the story in the foreground."""
+        self.mock_ctx_runtime_data.messages = ["msg1", "msg2"]
+        self.mock_subprocess.return_value = "pid_123"
+
+        self.instruction.ctx_story("wait")
 
-        self.mock_subprocess.assert_called_once_with(self.mock_ctx_runtime_data.messages)
+        self.mock_subprocess.assert_called_once_with(["msg1", "msg2"])
 
     def test_ctx_story_without_messages(self):
         """Test ctx_story when no messages - should skip."""
@@ -173,6 +186,37 @@ class TestContextRuntimeInstructions(unittest.TestCase):
         expected_msgs = self.mock_ctx_runtime_data.messages[1:3]
         self.mock_print_ctx.assert_called_with(expected_msgs)
 
+    def test_ctx_history_only_new_prints_tail(self):
+        """Test ctx_history(only_new=True) only prints messages added since the last display."""
+        self.mock_ctx_runtime_data.session_id = "test_session"
+        self.mock_ctx_runtime_data.messages = ["msg0", "msg1"]
+        self.instruction.ctx_history()
+
+        self.mock_ctx_runtime_data.messages = ["msg0", "msg1", "msg2", "msg3"]
+        self.instruction.ctx_history(only_new=True)
+
+        self.mock_print_ctx.assert_called_with(["msg2", "msg3"], start=2)
+
+    def test_ctx_history_only_new_reprints_when_context_changed(self):
+        """Test ctx_history(only_new=True) prints all messages after the shown ones changed."""
+        self.mock_ctx_runtime_data.session_id = "test_session"
+        self.mock_ctx_runtime_data.messages = ["msg0", "msg1"]
+        self.instruction.ctx_history()
+
+        self.mock_ctx_runtime_data.messages = ["summary", "msg2", "msg3"]
+        self.instruction.ctx_history(only_new=True)
+
+        self.mock_print_ctx.assert_called_with(self.mock_ctx_runtime_data.messages)
+
+    def test_ctx_history_full(self):
+        """Test ctx_history with "full" displays all messages."""
+        self.mock_ctx_runtime_data.session_id = "test_session"
+        self.mock_ctx_runtime_data.messages = ["msg0", "msg1"]
+
+        self.instruction.ctx_history(offset="full")
+
+        self.mock_print_ctx.assert_called_once_with(self.mock_ctx_runtime_data.messages)
+
     ##############################################################################
     # TestCtxHistory2
     ##############################################################################
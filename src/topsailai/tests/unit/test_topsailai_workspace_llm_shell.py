@@ -383,14 +383,16 @@ class TestGetLLMChat(unittest.TestCase):
         mock_ctx.get_messages_by_session.return_value = []
         mock_ctx.create_session.return_value = None
 
-        chat = get_llm_chat(
-            message=self.test_message,
-            session_id=self.test_session_id,
-            system_prompt="system_prompt",
-            more_prompt="more_prompt",
-            need_input_message=False,
-            need_print_session=False
-        )
+        with patch('topsailai.workspace.llm_shell.prompt_tool.get_system_prompt_content',
+                   return_value="Base system prompt"):
+            chat = get_llm_chat(
+                message=self.test_message,
+                session_id=self.test_session_id,
+                system_prompt="system_prompt",
+                more_prompt="more_prompt",
+                need_input_message=False,
+                need_print_session=False
+            )
 
         # Verify more_prompt was appended
         call_args = mock_prompt_base.call_args[0][0]
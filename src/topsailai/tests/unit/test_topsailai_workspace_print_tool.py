@@ -501,6 +501,15 @@ class TestPrintContextMessages(unittest.TestCase):
         self.assertIn("Words:", output)
         self.assertIn("Tokens:", output)
 
+    def test_print_context_messages_start_numbering(self):
+        """Test print_context_messages numbers a context tail from start."""
+        sys.stdout = self.captured_output
+
+        print_context_messages([{'role': 'user', 'content': 'Hello'}], start=4)
+
+        output = self.captured_output.getvalue()
+        self.assertIn("#5 - Role: USER", output)
+
     def test_print_context_messages_empty_list(self):
         """Test print_context_messages with empty list."""
         sys.stdout = self.captured_output
@@ -8,7 +8,6 @@
 # pylint: disable=C0209
 
 import os
-import traceback
 
 from topsailai.context import ctx_safe
 from topsailai.utils import (
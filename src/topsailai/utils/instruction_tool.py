@@ -27,7 +27,10 @@ from topsailai.utils import (
 logger = logging.getLogger(__name__)
 
 
-DESCRIPTION_EXIT_SET = ["exit", "quit", "/exit", "/quit", "q"]
+DESCRIPTION_EXIT_SET = frozenset(["exit", "quit", "/exit", "/quit", "q"])
+
+# Arguments that ask for the help of a hook
+DESCRIPTION_HELP_SET = frozenset(["help", "--help", "-h", "/help", "@help"])
 
 # Characters that trigger hook processing when found at the beginning of a message
 TRIGGER_CHARS = "/"
@@ -124,10 +127,10 @@ class HookInstruction(HookBaseUtils):
         # Dictionary mapping hook names to lists of HookFunc objects
         # Structure: {hook_name: [HookFunc1, HookFunc2, ...]}
         self.hook_map = {}
-        self.add_hook("/help", self.show_help, "show help info")
+        self.add_hook("/help", self.show_help, "show help info", refresh=False)
 
-        # add plugin hooks
-        self.load_instructions(self.instructions)
+        # add plugin hooks, completions are generated once below
+        self.load_instructions(self.instructions, refresh=False)
 
         # generate input completions for terminal TAB completion
         self.generate_input_completions()
@@ -263,10 +266,12 @@ class HookInstruction(HookBaseUtils):
             )
         return
 
-    def load_instructions(self, instructions:dict):
-        """ add instructions to hook_map """
+    def load_instructions(self, instructions:dict, refresh:bool=True):
+        """ add instructions to hook_map, refresh completions once for the whole batch """
         for key, func in instructions.items():
-            self.add_hook(key, func, "")
+            self.add_hook(key, func, "", refresh=False)
+        if refresh:
+            self.refresh_input_completions()
         return
 
     def __print_hook(self, hook_name:str):
@@ -345,7 +350,7 @@ class HookInstruction(HookBaseUtils):
         readline.set_completer_delims(delims)
         return
 
-    def add_hook(self, hook_name, hook_func: HookFunc, description=""):
+    def add_hook(self, hook_name, hook_func: HookFunc, description="", refresh:bool=True):
         """
         Register a new hook function.
 
@@ -356,6 +361,8 @@ class HookInstruction(HookBaseUtils):
             hook_name (str): The trigger string for the hook (e.g., "/clear")
             hook_func (HookFunc or callable): The function to register
             description (str, optional): Description of the hook function. Defaults to "".
+            refresh (bool, optional): Regenerate input completions after adding.
+                Batch registrations pass False and refresh once at the end. Defaults to True.
 
         Returns:
             None
@@ -378,7 +385,8 @@ class HookInstruction(HookBaseUtils):
             )
 
         self.hook_map[hook_name].append(hook_func)
-        self.refresh_input_completions()
+        if refresh:
+            self.refresh_input_completions()
         return
 
     def del_hook(self, hook_name, hook_func: HookFunc):
@@ -407,15 +415,7 @@ class HookInstruction(HookBaseUtils):
 
     def __is_help(self, s) -> bool:
         """ check str if is 'help' """
-        if isinstance(s, str) and s in [
-            "help",
-            "--help",
-            "-h",
-            "/help",
-            "@help",
-        ]:
-            return True
-        return False
+        return isinstance(s, str) and s in DESCRIPTION_HELP_SET
 
     def call_hook(self, hook_name, kwargs:str|dict=None):
         """
@@ -498,7 +498,7 @@ class HookInstruction(HookBaseUtils):
                 return True
 
             # /xxx kwargs
-            hook_name = hook_name.split(' ', 1)[0]
+            hook_name = hook_name.partition(' ')[0]
             if hook_name in self.hook_map:
                 return True
 
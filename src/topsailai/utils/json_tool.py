@@ -1,6 +1,12 @@
 import simplejson
 from .print_tool import print_error
 
+try:
+    # optional, much faster than simplejson to parse
+    import orjson
+except ImportError:
+    orjson = None
+
 def convert_code_block_to_json_str(content:str):
     """Convert markdown code blocks containing JSON to valid JSON string.
 
@@ -223,6 +229,12 @@ def json_load(content):
     """
     if not isinstance(content, str):
         return content
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # simplejson is more lenient, e.g. integer over 64 bits
+            pass
     return simplejson.loads(content)
 
 def safe_json_dump(obj, indent=2, ensure_ascii=False, default=None) -> str:
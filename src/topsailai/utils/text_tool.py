@@ -5,6 +5,7 @@
   Purpose: Text processing and encoding utilities
 '''
 
+import os
 from difflib import SequenceMatcher
 import chardet
 
@@ -200,6 +201,35 @@ def print_repetition_report(result: dict) -> None:
         print("\n✅ Text repetition is within normal range.")
 
 
+def add_answer_symbol(answer: str, agent_name: str = None) -> str:
+    """
+    Prepend the answer symbol to the answer if it does not have it yet.
+
+    The symbol is TOPSAILAI_SYMBOL_STARTSWITH_ANSWER, or "From '{agent_name}':\n" by default.
+
+    Args:
+        answer (str): The raw answer.
+        agent_name (str): The name of the agent who answers.
+
+    Returns:
+        str: The answer with the symbol.
+    """
+    if not answer:
+        return answer
+
+    symbol_start = os.getenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER")
+    if not symbol_start and agent_name:
+        symbol_start = f"From '{agent_name}':\n"
+    if not symbol_start:
+        return answer
+
+    # only look at the head, the answer may be long;
+    # the symbol may be followed by a space instead of the newline
+    if symbol_start.strip() not in answer[:len(symbol_start)+17]:
+        answer = symbol_start + answer
+    return answer
+
+
 # Test execution
 if __name__ == "__main__":
     # --- Test data (based on provided log snippets) ---
@@ -11,6 +11,7 @@ from topsailai.logger import logger
 from topsailai.utils import (
     env_tool,
     print_tool,
+    text_tool,
 )
 from topsailai.ai_base.constants import (
     ROLE_ASSISTANT,
@@ -316,12 +317,7 @@ class AgentChatBase(object):
             return answer
 
         if need_symbol:
-            # symbol
-            symbol_start = os.getenv("TOPSAILAI_SYMBOL_STARTSWITH_ANSWER")
-            if not symbol_start and self.agent_name:
-                symbol_start = f"From '{self.agent_name}':\n"
-            if symbol_start and symbol_start not in answer[:len(symbol_start)+17]:
-                answer = symbol_start + answer
+            answer = text_tool.add_answer_symbol(answer, self.agent_name)
 
         return answer
 
@@ -10,6 +10,7 @@
 
 import sys
 import time
+import asyncio
 
 from topsailai.logger import logger
 from topsailai.utils import (
@@ -111,6 +112,20 @@ class AgentChat(AgentChatBase):
         """
         return self._run(*args, **kwargs)
 
+    async def arun(self, *args, **kwargs):
+        """Run the agent chat session without blocking the event loop.
+
+        The session runs in a worker thread via asyncio.to_thread, so one
+        interpreter can drive several non-interactive sessions at once, e.g.
+        ``await asyncio.gather(chat1.arun(msg1), chat2.arun(msg2))``.
+
+        Args: the same as run.
+
+        Returns:
+            str: The final answer from the AI agent.
+        """
+        return await asyncio.to_thread(self.run, *args, **kwargs)
+
     def _run(
             self,
             message:str=None,
@@ -294,9 +309,11 @@ class AgentChat(AgentChatBase):
             if times > 0 and curr_count >= times:
                 break
 
-            self.ctx_runtime_data.reset_messages()
+            # no need to refresh session messages here:
+            # ctx_history refreshes them before printing, and the next run
+            # refreshes them in hook_after_init_prompt.
             if env_tool.is_interactive_mode():
-                self.ctx_rt_instruction.ctx_history()
+                self.ctx_rt_instruction.ctx_history(only_new=True)
 
             # end time
             end_time = int(time.time())
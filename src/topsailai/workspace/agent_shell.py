@@ -16,6 +16,7 @@ from topsailai.ai_base.agent_types.init import (
     get_agent_type,
 )
 from topsailai.ai_base.agent_base import AgentRun
+from topsailai.prompt_hub import prompt_tool
 from topsailai.workspace.project_history import record_project_history
 from topsailai.context import ctx_manager
 from topsailai.workspace.input_tool import (
@@ -133,8 +134,7 @@ def _get_agent_chat_impl(
 
     # system prompt
     if not system_prompt:
-        env_sys_prompt = os.getenv("SYSTEM_PROMPT")
-        _, sys_prompt_content = file_tool.get_file_content_fuzzy(env_sys_prompt)
+        sys_prompt_content = prompt_tool.get_system_prompt_content()
         if sys_prompt_content:
             system_prompt = sys_prompt_content
 
@@ -124,5 +124,5 @@ class ContextRuntimeAIAgent(ContextRuntimeUtils):
                 if not message_tool.message_in_list(msg, self.ai_agent.messages):
                     self.ai_agent.messages.append(msg)
         else:
-            self.ai_agent.messages += self.messages
+            self.ai_agent.messages.extend(self.messages)
         return
@@ -113,6 +113,7 @@ class ContextRuntimeBase(object):
             return
 
         self.messages.append(message)
+        self._trim_messages()
 
     def set_messages(self, value: list):
         """
@@ -139,6 +140,26 @@ class ContextRuntimeBase(object):
             return
         self.messages.clear()
         self.messages += value
+        self._trim_messages()
+        return
+
+    def _trim_messages(self):
+        """
+        Keep at most TOPSAILAI_CTX_WINDOW in-memory messages by dropping the
+        oldest ones in-place. 0 (default) means no limit.
+
+        The session storage is not touched, only the runtime copy is bounded.
+
+        Returns:
+            None
+        """
+        ctx_window = env_tool.EnvReaderInstance.get(
+            "TOPSAILAI_CTX_WINDOW",
+            default=0,
+            formatter=int,
+        ) or 0
+        if ctx_window > 0 and len(self.messages) > ctx_window:
+            del self.messages[:len(self.messages) - ctx_window]
         return
 
     def reset_messages(self):
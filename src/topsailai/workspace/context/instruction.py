@@ -11,6 +11,7 @@ Created: 2026-03-23
 """
 
 import json
+import threading
 
 from topsailai.ai_base.constants import (
     ROLE_USER,
@@ -41,6 +42,10 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
     Inherits utility methods from ContextRuntimeUtils.
     """
 
+    # the number of messages already shown by ctx_history, and the last one of them
+    _printed_upto = 0
+    _printed_last = None
+
     @property
     def instructions(self) -> dict:
         """
@@ -104,7 +109,7 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
             print("Context already is clear")
         return
 
-    def ctx_story(self):
+    def ctx_story(self, mode:str=""):
         """
         Save context messages to a new story.
 
@@ -112,16 +117,50 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
         subprocess agent. Only executes if there are existing
         messages in the session.
 
+        The subprocess is launched from a background thread, so dumping
+        a long session does not block the prompt.
+
+        Args:
+            mode (str, optional): "wait" to launch the subprocess in the
+                foreground and show its pid.
+
         Returns:
             None
         """
         if not self.messages:
             return
-        pid = subprocess_agent_memory_as_story(self.messages)
-        print(f"The history messages will be save to a new story, pid=[{pid}], msg_len=[{len(self.messages)}]")
+
+        # snapshot, the context may change while the thread is running
+        messages = list(self.messages)
+
+        if mode == "wait":
+            pid = subprocess_agent_memory_as_story(messages)
+            print(f"The history messages will be save to a new story, pid=[{pid}], msg_len=[{len(messages)}]")
+            return
+
+        threading.Thread(
+            target=subprocess_agent_memory_as_story,
+            args=(messages,),
+            name="ctx_story",
+            daemon=False,
+        ).start()
+        print(f"The history messages will be save to a new story, msg_len=[{len(messages)}]")
+        return
+
+    def _mark_printed(self):
+        """ remember how many messages have been shown """
+        self._printed_upto = len(self.messages)
+        self._printed_last = self.messages[-1] if self.messages else None
         return
 
-    def ctx_history(self, offset:str=""):
+    def _is_printed_prefix(self) -> bool:
+        """ check the shown messages are still the head of the context """
+        upto = self._printed_upto
+        if upto <= 0 or upto > len(self.messages):
+            return False
+        return self.messages[upto - 1] == self._printed_last
+
+    def ctx_history(self, offset:str="", only_new:bool=False):
         """
         Display the history of messages for the current session.
 
@@ -133,7 +172,11 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
             offset (str, optional): Offset specification for message range.
                 - Usage 1: Single number, e.g., "7" displays 7:-7
                 - Usage 2: Range format "head_num:tail_num", e.g., "5:-3"
+                - Usage 3: "full", displays all messages
                 Defaults to empty string, which displays all messages.
+            only_new (bool, optional): Only display the messages added since
+                the last display. All messages are displayed when the context
+                was changed in other ways, e.g. deleted or summarized.
 
         Returns:
             None
@@ -141,6 +184,16 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
         self.ctx_refresh()
         session_id = self.session_id
 
+        if only_new and self._is_printed_prefix():
+            new_msgs = self.messages[self._printed_upto:]
+            if new_msgs:
+                print_context_messages(new_msgs, start=self._printed_upto)
+            self._mark_printed()
+            return
+
+        if offset == "full":
+            offset = ""
+
         print(f"\n\n{SPLIT_LINE}")
         print(f"Show history messages {session_id}")
         if self.messages:
@@ -161,6 +214,8 @@ class ContextRuntimeInstructions(ContextRuntimeUtils):
             _msgs = self.messages if head_offset is None else self.messages[head_offset:tail_offset]
             print_context_messages(_msgs)
 
+        if not offset:
+            self._mark_printed()
         return
 
     def ctx_history2(self):
@@ -60,6 +60,9 @@ FOLDER_SKILL = FOLDER_ROOT + "/skill"
 # Log
 FOLDER_LOG = FOLDER_ROOT + "/log"
 
+# Cache directory - Stores generated data that can be rebuilt at any time
+FOLDER_CACHE = FOLDER_ROOT + "/cache"
+
 ###################################################################################
 # Layer 3: Subdirectories within the main system directories
 # These provide further organization within each functional area
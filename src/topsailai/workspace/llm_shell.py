@@ -16,6 +16,7 @@ import os
 from topsailai.ai_base.llm_base import LLMModel
 from topsailai.ai_base.llm_control.content_endpoint import ContentStdout
 from topsailai.ai_base.prompt_base import PromptBase
+from topsailai.prompt_hub import prompt_tool
 from topsailai.workspace.project_history import record_project_history
 from topsailai.ai_base.llm_control.base_class import LLMModelBase
 from topsailai.utils.thread_local_tool import (
@@ -175,9 +176,7 @@ def get_llm_chat(
         assert message, "message is null"
 
     # system prompt
-    if not system_prompt:
-        system_prompt = os.getenv("SYSTEM_PROMPT")
-    _, sys_prompt_content = file_tool.get_file_content_fuzzy(system_prompt)
+    sys_prompt_content = prompt_tool.get_system_prompt_content(system_prompt)
     _, more_prompt_content = file_tool.get_file_content_fuzzy(more_prompt)
     if more_prompt_content:
         sys_prompt_content += more_prompt_content
@@ -430,7 +430,7 @@ def _truncate_content(content, max_length):
     return content[:max_length] + "..."
 
 
-def print_context_messages(messages, content_max_length=None):
+def print_context_messages(messages, content_max_length=None, start:int=0):
     """
     Format and print conversation messages for human-readable output
 
@@ -438,8 +438,10 @@ def print_context_messages(messages, content_max_length=None):
         messages: List of message dictionaries containing 'role' and 'content' fields
         content_max_length: Optional maximum number of characters to display
             for each message's content. Does not affect word/token counts.
+        start: Index of the first message in the whole context, used to
+            number a tail of the context, e.g. #start+1.
     """
-    for i, msg in enumerate(messages):
+    for i, msg in enumerate(messages, start):
         # Get role and content, with default values in case fields are missing
         role = msg.get('role', 'unknown')
         content = msg.get('content', '')